@@ -19,7 +19,10 @@ def Document(docx=None):
     Return a |Document| object loaded from *docx*, where *docx* can be
     either a path to a ``.docx`` file (a string) or a file-like object. If
     *docx* is missing or ``None``, the built-in default document "template"
-    is loaded.
+    is loaded. *docx* can also be an `mmap.mmap` object mapping a ``.docx``
+    file, in which case uncompressed members such as images are shared with
+    the mapped file rather than copied; the map must remain open while the
+    document is in use.
     """
     docx = _default_docx_path() if docx is None else docx
     document_part = Package.open(docx).main_document_part
@@ -8,11 +8,19 @@ specialized ones like structured document tags.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import re
+
+from docx.compat import is_string
+from docx.enum.style import WD_STYLE_TYPE
 from docx.oxml.table import CT_Tbl
 from docx.shared import Parented
 from docx.text.paragraph import Paragraph
 
 
+# ---one or more blank (or whitespace-only) lines separate paragraphs---
+_paragraph_break_patt = re.compile(r'(?:\r\n|\r|\n)(?:[ \t]*(?:\r\n|\r|\n))+')
+
+
 class BlockItemContainer(Parented):
     """Base class for proxy objects that can contain block items.
 
@@ -39,6 +47,45 @@ class BlockItemContainer(Parented):
             paragraph.style = style
         return paragraph
 
+    def add_text_block(self, text, style=None):
+        """
+        Return a list of paragraphs newly added to the end of the content in
+        this container, one for each block of *text* separated from the next
+        by one or more blank lines. Each paragraph has paragraph style
+        *style*. A single line break within a block becomes a line break
+        within its paragraph and tab characters become tabs, as for
+        :meth:`add_paragraph`.
+        """
+        blocks = _paragraph_break_patt.split(text.strip('\r\n'))
+        return self.append_many((block, style) for block in blocks)
+
+    def append_many(self, paragraph_specs):
+        """
+        Return a list of paragraphs newly added to the end of the content in
+        this container, one for each item in *paragraph_specs*. Each item is
+        either a text string or a `(text, style)` pair, interpreted as for
+        :meth:`add_paragraph`. *paragraph_specs* can be any iterable,
+        including a generator, and is consumed only once. Each distinct style
+        name is resolved to its style id only once.
+        """
+        paragraphs = []
+        style_ids = {}
+        for spec in paragraph_specs:
+            text, style = (spec, None) if is_string(spec) else spec
+            paragraph = self._add_paragraph()
+            if text:
+                paragraph.add_run(text)
+            if is_string(style):
+                if style not in style_ids:
+                    style_ids[style] = self.part.get_style_id(
+                        style, WD_STYLE_TYPE.PARAGRAPH
+                    )
+                paragraph._p.style = style_ids[style]
+            elif style is not None:
+                paragraph.style = style
+            paragraphs.append(paragraph)
+        return paragraphs
+
     def add_table(self, rows, cols, width):
         """
         Return a table of *width* having *rows* rows and *cols* columns,
@@ -14,7 +14,7 @@ import sys
 
 if sys.version_info >= (3, 0):
 
-    from collections.abc import Sequence
+    from collections.abc import Mapping, Sequence
     from io import BytesIO
 
     def is_string(obj):
@@ -29,7 +29,7 @@ if sys.version_info >= (3, 0):
 
 else:
 
-    from collections import Sequence  # noqa
+    from collections import Mapping, Sequence  # noqa
     from StringIO import StringIO as BytesIO  # noqa
 
     def is_string(obj):
@@ -0,0 +1,483 @@
+# encoding: utf-8
+
+"""Concatenation of several documents into one.
+
+A |Composer| appends the body of each document given to it to the end of a master
+document::
+
+    composer = Composer(Document('cover.docx'))
+    for path in chapter_paths:
+        composer.append(Document(path))
+    composer.document.save('book.docx')
+
+Each appended body is deep-copied and its copy walked once, rewriting as it goes every
+relationship reference (`r:embed`, `r:id` and the like), every style reference
+(`w:pStyle`, `w:rStyle`, `w:tblStyle`) and every list reference (`w:numId`) to the
+corresponding item in the master document. Everything a reference leads to is brought
+over the first time it is seen:
+
+* An image is added through the image parts of the master package, so an image
+  already in the master, or in a document appended earlier, is shared rather than
+  stored again. Other related parts, such as headers and footers, are copied with
+  their own relationships.
+* A style is merged by content: where the master has a style with the same
+  definition, under the same or another id, references are pointed at it; otherwise
+  the style is added, under a fresh id if its own is taken by a different style.
+* A list definition (`w:abstractNum`) is likewise shared with an identical one in the
+  master, and each list instance (`w:num`) gets a new numId.
+
+The composer remembers what it has added and keeps its own counters, so the cost of
+appending a document depends on the size of that document, not on how much has been
+appended before. Footnotes, comments and the section properties at the end of an
+appended body are not carried over; the appended content takes on the master's last
+section. Style references inside copied headers and footers are not rewritten.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import hashlib
+import re
+
+from copy import deepcopy
+from io import BytesIO
+
+from lxml import etree
+
+from docx.image.exceptions import UnrecognizedImageError
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.packuri import PackURI
+from docx.opc.part import PartFactory
+from docx.oxml.ns import nsmap, qn
+from docx.parts.image import ImagePart
+
+
+class Composer(object):
+    """Appends documents to *master*, a |Document| object, which is changed in place.
+
+    A composer keeps indexes of the master's relationships, styles and list
+    definitions, so changes made to the master by other means between calls to
+    :meth:`append` may not be taken into account; make them before composing or
+    after.
+    """
+
+    def __init__(self, master):
+        super(Composer, self).__init__()
+        self._master = master
+        self._part = master.part
+        self._body = master.element.body
+        self._rIds = None
+        self._next_rId_idx = 1
+        self._partnames = None
+        self._styles = None
+        self._numbering = None
+
+    def append(self, doc):
+        """Add the body content of *doc*, a |Document| object, to the master.
+
+        The content goes at the end of the master body, before its final section
+        properties. *doc* itself is not changed.
+        """
+        source = _Source(doc)
+        sectPr_tag = qn('w:sectPr')
+        blocks = [
+            deepcopy(child) for child in doc.element.body if child.tag != sectPr_tag
+        ]
+        for block in blocks:
+            self._rewrite(block, source)
+
+        body = self._body
+        sectPr = body[-1] if len(body) and body[-1].tag == sectPr_tag else None
+        for block in blocks:
+            if sectPr is None:
+                body.append(block)
+            else:
+                sectPr.addprevious(block)
+        self._part.section_map.invalidate()
+        self._part.shape_index.invalidate()
+
+    @property
+    def document(self):
+        """The master |Document| object."""
+        return self._master
+
+    def _copy_part(self, src_part, reltype, source):
+        """Return a copy of *src_part* added to the master package, with its rels."""
+        package = self._part.package
+        head, _, ext = _partname_patt.match(src_part.partname).groups()
+        template = '%s%%d%s' % (head, ext)
+        idx = 1
+        while template % idx in self._master_partnames:
+            idx += 1
+        partname = PackURI(template % idx)
+        self._master_partnames.add(partname)
+
+        part = PartFactory(
+            partname, src_part.content_type, reltype, src_part.blob, package
+        )
+        source.parts[src_part] = part
+        for rel in list(src_part.rels.values()):
+            if rel.is_external:
+                part.load_rel(rel.reltype, rel.target_ref, rel.rId, is_external=True)
+            else:
+                target = self._import_part(rel.target_part, rel.reltype, source)
+                part.load_rel(rel.reltype, target, rel.rId)
+        return part
+
+    def _import_part(self, src_part, reltype, source):
+        """Return the master package part corresponding to *src_part*."""
+        if src_part is source.part:
+            return self._part
+        if src_part.package is self._part.package:
+            return src_part
+        part = source.parts.get(src_part)
+        if part is not None:
+            return part
+        if isinstance(src_part, ImagePart):
+            try:
+                part = self._part.package.get_or_add_image_part(
+                    BytesIO(src_part.blob)
+                )
+            except UnrecognizedImageError:
+                return self._copy_part(src_part, reltype, source)
+            self._master_partnames.add(part.partname)
+            source.parts[src_part] = part
+            return part
+        return self._copy_part(src_part, reltype, source)
+
+    def _import_rId(self, rId, source):
+        """Return rId of the master relationship matching source relationship *rId*.
+
+        Returns |None| when *rId* is not a relationship of the source document.
+        """
+        new_rId = source.rIds.get(rId)
+        if new_rId is not None:
+            return new_rId
+        rel = source.part.rels.get(rId)
+        if rel is None:
+            return None
+        if rel.is_external:
+            target = rel.target_ref
+        else:
+            target = self._import_part(rel.target_part, rel.reltype, source)
+        new_rId = source.rIds[rId] = self._relate_to(
+            target, rel.reltype, rel.is_external
+        )
+        return new_rId
+
+    @property
+    def _master_partnames(self):
+        """Set of the partnames in the master package, kept as parts are added."""
+        if self._partnames is None:
+            self._partnames = set(
+                part.partname for part in self._part.package.iter_parts()
+            )
+        return self._partnames
+
+    @property
+    def _numbering_merger(self):
+        if self._numbering is None:
+            self._numbering = _NumberingMerger(self._part.numbering_part.element)
+        return self._numbering
+
+    def _relate_to(self, target, reltype, is_external):
+        """Return rId of a master relationship to *target*, added if not present.
+
+        Like `Part.relate_to()`, but the existing relationships are indexed once, so
+        each call takes constant time.
+        """
+        rels = self._part.rels
+        if self._rIds is None:
+            self._rIds = dict(
+                ((rel.reltype, _rel_target(rel)), rel.rId) for rel in rels.values()
+            )
+        key = (reltype, target)
+        rId = self._rIds.get(key)
+        if rId is not None and rId in rels:
+            return rId
+        while 'rId%d' % self._next_rId_idx in rels:
+            self._next_rId_idx += 1
+        rId = 'rId%d' % self._next_rId_idx
+        rels.add_relationship(reltype, target, rId, is_external)
+        self._rIds[key] = rId
+        return rId
+
+    def _rewrite(self, block, source):
+        """Point the references in *block*, a copy from *source*, at the master."""
+        r_prefix = '{%s}' % nsmap['r']
+        val = qn('w:val')
+        numId_tag = qn('w:numId')
+        for elm in block.iter(etree.Element):
+            for name, value in elm.attrib.items():
+                if name.startswith(r_prefix):
+                    new_rId = self._import_rId(value, source)
+                    if new_rId is None:
+                        del elm.attrib[name]
+                    else:
+                        elm.set(name, new_rId)
+            tag = elm.tag
+            if tag in _style_ref_tags:
+                elm.set(val, self._import_style(elm.get(val), source))
+            elif tag == numId_tag:
+                elm.set(val, self._import_num(elm.get(val), source))
+
+    def _import_num(self, numId, source):
+        """Return numId in the master for the list instance *numId* of *source*."""
+        if numId is None or numId == '0':
+            return numId
+        new_numId = source.numIds.get(numId)
+        if new_numId is not None:
+            return new_numId
+        num = source.nums.get(numId)
+        if num is None:
+            return numId
+        abstractNumId_elm = num.find(qn('w:abstractNumId'))
+        abstractNumId = abstractNumId_elm.get(qn('w:val'))
+        new_abstractNumId = source.abstractNumIds.get(abstractNumId)
+        if new_abstractNumId is None:
+            abstractNum = deepcopy(source.abstractNums[abstractNumId])
+            source.abstractNumIds[abstractNumId] = ''
+            self._rewrite_numbering_styles(abstractNum, source)
+            new_abstractNumId = self._numbering_merger.merge_abstractNum(abstractNum)
+            source.abstractNumIds[abstractNumId] = new_abstractNumId
+        new_numId = source.numIds[numId] = self._numbering_merger.add_num(
+            deepcopy(num), new_abstractNumId
+        )
+        return new_numId
+
+    def _import_style(self, styleId, source):
+        """Return id of the master style matching the style *styleId* of *source*."""
+        if styleId is None:
+            return styleId
+        new_styleId = source.styleIds.get(styleId)
+        if new_styleId is not None:
+            return new_styleId
+        src_style = source.styles.get(styleId)
+        if src_style is None:
+            return styleId
+        # ---provisional mapping, for a style its own dependencies lead back to---
+        source.styleIds[styleId] = styleId
+
+        style = deepcopy(src_style)
+        val = qn('w:val')
+        basedOn = style.find(qn('w:basedOn'))
+        if basedOn is not None:
+            basedOn.set(val, self._import_style(basedOn.get(val), source))
+        for numId in style.iter(qn('w:numId')):
+            numId.set(val, self._import_num(numId.get(val), source))
+
+        new_styleId = source.styleIds[styleId] = self._style_merger.merge(style)
+        if new_styleId is not None:
+            return new_styleId
+
+        # ---style was added; point its next and link at master styles too---
+        new_styleId = source.styleIds[styleId] = style.get(qn('w:styleId'))
+        for tag in ('w:next', 'w:link'):
+            ref = style.find(qn(tag))
+            if ref is not None:
+                ref.set(val, self._import_style(ref.get(val), source))
+        return new_styleId
+
+    def _rewrite_numbering_styles(self, abstractNum, source):
+        val = qn('w:val')
+        for tag in ('w:pStyle', 'w:styleLink', 'w:numStyleLink'):
+            for ref in abstractNum.iter(qn(tag)):
+                ref.set(val, self._import_style(ref.get(val), source))
+
+    @property
+    def _style_merger(self):
+        if self._styles is None:
+            self._styles = _StyleMerger(self._master.styles.element)
+        return self._styles
+
+
+class _NumberingMerger(object):
+    """Adds list definitions to master `w:numbering` element *numbering*.
+
+    Abstract numbering definitions are shared by content.
+    """
+
+    def __init__(self, numbering):
+        super(_NumberingMerger, self).__init__()
+        self._numbering = numbering
+        self._digests = {}
+        abstractNumIds, numIds = [0], [0]
+        self._first_num = self._end = None
+        for child in numbering:
+            if child.tag == qn('w:abstractNum'):
+                abstractNumId = child.get(qn('w:abstractNumId'))
+                abstractNumIds.append(int(abstractNumId))
+                self._digests.setdefault(_abstractNum_digest(child), abstractNumId)
+            elif child.tag == qn('w:num'):
+                numIds.append(int(child.get(qn('w:numId'))))
+                if self._first_num is None:
+                    self._first_num = child
+            elif child.tag == qn('w:numIdMacAtCleanup'):
+                self._end = child
+        self._next_abstractNumId = max(abstractNumIds) + 1
+        self._next_numId = max(numIds) + 1
+
+    def add_num(self, num, abstractNumId):
+        """Return numId of `w:num` element *num*, added referring to *abstractNumId*.
+
+        Any level overrides of *num* are kept.
+        """
+        numId = str(self._next_numId)
+        self._next_numId += 1
+        num.set(qn('w:numId'), numId)
+        num.find(qn('w:abstractNumId')).set(qn('w:val'), abstractNumId)
+        self._insert(num)
+        if self._first_num is None:
+            self._first_num = num
+        return numId
+
+    def merge_abstractNum(self, abstractNum):
+        """Return abstractNumId of master definition the same as *abstractNum*.
+
+        *abstractNum* is added, with a new id, when there is none.
+        """
+        digest = _abstractNum_digest(abstractNum)
+        abstractNumId = self._digests.get(digest)
+        if abstractNumId is not None:
+            return abstractNumId
+        abstractNumId = str(self._next_abstractNumId)
+        self._next_abstractNumId += 1
+        abstractNum.set(qn('w:abstractNumId'), abstractNumId)
+        if self._first_num is not None:
+            self._first_num.addprevious(abstractNum)
+        else:
+            self._insert(abstractNum)
+        self._digests[digest] = abstractNumId
+        return abstractNumId
+
+    def _insert(self, element):
+        if self._end is None:
+            self._numbering.append(element)
+        else:
+            self._end.addprevious(element)
+
+
+class _Source(object):
+    """Per-append lookups into the document being appended, and the ids mapped."""
+
+    def __init__(self, doc):
+        super(_Source, self).__init__()
+        self.part = doc.part
+        self.rIds, self.styleIds, self.numIds, self.abstractNumIds = {}, {}, {}, {}
+        # ---master part for each part of the source copied, or shared, so far---
+        self.parts = {}
+
+        styles = _related_element(self.part, RT.STYLES)
+        self.styles = {} if styles is None else dict(
+            (style.get(qn('w:styleId')), style)
+            for style in styles.iterchildren(qn('w:style'))
+        )
+        numbering = _related_element(self.part, RT.NUMBERING)
+        self.nums, self.abstractNums = {}, {}
+        if numbering is not None:
+            for num in numbering.iterchildren(qn('w:num')):
+                self.nums[num.get(qn('w:numId'))] = num
+            for abstractNum in numbering.iterchildren(qn('w:abstractNum')):
+                self.abstractNums[abstractNum.get(qn('w:abstractNumId'))] = abstractNum
+
+
+class _StyleMerger(object):
+    """Adds styles to master `w:styles` element *styles*, sharing them by content."""
+
+    def __init__(self, styles):
+        super(_StyleMerger, self).__init__()
+        self._styles = styles
+        self._ids = set()
+        self._names = set()
+        self._digests = {}
+        self._id_digests = {}
+        for style in styles.iterchildren(qn('w:style')):
+            styleId = style.get(qn('w:styleId'))
+            digest = _style_digest(style)
+            self._ids.add(styleId)
+            self._names.add(_style_name(style))
+            self._id_digests[styleId] = digest
+            self._digests.setdefault(digest, styleId)
+
+    def merge(self, style):
+        """Return id of master style the same as `w:style` element *style*.
+
+        When there is none, *style* is added, renamed if its id or name is taken,
+        and |None| is returned.
+        """
+        styleId = style.get(qn('w:styleId'))
+        digest = _style_digest(style)
+        if self._id_digests.get(styleId) == digest:
+            return styleId
+        existing_styleId = self._digests.get(digest)
+        if existing_styleId is not None:
+            return existing_styleId
+
+        if styleId in self._ids:
+            idx = 1
+            while '%s%d' % (styleId, idx) in self._ids:
+                idx += 1
+            styleId = '%s%d' % (styleId, idx)
+            style.set(qn('w:styleId'), styleId)
+            name = style.find(qn('w:name'))
+            if name is not None and name.get(qn('w:val')) in self._names:
+                name.set(qn('w:val'), '%s %d' % (name.get(qn('w:val')), idx))
+        # ---the master keeps its own default styles---
+        style.attrib.pop(qn('w:default'), None)
+        self._styles.append(style)
+
+        self._ids.add(styleId)
+        self._names.add(_style_name(style))
+        self._id_digests[styleId] = digest
+        self._digests[digest] = styleId
+        return None
+
+
+def _abstractNum_digest(abstractNum):
+    """Digest of the definition of *abstractNum*, apart from its id and identity."""
+    probe = deepcopy(abstractNum)
+    probe.attrib.pop(qn('w:abstractNumId'), None)
+    for tag in ('w:nsid', 'w:tmpl'):
+        for child in probe.findall(qn(tag)):
+            probe.remove(child)
+    return _digest(probe)
+
+
+def _digest(element):
+    return hashlib.sha1(etree.tostring(element, method='c14n', exclusive=True)).digest()
+
+
+def _rel_target(rel):
+    return rel.target_ref if rel.is_external else rel.target_part
+
+
+def _related_element(part, reltype):
+    """Root element of the part related to *part* by *reltype*, or |None|."""
+    try:
+        return part.part_related_by(reltype).element
+    except KeyError:
+        return None
+
+
+def _style_digest(style):
+    """Digest of the definition of `w:style` element *style*, less its id.
+
+    Its `w:next` and `w:link` references, and revision ids, are left out too, so a
+    style matches whatever styles those refer to.
+    """
+    probe = deepcopy(style)
+    probe.attrib.pop(qn('w:styleId'), None)
+    probe.attrib.pop(qn('w:default'), None)
+    for tag in ('w:next', 'w:link', 'w:rsid'):
+        for child in probe.findall(qn(tag)):
+            probe.remove(child)
+    return _digest(probe)
+
+
+def _style_name(style):
+    name = style.find(qn('w:name'))
+    return None if name is None else name.get(qn('w:val'))
+
+
+_partname_patt = re.compile(r'^(.*?)(\d*)(\.\w+)$')
+
+_style_ref_tags = frozenset((qn('w:pStyle'), qn('w:rStyle'), qn('w:tblStyle')))
@@ -0,0 +1,285 @@
+# encoding: utf-8
+
+"""Structural comparison of two documents.
+
+Each block of a document body is reduced to a digest computed bottom-up, Merkle
+fashion: a paragraph from its paragraph properties and the text of its runs, with
+adjacent runs having the same run properties taken together so that a run split
+invisibly by Word does not count as a change; a table from the digests of its rows,
+a row from the digests of its cells, and a cell from the digests of the blocks it
+contains. Revision-save ids (`w:rsid*` attributes) and proofing marks are ignored.
+
+The two sequences of block digests are aligned with a patience diff, which anchors on
+blocks occurring exactly once in each document, after first matching any common
+prefix and suffix. Only where digests differ does the comparison descend, into the
+rows and cells of a table, so comparing two mostly-unchanged documents costs little
+more than computing their digests::
+
+    for change in compare(old_document, new_document):
+        print(change.kind, change.a_index, change.b_index)
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import hashlib
+
+from bisect import bisect_left
+from collections import namedtuple
+from difflib import SequenceMatcher
+
+from docx.compat import is_string
+from docx.oxml.ns import qn
+
+
+Change = namedtuple('Change', ('kind', 'a_index', 'b_index', 'a', 'b', 'changes'))
+Change.__doc__ = """
+One difference between two documents, as found by :func:`compare`.
+
+`kind` is 'insert', 'delete' or 'modify'. `a` and `b` are the changed elements of the
+first and second document, a `w:p` or `w:tbl` element for a body block, or a `w:tr`
+or `w:tc` element within a table, and `a_index` and `b_index` are their positions in
+their parent; these are |None| on the side where the element does not exist. For a
+modified table, row or cell, `changes` is the list of |Change| objects within it;
+otherwise it is empty."""
+
+
+def compare(doc_a, doc_b):
+    """Return list of |Change| objects turning the body of *doc_a* into that of *doc_b*.
+
+    Unchanged blocks are not reported. Changes are in document order.
+    """
+    hasher = _Hasher()
+    return _diff_children(hasher, doc_a.element.body, doc_b.element.body)
+
+
+class _Hasher(object):
+    """Computes, and remembers, the digest of each element it is asked about."""
+
+    def __init__(self):
+        super(_Hasher, self).__init__()
+        self._digests = {}
+
+    def digest(self, element):
+        """Return the digest of *element* as a byte string."""
+        digest = self._digests.get(element)
+        if digest is None:
+            if element.tag == qn('w:p'):
+                digest = self._paragraph_digest(element)
+            else:
+                digest = self._element_digest(element)
+            self._digests[element] = digest
+        return digest
+
+    def _element_digest(self, element):
+        """Digest of the tag, attributes, text, and child digests of *element*."""
+        sha1 = hashlib.sha1(_tag_and_attributes(element))
+        sha1.update(('\x01%s' % (element.text or '')).encode('utf-8'))
+        for child in _children(element):
+            sha1.update(self.digest(child))
+        return sha1.digest()
+
+    def _paragraph_digest(self, p):
+        """Digest of *p* from its properties and its run text and formatting.
+
+        Adjacent runs having the same run properties contribute as a single run.
+        """
+        sha1 = hashlib.sha1(b'p')
+        pieces = []
+        state = {'rPr': None}
+
+        def flush():
+            if pieces:
+                sha1.update(b'\x02' + (state['rPr'] or b'') + b'\x03')
+                sha1.update(''.join(pieces).encode('utf-8'))
+                del pieces[:]
+
+        def add_run(r):
+            rPr = r.rPr
+            rPr_digest = None if rPr is None else self.digest(rPr)
+            if rPr_digest != state['rPr']:
+                flush()
+                state['rPr'] = rPr_digest
+            for item in _children(r):
+                if item is rPr:
+                    continue
+                text = _run_text(item)
+                if text is None:
+                    flush()
+                    sha1.update(b'\x04' + self.digest(item))
+                else:
+                    pieces.append(text)
+
+        for child in _children(p):
+            if child.tag == qn('w:r'):
+                add_run(child)
+            elif child.tag == qn('w:hyperlink'):
+                flush()
+                sha1.update(b'\x05' + _tag_and_attributes(child))
+                for r in child.iterchildren(qn('w:r')):
+                    add_run(r)
+                flush()
+                sha1.update(b'\x06')
+            else:
+                flush()
+                sha1.update(b'\x04' + self.digest(child))
+        flush()
+        return sha1.digest()
+
+
+def _align(a, b):
+    """Return list of (tag, i1, i2, j1, j2) opcodes like those of |SequenceMatcher|.
+
+    *a* and *b* are sequences of digests. They are aligned with a patience diff,
+    falling back to |SequenceMatcher| only for a stretch with no unique common item.
+    The tag is 'equal' or 'change', the latter standing for any insertion, deletion
+    or replacement.
+    """
+    opcodes = []
+    _patience(a, 0, len(a), b, 0, len(b), opcodes)
+
+    # ---adjacent opcodes of the same kind are merged; 'change' covers any difference---
+    merged = []
+    for tag, i1, i2, j1, j2 in opcodes:
+        if i1 == i2 and j1 == j2:
+            continue
+        tag = 'equal' if tag == 'equal' else 'change'
+        if merged and merged[-1][0] == tag:
+            _, mi1, _, mj1, _ = merged[-1]
+            merged[-1] = (tag, mi1, i2, mj1, j2)
+        else:
+            merged.append((tag, i1, i2, j1, j2))
+    return merged
+
+
+def _children(element):
+    """Generate the child elements of *element* that take part in a comparison."""
+    for child in element:
+        if is_string(child.tag) and child.tag not in _ignored_tags:
+            yield child
+
+
+def _diff_children(hasher, a_parent, b_parent):
+    """Return list of |Change| for the children of *a_parent* and *b_parent*."""
+    a_children = list(_children(a_parent))
+    b_children = list(_children(b_parent))
+    a_digests = [hasher.digest(child) for child in a_children]
+    b_digests = [hasher.digest(child) for child in b_children]
+
+    changes = []
+    for tag, i1, i2, j1, j2 in _align(a_digests, b_digests):
+        if tag == 'equal':
+            continue
+        pairs = min(i2 - i1, j2 - j1)
+        for offset in range(pairs):
+            i, j = i1 + offset, j1 + offset
+            a, b = a_children[i], b_children[j]
+            if a.tag != b.tag:
+                changes.append(Change('delete', i, None, a, None, []))
+                changes.append(Change('insert', None, j, None, b, []))
+                continue
+            nested = _diff_children(hasher, a, b) if a.tag in _containers else []
+            changes.append(Change('modify', i, j, a, b, nested))
+        for i in range(i1 + pairs, i2):
+            changes.append(Change('delete', i, None, a_children[i], None, []))
+        for j in range(j1 + pairs, j2):
+            changes.append(Change('insert', None, j, None, b_children[j], []))
+    return changes
+
+
+def _is_rsid(clark_name):
+    return clark_name.rpartition('}')[2].startswith('rsid')
+
+
+def _longest_increasing(pairs):
+    """Return longest sublist of (i, j) *pairs*, sorted by i, whose j also increases.
+
+    This is the patience-sorting step of a patience diff.
+    """
+    tails, tail_idxs, back = [], [], []
+    for idx, (_, j) in enumerate(pairs):
+        pile = bisect_left(tails, j)
+        if pile == len(tails):
+            tails.append(j)
+            tail_idxs.append(idx)
+        else:
+            tails[pile] = j
+            tail_idxs[pile] = idx
+        back.append(tail_idxs[pile - 1] if pile else None)
+
+    result = []
+    idx = tail_idxs[-1] if tail_idxs else None
+    while idx is not None:
+        result.append(pairs[idx])
+        idx = back[idx]
+    result.reverse()
+    return result
+
+
+def _patience(a, alo, ahi, b, blo, bhi, opcodes):
+    """Append opcodes aligning a[alo:ahi] with b[blo:bhi] to *opcodes*."""
+    start_a, start_b = alo, blo
+    while alo < ahi and blo < bhi and a[alo] == b[blo]:
+        alo += 1
+        blo += 1
+    opcodes.append(('equal', start_a, alo, start_b, blo))
+
+    end_a, end_b = ahi, bhi
+    while ahi > alo and bhi > blo and a[ahi - 1] == b[bhi - 1]:
+        ahi -= 1
+        bhi -= 1
+    suffix = ('equal', ahi, end_a, bhi, end_b)
+
+    if alo == ahi or blo == bhi:
+        opcodes.append(('change', alo, ahi, blo, bhi))
+        opcodes.append(suffix)
+        return
+
+    a_positions, b_positions = {}, {}
+    for i in range(alo, ahi):
+        a_positions.setdefault(a[i], []).append(i)
+    for j in range(blo, bhi):
+        b_positions.setdefault(b[j], []).append(j)
+    anchors = _longest_increasing(sorted(
+        (positions[0], b_positions[digest][0])
+        for digest, positions in a_positions.items()
+        if len(positions) == 1 and len(b_positions.get(digest, ())) == 1
+    ))
+
+    if not anchors:
+        matcher = SequenceMatcher(None, a[alo:ahi], b[blo:bhi], autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            opcodes.append((tag, alo + i1, alo + i2, blo + j1, blo + j2))
+    else:
+        for i, j in anchors:
+            _patience(a, alo, i, b, blo, j, opcodes)
+            opcodes.append(('equal', i, i + 1, j, j + 1))
+            alo, blo = i + 1, j + 1
+        _patience(a, alo, ahi, b, blo, bhi, opcodes)
+    opcodes.append(suffix)
+
+
+def _run_text(item):
+    """Return the text a run content element stands for, or |None| if not text."""
+    if item.tag == qn('w:t'):
+        return item.text or ''
+    if item.tag == qn('w:tab'):
+        return '\t'
+    if item.tag in (qn('w:br'), qn('w:cr')) and not item.attrib:
+        return '\n'
+    return None
+
+
+def _tag_and_attributes(element):
+    """Return bytes identifying the tag and attributes of *element*, less any rsids."""
+    parts = [element.tag]
+    for name, value in sorted(element.attrib.items()):
+        if not _is_rsid(name):
+            parts.append('%s=%s' % (name, value))
+    return '\x00'.join(parts).encode('utf-8')
+
+
+_containers = frozenset((qn('w:tbl'), qn('w:tr'), qn('w:tc')))
+
+_ignored_tags = frozenset((
+    qn('w:proofErr'), qn('w:lastRenderedPageBreak'),
+))
@@ -4,11 +4,15 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from docx import search
 from docx.blkcntnr import BlockItemContainer
 from docx.enum.section import WD_SECTION
 from docx.enum.text import WD_BREAK
+from docx.oxml.ns import qn
 from docx.section import Section, Sections
 from docx.shared import ElementProxy, Emu
+from docx.table import _Cell, Table
+from docx.text.paragraph import Paragraph
 
 
 class Document(ElementProxy):
@@ -55,6 +59,25 @@ class Document(ElementProxy):
         """
         return self._body.add_paragraph(text, style)
 
+    def add_text_block(self, text, style=None):
+        """
+        Return a list of paragraphs newly added to the end of the document,
+        one for each block of *text* separated by one or more blank lines,
+        each having paragraph style *style*. Suitable for loading a large
+        plain-text file in a single call.
+        """
+        return self._body.add_text_block(text, style)
+
+    def append_many(self, paragraph_specs):
+        """
+        Return a list of paragraphs newly added to the end of the document,
+        one for each item in *paragraph_specs*. Each item is either a text
+        string or a `(text, style)` pair, interpreted as for
+        :meth:`add_paragraph`. *paragraph_specs* may be a generator, which is
+        consumed only once.
+        """
+        return self._body.append_many(paragraph_specs)
+
     def add_picture(self, image_path_or_stream, width=None, height=None):
         """
         Return a new picture shape added in its own paragraph at the end of
@@ -80,6 +103,7 @@ class Document(ElementProxy):
         """
         new_sectPr = self._element.body.add_section_break()
         new_sectPr.start_type = start_type
+        self._part.section_map.invalidate()
         return Section(new_sectPr, self._part)
 
     def add_table(self, rows, cols, style=None):
@@ -101,6 +125,72 @@ class Document(ElementProxy):
         """
         return self._part.core_properties
 
+    @property
+    def drawing_shapes(self):
+        """
+        An |InlineShapes| object providing access to both the inline and the
+        floating shapes in the body of this document, in document order.
+        Floating shapes are positioned on the page, independent of the text
+        flow, but are anchored to a paragraph like inline shapes.
+        """
+        return self._part.drawing_shapes
+
+    def effective_font(self, run):
+        """Return dict of the effective font properties of *run*.
+
+        Each font property of *run*, such as `bold` or `size`, is resolved through
+        the style cascade: document defaults, the paragraph style and its base
+        styles, the character style and its base styles, then formatting applied
+        directly to the run. Keys are the names in
+        `docx.styles.resolver.FONT_PROPERTIES`, with `color` holding the RGB
+        color. A property not specified anywhere in the cascade has the value
+        |None|. The style cascade is resolved once per style and cached; call
+        ``document.part.style_resolver.reset()`` after changing styles.
+        """
+        return self._part.style_resolver.effective_font(run._r)
+
+    def effective_paragraph_format(self, paragraph):
+        """Return dict of the effective paragraph format properties of *paragraph*.
+
+        Resolved like :meth:`effective_font`, from document defaults, the paragraph
+        style and its base styles, then formatting applied directly to the
+        paragraph. Keys are the names in
+        `docx.styles.resolver.PARAGRAPH_FORMAT_PROPERTIES`.
+        """
+        return self._part.style_resolver.effective_paragraph_format(paragraph._p)
+
+    def build_index(self):
+        """Return a |TextIndex| of the words in this document.
+
+        The index covers the body, including tables, and the headers and footers.
+        Its :meth:`~.TextIndex.search` method answers a word or phrase query with a
+        few dictionary lookups, so it suits running many queries against a large
+        document. Paragraphs changed by :meth:`replace` and :meth:`replace_many` are
+        updated in the index as they change. A search re-indexes a paragraph it
+        would return whose text has changed since, but it cannot see a new paragraph
+        or a word added by another edit. After other edits call
+        :meth:`~.TextIndex.update` with the changed paragraphs, or
+        :meth:`~.TextIndex.refresh`.
+        """
+        return self._part.build_text_index()
+
+    def find(self, pattern, flags=0):
+        """Return list of (paragraph, match) pairs for *pattern* in the document body.
+
+        *pattern* is a regular expression string or compiled pattern, searched for
+        in the text of each paragraph, including paragraphs in tables. A match can
+        span runs. Each `match` is a regular expression match object whose offsets
+        refer to `match.string`, the text searched. That text includes the text of
+        runs in hyperlinks, which `paragraph.text` leaves out, so the two differ in
+        a paragraph having a hyperlink. A paragraph in a table cell has that cell
+        as its parent.
+        """
+        containers = {}
+        return [
+            (Paragraph(p, self._container_of(p, containers)), match)
+            for p, match in search.find(self._element.body, pattern, flags)
+        ]
+
     @property
     def inline_shapes(self):
         """
@@ -127,12 +217,57 @@ class Document(ElementProxy):
         """
         return self._part
 
-    def save(self, path_or_stream):
+    def replace(self, pattern, repl, flags=0):
+        """Replace each match of *pattern* in the document body with *repl*.
+
+        *pattern* is as for :meth:`find`. *repl* is a string, in which group
+        references such as ``\\1`` are expanded as they are by :func:`re.sub`, or a
+        function taking the match object and returning the replacement string. The
+        replacement takes on the formatting of the run where its match begins and
+        only the run content the match touches is changed. Returns the number of
+        replacements made.
+        """
+        return search.replace(
+            self._element.body, pattern, repl, flags, self._part.text_index
+        )
+
+    def replace_many(self, replacements):
+        """Replace each literal string key of dict *replacements* with its value.
+
+        All keys are matched in a single pass over the document body, however many
+        there are, which suits redaction of a long list of terms. Where two keys
+        match at the same position the longer one wins. Returns the number of
+        replacements made.
+        """
+        return search.replace_many(
+            self._element.body, replacements, self._part.text_index
+        )
+
+    def save(self, path_or_stream, cleanup_namespaces=False, format='zip'):
         """
         Save this document to *path_or_stream*, which can be either a path to
-        a filesystem location (a string) or a file-like object.
+        a filesystem location (a string) or a file-like object. When
+        *cleanup_namespaces* is |True|, redundant XML namespace declarations,
+        such as those repeated on each inserted picture, are removed and
+        hoisted to the root element of each part before it is written,
+        producing smaller and faster-to-parse XML. *format* is ``'zip'`` for
+        a regular .docx package or ``'flat'`` for a Flat OPC package, a single
+        uncompressed XML document holding every part, such as Word saves as a
+        "Word XML Document". A Flat OPC package is opened like any other.
         """
-        self._part.save(path_or_stream)
+        self._part.save(path_or_stream, cleanup_namespaces, format)
+
+    def save_incremental(self, path_or_stream):
+        """
+        Save this document to the existing .docx package at
+        *path_or_stream*, typically the one it was opened from. Only the
+        package members that changed, such as ``word/document.xml``, are
+        recompressed; images and other unchanged members are copied as they
+        are. A package at a path is replaced only once the new copy is
+        complete, so a failed save leaves it as it was. A stream must be
+        opened for both reading and writing.
+        """
+        self._part.save_incremental(path_or_stream)
 
     @property
     def sections(self):
@@ -185,6 +320,22 @@ class Document(ElementProxy):
             self.__body = _Body(self._element.body, self)
         return self.__body
 
+    def _container_of(self, element, containers):
+        """
+        Return the block item container proxy for the nearest `w:tc` ancestor of
+        *element*, or the body when it is not in a table. *containers* is a dict
+        caching the proxies built, so each cell and table gets one.
+        """
+        tc = next(element.iterancestors(qn('w:tc')), None)
+        if tc is None:
+            return self._body
+        if tc not in containers:
+            tbl = next(tc.iterancestors(qn('w:tbl')))
+            if tbl not in containers:
+                containers[tbl] = Table(tbl, self._container_of(tbl, containers))
+            containers[tc] = _Cell(tc, containers[tbl])
+        return containers[tc]
+
 
 class _Body(BlockItemContainer):
     """
@@ -0,0 +1,747 @@
+# encoding: utf-8
+
+"""Export of document content to plain text, Markdown and HTML.
+
+The exporters stream. When given a package, they parse the styles and numbering parts,
+which are small, then read the main document part with an incremental parser,
+converting each top-level block (paragraph or table) of the body as soon as it has been
+parsed and discarding it before reading the next. The parsed tree for a large document
+therefore never exists in full, and output is written to the sink as it is produced::
+
+    with open('contract.md', 'w') as out:
+        to_markdown('contract.docx', out)
+
+Headings are recognized from the outline level of their paragraph style, found through
+a map from style id to outline level computed once from the styles part, following
+`w:basedOn` links. List paragraphs are labeled using the numbering definitions, with
+counters kept per numbering instance, so numbered lists read as they do in Word.
+
+The HTML exporter compiles each paragraph and character style to a CSS class once, up
+front, and writes formatting applied directly to a paragraph or run as an inline style
+only where it differs from what the styles already give.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import hashlib
+import mimetypes
+import os
+import re
+
+from base64 import b64encode
+from xml.sax.saxutils import escape
+
+from lxml import etree
+
+from docx.compat import is_string
+from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_COLOR_INDEX
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.packuri import PACKAGE_URI
+from docx.opc.phys_pkg import PhysPkgReader
+from docx.opc.pkgreader import PackageReader
+from docx.oxml import element_class_lookup, parse_xml
+from docx.oxml.ns import qn
+from docx.outline import _val, _xpath, Outline
+from docx.search import ParagraphText
+from docx.shared import Length
+from docx.styles.resolver import (
+    font_properties,
+    paragraph_format_properties,
+    StyleResolver,
+)
+
+
+def to_html(src, out, image_dir=None):
+    """Write the body of the document *src* to text stream *out* as an HTML page.
+
+    *src* is as for :func:`to_markdown`. Each paragraph and character style becomes
+    a CSS class in the page's style sheet, with base styles resolved, and formatting
+    applied directly to a paragraph or run is written as an inline style only where
+    it differs from what its styles give. Headings become `h1` to `h6` elements and
+    tables keep their merged cells. Images are embedded as data URIs or, when
+    *image_dir* is given, written once each to that directory, named by a digest of
+    their content, and referenced by the path *image_dir*/name, so *image_dir*
+    should be a path relative to where the page will be served from.
+    """
+    _export(src, _HtmlWriter, out, image_dir=image_dir)
+
+
+def to_markdown(src, out):
+    """Write the body of the document *src* to text stream *out* as Markdown.
+
+    *src* is a |Document| object, or the path or file-like object of a .docx package.
+    Headings become `#` headings, list paragraphs become `-` or `1.` list items
+    nested by list level, and tables become pipe tables, the first row taken as the
+    header row. Empty paragraphs are skipped. Run text is written as is, without
+    Markdown escaping or inline formatting.
+    """
+    _export(src, _MarkdownWriter, out)
+
+
+def to_text(src, out):
+    """Write the text of the body of the document *src* to text stream *out*.
+
+    *src* is as for :func:`to_markdown`. Each paragraph is written as a line, a list
+    paragraph indented by its list level and preceded by its number or bullet. Each
+    table row is written as a line having its cell text separated by tabs.
+    """
+    _export(src, _TextWriter, out)
+
+
+def _export(src, writer_cls, out, **options):
+    source = _source(src)
+    try:
+        writer = writer_cls(out, source, **options)
+        writer.open()
+        for block in source.iter_blocks():
+            writer.write_block(block)
+        writer.close()
+    finally:
+        source.close()
+
+
+class _Writer(object):
+    """Base class for a writer of the body blocks of *source* to text stream *out*."""
+
+    def __init__(self, out, source):
+        super(_Writer, self).__init__()
+        self._out = out
+        self._source = source
+        self._outline = Outline(source.styles, source.numbering)
+
+    def close(self):
+        """Write anything still pending once the last block has been written."""
+
+    def open(self):
+        """Write anything needed before the first block."""
+
+    def write_block(self, block):
+        """Write `w:p`, `w:tbl` or `w:sdt` element *block*, ignoring anything else."""
+        if block.tag == qn('w:p'):
+            self._write_paragraph(block)
+        elif block.tag == qn('w:tbl'):
+            self._write_table(block)
+        elif block.tag == qn('w:sdt'):
+            for child in block.iterchildren(qn('w:sdtContent')):
+                for content_block in child:
+                    self.write_block(content_block)
+
+    def _write_paragraph(self, p):
+        raise NotImplementedError('must be implemented by each subclass')
+
+    def _write_table(self, tbl):
+        raise NotImplementedError('must be implemented by each subclass')
+
+
+class _HtmlWriter(_Writer):
+    """Writes body blocks as an HTML page styled by CSS compiled from the styles."""
+
+    def __init__(self, out, source, image_dir=None):
+        super(_HtmlWriter, self).__init__(out, source)
+        self._image_dir = image_dir
+        self._image_names = set()
+        self._resolver = None if source.styles is None else StyleResolver(
+            source.styles
+        )
+        self._classes = {}
+        self._style_paragraph_formats = {}
+        self._run_fonts = {}
+
+    def close(self):
+        self._out.write('</body>\n</html>\n')
+
+    def open(self):
+        self._out.write(
+            '<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n<style>\n'
+        )
+        self._write_style_sheet()
+        self._out.write('</style>\n</head>\n<body>\n')
+
+    def _add_run(self, r, pStyle_id, add):
+        """Pass (key, html) to *add* for each piece of the content of *r*."""
+        rStyle_id = r.style
+        attrs = []
+        css_class = self._classes.get(('character', rStyle_id))
+        if css_class is not None:
+            attrs.append(('class', css_class))
+        inherited = self._inherited_font(pStyle_id, rStyle_id)
+        css = _font_css(dict(
+            (name, value) for name, value in font_properties(r).items()
+            if inherited.get(name) != value
+        ))
+        if css:
+            attrs.append(('style', css))
+        key = tuple(attrs)
+
+        for item in r:
+            if item.tag == qn('w:t'):
+                add(key, escape(item.text or ''))
+            elif item.tag == qn('w:tab'):
+                add(key, '\t')
+            elif item.tag in (qn('w:br'), qn('w:cr')):
+                add(key, '<br>')
+            elif item.tag == qn('w:drawing'):
+                add(key, self._image_html(item))
+
+    def _flush_spans(self, spans):
+        for attrs, pieces in spans:
+            html = ''.join(pieces)
+            if attrs:
+                html = '<span%s>%s</span>' % (_html_attrs(attrs), html)
+            self._out.write(html)
+        del spans[:]
+
+    def _image_file(self, blob, content_type):
+        """Return the src of an image file for *blob*, writing the file if needed."""
+        extension = mimetypes.guess_extension(content_type) or '.bin'
+        name = hashlib.sha1(blob).hexdigest() + extension
+        if name not in self._image_names:
+            if not os.path.isdir(self._image_dir):
+                os.makedirs(self._image_dir)
+            with open(os.path.join(self._image_dir, name), 'wb') as f:
+                f.write(blob)
+            self._image_names.add(name)
+        return '%s/%s' % (self._image_dir.rstrip('/\\'), name)
+
+    def _image_html(self, drawing):
+        """Return `img` element for the picture in `w:drawing` *drawing*, if any."""
+        rIds = _xpath(drawing, './/a:blip/@r:embed')
+        image = self._source.image(rIds[0]) if rIds else None
+        if image is None:
+            return ''
+        blob, content_type = image
+        if self._image_dir is None:
+            src = 'data:%s;base64,%s' % (
+                content_type, b64encode(blob).decode('ascii')
+            )
+        else:
+            src = self._image_file(blob, content_type)
+        attrs = [('src', src)]
+        extents = _xpath(drawing, './*/wp:extent')
+        if extents:
+            attrs.append(('width', '%d' % (int(extents[0].get('cx')) // 9525)))
+            attrs.append(('height', '%d' % (int(extents[0].get('cy')) // 9525)))
+        descrs = _xpath(drawing, './*/wp:docPr/@descr')
+        attrs.append(('alt', descrs[0] if descrs else ''))
+        return '<img%s>' % _html_attrs(attrs)
+
+    def _inherited_font(self, pStyle_id, rStyle_id):
+        """Return dict of the font properties given to a run by its styles."""
+        key = (pStyle_id, rStyle_id)
+        font = self._run_fonts.get(key)
+        if font is None:
+            font = {}
+            if self._resolver is not None:
+                font.update(self._resolver.style_font(pStyle_id))
+                if rStyle_id is not None:
+                    font.update(self._resolver.style_font(rStyle_id))
+            self._run_fonts[key] = font
+        return font
+
+    def _write_content(self, parent, pStyle_id):
+        """Write the runs of *parent*, returning |True| if anything was written.
+
+        Adjacent runs having the same class and inline style are written as a single
+        `span`.
+        """
+        spans = []
+
+        def add(key, html):
+            if spans and spans[-1][0] == key:
+                spans[-1][1].append(html)
+            else:
+                spans.append((key, [html]))
+
+        for child in parent:
+            if child.tag == qn('w:r'):
+                self._add_run(child, pStyle_id, add)
+            elif child.tag == qn('w:hyperlink'):
+                self._flush_spans(spans)
+                href = _safe_href(self._source.link_target(child.get(qn('r:id'))))
+                anchor = child.get(qn('w:anchor'))
+                if href is None and anchor is not None:
+                    href = '#%s' % anchor
+                self._out.write('<a%s>' % _html_attrs(
+                    [] if href is None else [('href', href)]
+                ))
+                self._write_content(child, pStyle_id)
+                self._out.write('</a>')
+            elif child.tag not in (qn('w:pPr'), qn('w:del')):
+                for r in child.iter(qn('w:r')):
+                    self._add_run(r, pStyle_id, add)
+        written = bool(spans)
+        self._flush_spans(spans)
+        return written
+
+    def _write_paragraph(self, p):
+        style_id = self._outline.style_id(p)
+        level = self._outline.heading_level(p)
+        tagname = 'p' if level is None else 'h%d' % min(level, 6)
+
+        attrs = []
+        css_class = self._classes.get(('paragraph', style_id))
+        if css_class is not None:
+            attrs.append(('class', css_class))
+        style_format = self._style_paragraph_formats.get(style_id, {})
+        direct_format = paragraph_format_properties(p)
+        css = _paragraph_css(dict(
+            (name, value) for name, value in direct_format.items()
+            if style_format.get(name) != value
+        ))
+        if css:
+            attrs.append(('style', css))
+        self._out.write('<%s%s>' % (tagname, _html_attrs(attrs)))
+
+        list_item = self._outline.list_item(p)
+        if list_item is not None:
+            self._out.write('<span class="list-label">%s</span> ' % escape(
+                list_item[2]
+            ))
+        if not self._write_content(p, style_id):
+            self._out.write('<br>')
+        self._out.write('</%s>\n' % tagname)
+
+    def _write_style_sheet(self):
+        """Write a CSS rule for the document defaults and for each style."""
+        write = self._out.write
+        styles = self._source.styles
+        default_font, default_format = {}, {}
+        if styles is not None:
+            for rPrDefault in _xpath(styles, './w:docDefaults/w:rPrDefault'):
+                default_font = font_properties(rPrDefault)
+            for pPrDefault in _xpath(styles, './w:docDefaults/w:pPrDefault'):
+                default_format = paragraph_format_properties(pPrDefault)
+        write(_css_rule('body', _font_css(default_font)))
+        write(_css_rule('p, h1, h2, h3, h4, h5, h6', '; '.join(filter(None, (
+            'margin: 0; font-size: inherit; font-weight: inherit; '
+            'white-space: pre-wrap', _paragraph_css(default_format),
+        )))))
+        write(_css_rule(
+            'table', 'border-collapse: collapse'
+        ))
+        write(_css_rule(
+            'td', 'border: 1px solid #999; padding: 0 4pt; vertical-align: top'
+        ))
+        if styles is None:
+            return
+
+        for style in _xpath(styles, './w:style[@w:type="paragraph" or '
+                                    '@w:type="character"]'):
+            style_id, style_type = style.get(qn('w:styleId')), style.get(qn('w:type'))
+            font = self._resolver.style_font(style_id)
+            css = _font_css(font)
+            if style_type == 'paragraph':
+                paragraph_format = self._resolver.style_paragraph_format(style_id)
+                self._style_paragraph_formats[style_id] = paragraph_format
+                css = '; '.join(filter(None, (_paragraph_css(paragraph_format), css)))
+            if not css:
+                continue
+            css_class = '%s-%s' % (style_type[0], _class_name_patt.sub('_', style_id))
+            self._classes[(style_type, style_id)] = css_class
+            write(_css_rule('.%s' % css_class, css))
+
+    def _write_table(self, tbl):
+        self._out.write('<table>\n')
+        for row in _merged_rows(tbl):
+            self._out.write('<tr>')
+            for tc, colspan, rowspan in row:
+                attrs = []
+                if colspan > 1:
+                    attrs.append(('colspan', '%d' % colspan))
+                if rowspan > 1:
+                    attrs.append(('rowspan', '%d' % rowspan))
+                self._out.write('<td%s>' % _html_attrs(attrs))
+                for block in tc:
+                    self.write_block(block)
+                self._out.write('</td>')
+            self._out.write('</tr>\n')
+        self._out.write('</table>\n')
+
+
+class _MarkdownWriter(_Writer):
+    """Writes body blocks as Markdown."""
+
+    def __init__(self, out, source):
+        super(_MarkdownWriter, self).__init__(out, source)
+        self._last_kind = None
+
+    def close(self):
+        if self._last_kind is not None:
+            self._out.write('\n')
+
+    def _start_block(self, kind):
+        """Write the separator needed before a block of *kind* then record it."""
+        if self._last_kind is not None:
+            self._out.write('\n' if kind == self._last_kind == 'list' else '\n\n')
+        self._last_kind = kind
+
+    def _write_paragraph(self, p):
+        text = ParagraphText(p).text
+        list_item = self._outline.list_item(p)
+        if not text.strip():
+            return
+        level = self._outline.heading_level(p)
+        if level is not None:
+            self._start_block('heading')
+            self._out.write('%s %s' % ('#' * min(level, 6), text))
+        elif list_item is not None:
+            ilvl, ordinal, _ = list_item
+            self._start_block('list')
+            marker = '-' if ordinal is None else '%d.' % ordinal
+            self._out.write('%s%s %s' % ('    ' * ilvl, marker, text))
+        else:
+            self._start_block('paragraph')
+            self._out.write(text)
+
+    def _write_table(self, tbl):
+        rows = _table_rows(tbl)
+        header = next(rows, None)
+        if header is None:
+            return
+        self._start_block('table')
+        self._write_row(header)
+        self._out.write('\n|%s' % (' --- |' * len(header)))
+        for row in rows:
+            self._out.write('\n')
+            self._write_row(row)
+
+    def _write_row(self, cells):
+        self._out.write('| %s |' % ' | '.join(
+            cell.replace('|', '\\|').replace('\n', ' ') for cell in cells
+        ))
+
+
+class _TextWriter(_Writer):
+    """Writes body blocks as plain text lines."""
+
+    def _write_paragraph(self, p):
+        text = ParagraphText(p).text
+        list_item = self._outline.list_item(p)
+        if list_item is not None:
+            ilvl, _, label = list_item
+            text = '%s%s %s' % ('  ' * ilvl, label, text)
+        self._out.write(text)
+        self._out.write('\n')
+
+    def _write_table(self, tbl):
+        for row in _table_rows(tbl):
+            self._out.write('\t'.join(cell.replace('\n', ' ') for cell in row))
+            self._out.write('\n')
+
+
+class _DocumentSource(object):
+    """Body blocks, styles and numbering of a loaded |Document| object."""
+
+    def __init__(self, document):
+        super(_DocumentSource, self).__init__()
+        self._document = document
+
+    def close(self):
+        pass
+
+    def image(self, rId):
+        """Return (blob, content_type) of image related by *rId*, |None| if none."""
+        rel = self._document.part.rels.get(rId)
+        if rel is None or rel.is_external:
+            return None
+        return rel.target_part.blob, rel.target_part.content_type
+
+    def iter_blocks(self):
+        return iter(self._document.element.body)
+
+    def link_target(self, rId):
+        """Return the URL of the external target related by *rId*, |None| if none."""
+        rel = self._document.part.rels.get(rId)
+        if rel is None or not rel.is_external:
+            return None
+        return rel.target_ref
+
+    @property
+    def numbering(self):
+        for rel in self._document.part.rels.values():
+            if rel.reltype == RT.NUMBERING and not rel.is_external:
+                return rel.target_part.element
+        return None
+
+    @property
+    def styles(self):
+        return self._document.styles.element
+
+
+class _PackageSource(object):
+    """Body blocks, styles and numbering read directly from a .docx package."""
+
+    def __init__(self, pkg_file):
+        super(_PackageSource, self).__init__()
+        self._phys_reader = PhysPkgReader(pkg_file)
+        self._document_partname = self._related_partname(
+            PACKAGE_URI, RT.OFFICE_DOCUMENT
+        )
+        if self._document_partname is None:
+            self._phys_reader.close()
+            raise ValueError('package has no main document part')
+        self._document_srels = dict(
+            (srel.rId, srel) for srel in PackageReader._srels_for(
+                self._phys_reader, self._document_partname
+            )
+        )
+        self.styles = self._related_element(RT.STYLES)
+        self.numbering = self._related_element(RT.NUMBERING)
+
+    def close(self):
+        self._phys_reader.close()
+
+    def image(self, rId):
+        """Return (blob, content_type) of image related by *rId*, |None| if none."""
+        srel = self._document_srels.get(rId)
+        if srel is None or srel.is_external:
+            return None
+        partname = srel.target_partname
+        content_type = mimetypes.guess_type(partname)[0] or 'application/octet-stream'
+        return self._phys_reader.blob_for(partname), content_type
+
+    def iter_blocks(self):
+        """Generate each top-level block of the body as soon as it has been parsed.
+
+        Each block is discarded once the consumer asks for the next one, and the part
+        is read from the package a chunk at a time, so only a single block is held in
+        memory at a time.
+        """
+        stream = self._phys_reader.open(self._document_partname)
+        try:
+            context = etree.iterparse(
+                stream, events=('start', 'end'), remove_blank_text=True,
+                resolve_entities=False, huge_tree=True,
+            )
+            context.set_element_class_lookup(element_class_lookup)
+            depth = 0
+            for event, element in context:
+                if event == 'start':
+                    depth += 1
+                    continue
+                # ---depth 1 is the w:document element, 2 the w:body, 3 a body block---
+                if depth == 3:
+                    yield element
+                    element.clear()
+                    parent = element.getparent()
+                    while element.getprevious() is not None:
+                        del parent[0]
+                depth -= 1
+        finally:
+            stream.close()
+
+    def link_target(self, rId):
+        """Return the URL of the external target related by *rId*, |None| if none."""
+        srel = self._document_srels.get(rId)
+        if srel is None or not srel.is_external:
+            return None
+        return srel.target_ref
+
+    def _related_element(self, reltype):
+        for srel in self._document_srels.values():
+            if srel.reltype == reltype and not srel.is_external:
+                return parse_xml(self._phys_reader.blob_for(srel.target_partname))
+        return None
+
+    def _related_partname(self, source_uri, reltype):
+        for srel in PackageReader._srels_for(self._phys_reader, source_uri):
+            if srel.reltype == reltype and not srel.is_external:
+                return srel.target_partname
+        return None
+
+
+def _css_length(length):
+    return '%gpt' % round(length.pt, 2)
+
+
+def _css_rule(selector, css):
+    return '%s { %s }\n' % (selector, css) if css else ''
+
+
+def _css_string(value):
+    """Return *value* as a quoted CSS string, safe to write in a `<style>` element.
+
+    Quotes, backslashes, angle brackets and control characters are written as CSS
+    escapes, so the value can neither end the string nor the style element.
+    """
+    return '"%s"' % _css_string_special_patt.sub(
+        lambda match: '\\%x ' % ord(match.group()), value
+    )
+
+
+def _font_css(properties):
+    """Return CSS declarations for dict of font *properties*, |None| values omitted."""
+    get = properties.get
+    declarations = []
+    if get('bold') is not None:
+        declarations.append('font-weight: %s' % ('bold' if get('bold') else 'normal'))
+    if get('italic') is not None:
+        declarations.append(
+            'font-style: %s' % ('italic' if get('italic') else 'normal')
+        )
+    underline, strike = get('underline'), get('strike') or get('double_strike')
+    if underline is not None or strike is not None:
+        lines = [
+            line for line, on in (('underline', underline), ('line-through', strike))
+            if on
+        ]
+        declarations.append('text-decoration: %s' % (' '.join(lines) or 'none'))
+    if get('size') is not None:
+        declarations.append('font-size: %s' % _css_length(get('size')))
+    if get('name') is not None:
+        declarations.append('font-family: %s' % _css_string(get('name')))
+    if get('color') is not None:
+        declarations.append('color: #%s' % str(get('color')))
+    if get('all_caps') is not None:
+        declarations.append(
+            'text-transform: %s' % ('uppercase' if get('all_caps') else 'none')
+        )
+    if get('small_caps') is not None:
+        declarations.append(
+            'font-variant: %s' % ('small-caps' if get('small_caps') else 'normal')
+        )
+    if get('superscript') or get('subscript'):
+        declarations.append('vertical-align: %s; font-size: smaller' % (
+            'super' if get('superscript') else 'sub'
+        ))
+    if get('hidden'):
+        declarations.append('display: none')
+    highlight = _highlight_colors.get(get('highlight_color'))
+    if highlight is not None:
+        declarations.append('background-color: %s' % highlight)
+    return '; '.join(declarations)
+
+
+def _html_attrs(attrs):
+    """Return *attrs*, a sequence of (name, value) pairs, as HTML attribute text."""
+    return ''.join(
+        ' %s="%s"' % (name, escape(value, {'"': '&quot;'})) for name, value in attrs
+    )
+
+
+def _merged_rows(tbl):
+    """Generate list of (tc, colspan, rowspan) for the cells shown in each row of *tbl*.
+
+    A cell continuing a vertical merge is omitted, its row being added to the
+    rowspan of the cell the merge started in.
+    """
+    rows, merge_origins = [], {}
+    for tr in tbl.iterchildren(qn('w:tr')):
+        cells, grid_col = [], 0
+        for tc in tr.iterchildren(qn('w:tc')):
+            span = _val(tc, './w:tcPr/w:gridSpan/@w:val') or 1
+            vMerges = _xpath(tc, './w:tcPr/w:vMerge')
+            vMerge = vMerges[0].get(qn('w:val'), 'continue') if vMerges else None
+            if vMerge == 'continue' and grid_col in merge_origins:
+                merge_origins[grid_col][2] += 1
+            else:
+                cell = [tc, span, 1]
+                cells.append(cell)
+                if vMerge == 'restart':
+                    merge_origins[grid_col] = cell
+                else:
+                    merge_origins.pop(grid_col, None)
+            grid_col += span
+        rows.append(cells)
+    for cells in rows:
+        yield [tuple(cell) for cell in cells]
+
+
+def _paragraph_css(properties):
+    """Return CSS declarations for dict of paragraph format *properties*."""
+    get = properties.get
+    declarations = []
+    alignment = get('alignment')
+    if alignment is not None:
+        declarations.append(
+            'text-align: %s' % _text_aligns.get(alignment, 'justify')
+        )
+    for name, css_property in (
+        ('left_indent', 'margin-left'), ('right_indent', 'margin-right'),
+        ('first_line_indent', 'text-indent'), ('space_before', 'margin-top'),
+        ('space_after', 'margin-bottom'),
+    ):
+        if get(name) is not None:
+            declarations.append('%s: %s' % (css_property, _css_length(get(name))))
+    line_spacing = get('line_spacing')
+    if isinstance(line_spacing, Length):
+        declarations.append('line-height: %s' % _css_length(line_spacing))
+    elif line_spacing is not None:
+        declarations.append('line-height: %g' % line_spacing)
+    if get('page_break_before'):
+        declarations.append('page-break-before: always')
+    return '; '.join(declarations)
+
+
+def _safe_href(url):
+    """Return *url* when it is safe as the `href` of a link, otherwise |None|.
+
+    A document can give a hyperlink any target, so only a URL with scheme `http`,
+    `https` or `mailto`, or a relative URL or fragment, is used; a `javascript:` or
+    `data:` URL, for example, would let a document run script in the page. Browsers
+    ignore whitespace and control characters in a scheme, so they are ignored here.
+    """
+    if url is None:
+        return None
+    scheme = _url_scheme_patt.match(_url_ignored_patt.sub('', url))
+    if scheme is not None and scheme.group(1).lower() not in _safe_url_schemes:
+        return None
+    return url
+
+
+def _source(src):
+    """Return a block source for *src*, a |Document| object or a package."""
+    if is_string(src) or hasattr(src, 'read'):
+        return _PackageSource(src)
+    return _DocumentSource(src)
+
+
+def _table_rows(tbl):
+    """Generate a list of cell text for each row of *tbl*.
+
+    A cell spanning several grid columns is followed by an empty string for each
+    extra column it spans, and a cell continuing a vertical merge is empty, so each
+    row has an entry for each grid column. The paragraphs of a cell, including those
+    in a nested table, are joined with a space.
+    """
+    for tr in tbl.iterchildren(qn('w:tr')):
+        cells = []
+        for tc in tr.iterchildren(qn('w:tc')):
+            vMerge = _xpath(tc, './w:tcPr/w:vMerge')
+            if vMerge and vMerge[0].get(qn('w:val')) in (None, 'continue'):
+                text = ''
+            else:
+                text = ' '.join(
+                    text for text in (
+                        ParagraphText(p).text for p in tc.iter(qn('w:p'))
+                    ) if text
+                )
+            cells.append(text)
+            span = _val(tc, './w:tcPr/w:gridSpan/@w:val') or 1
+            cells.extend([''] * (span - 1))
+        yield cells
+
+
+_class_name_patt = re.compile(r'[^A-Za-z0-9_-]')
+_css_string_special_patt = re.compile(r'["\\<>\x00-\x1f\x7f]')
+
+_highlight_colors = {
+    WD_COLOR_INDEX.BLACK: 'black', WD_COLOR_INDEX.BLUE: 'blue',
+    WD_COLOR_INDEX.BRIGHT_GREEN: 'lime', WD_COLOR_INDEX.DARK_BLUE: 'navy',
+    WD_COLOR_INDEX.DARK_RED: 'maroon', WD_COLOR_INDEX.DARK_YELLOW: 'olive',
+    WD_COLOR_INDEX.GRAY_25: 'silver', WD_COLOR_INDEX.GRAY_50: 'gray',
+    WD_COLOR_INDEX.GREEN: 'green', WD_COLOR_INDEX.PINK: 'fuchsia',
+    WD_COLOR_INDEX.RED: 'red', WD_COLOR_INDEX.TEAL: 'teal',
+    WD_COLOR_INDEX.TURQUOISE: 'aqua', WD_COLOR_INDEX.VIOLET: 'purple',
+    WD_COLOR_INDEX.WHITE: 'white', WD_COLOR_INDEX.YELLOW: 'yellow',
+}
+
+_text_aligns = {
+    WD_ALIGN_PARAGRAPH.LEFT: 'left', WD_ALIGN_PARAGRAPH.CENTER: 'center',
+    WD_ALIGN_PARAGRAPH.RIGHT: 'right',
+}
+
+
+_safe_url_schemes = ('http', 'https', 'mailto')
+_url_ignored_patt = re.compile(r'[\x00-\x20\x7f]')
+_url_scheme_patt = re.compile(r'([A-Za-z][A-Za-z0-9+.-]*):')
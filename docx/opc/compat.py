@@ -8,6 +8,7 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+import os
 import sys
 
 # ===========================================================================
@@ -29,6 +30,13 @@ if sys.version_info >= (3, 0):
         """
         return isinstance(obj, str)
 
+    def replace_file(src, dst):
+        """
+        Rename the file at path *src* to *dst*, replacing any file at *dst*
+        atomically.
+        """
+        os.replace(src, dst)
+
 # ===========================================================================
 # Python 2 versions
 # ===========================================================================
@@ -48,3 +56,12 @@ else:
         Return True if *obj* is a string, False otherwise.
         """
         return isinstance(obj, basestring)
+
+    def replace_file(src, dst):
+        """
+        Rename the file at path *src* to *dst*, replacing any file at *dst*,
+        atomically where the platform allows it.
+        """
+        if os.name == 'nt' and os.path.exists(dst):
+            os.remove(dst)
+        os.rename(src, dst)
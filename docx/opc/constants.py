@@ -352,6 +352,9 @@ class NAMESPACE(object):
     OPC_CONTENT_TYPES = (
         'http://schemas.openxmlformats.org/package/2006/content-types'
     )
+    OPC_FLAT_PACKAGE = (
+        'http://schemas.microsoft.com/office/2006/xmlPackage'
+    )
     WML_MAIN = (
         'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
     )
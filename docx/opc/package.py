@@ -162,14 +162,34 @@ class OpcPackage(object):
         """
         return Relationships(PACKAGE_URI.baseURI)
 
-    def save(self, pkg_file):
+    def save(self, pkg_file, cleanup_namespaces=False, format='zip'):
         """
         Save this package to *pkg_file*, where *file* can be either a path to
-        a file (a string) or a file-like object.
+        a file (a string) or a file-like object. When *cleanup_namespaces* is
+        |True|, each XML part is written without redundant namespace
+        declarations; the XML of the parts in memory is not changed. *format*
+        is ``'zip'`` or ``'flat'``, for a Flat OPC package.
         """
         for part in self.parts:
             part.before_marshal()
-        PackageWriter.write(pkg_file, self.rels, self.parts)
+        PackageWriter.write(
+            pkg_file, self.rels, self.parts, format, cleanup_namespaces
+        )
+
+    def save_incremental(self, pkg_file):
+        """
+        Save this package to the existing package *pkg_file*, rewriting only
+        the members whose content differs from what is already there.
+        *pkg_file* can be a path or a file-like object opened for both
+        reading and writing. Unchanged members, such as images, are copied as
+        they are rather than recompressed. The package is written to a copy
+        that replaces it only once complete, so a failed save leaves it as it
+        was.
+        """
+        parts = self.parts
+        for part in parts:
+            part.before_marshal()
+        PackageWriter.update(pkg_file, self.rels, parts)
 
     @property
     def _core_properties_part(self):
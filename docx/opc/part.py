@@ -8,9 +8,11 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from copy import deepcopy
+
 from .compat import cls_method_fn
 from .oxml import serialize_part_xml
-from ..oxml import parse_xml
+from ..oxml import cleanup_namespaces, parse_xml
 from .packuri import PackURI
 from .rel import Relationships
 from .shared import lazyproperty
@@ -219,6 +221,17 @@ class XmlPart(Part):
     def blob(self):
         return serialize_part_xml(self._element)
 
+    @property
+    def clean_blob(self):
+        """
+        The blob of this part with redundant namespace declarations removed,
+        each namespace declared once on the root element where possible. A
+        copy of the XML is cleaned; the XML of this part is left as it is.
+        """
+        element = deepcopy(self._element)
+        cleanup_namespaces(element)
+        return serialize_part_xml(element)
+
     @property
     def element(self):
         """
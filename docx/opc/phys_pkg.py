@@ -6,30 +6,70 @@ Provides a general interface to a *physical* OPC package, such as a zip file.
 
 from __future__ import absolute_import
 
+import mmap
 import os
+import re
+import shutil
+import struct
+import tempfile
+import time
+import zlib
 
-from zipfile import ZipFile, is_zipfile, ZIP_DEFLATED
+from base64 import b64decode, b64encode
+from copy import deepcopy
+from io import BytesIO
+from xml.sax.saxutils import quoteattr
+from zipfile import BadZipfile, ZipFile, is_zipfile, ZIP_DEFLATED, ZIP_STORED
 
-from .compat import is_string
+from lxml import etree
+
+from .compat import is_string, replace_file
 from .exceptions import PackageNotFoundError
+from .oxml import CT_Types, nsmap, parse_xml, qn, serialize_part_xml
 from .packuri import CONTENT_TYPES_URI
 
+# ---XML declaration, if any, of an XML blob encoded as UTF-8---
+_utf8_xml_head = re.compile(br'(?:\xef\xbb\xbf)?\s*(<\?xml\s[^>]*\?>)?\s*(?=<)')
+_declared_encoding = re.compile(br'encoding=["\']([\w.-]+)["\']')
+
+# ---zip file records, as laid out in the zip file format specification---
+_local_header = struct.Struct('<4s5H3L2H')
+_central_header = struct.Struct('<4s4B4H3L5H2L')
+_zip64_end = struct.Struct('<4sQ2H2L4Q')
+_zip64_locator = struct.Struct('<4sLQL')
+_end_of_central_dir = struct.Struct('<4s4H2LH')
+# ---largest size or offset a zip record holds without a zip64 extra field, and
+# ---the value it holds instead of a larger one, given in the extra field---
+_ZIP32_MAX = 0xFFFFFFFE
+_ZIP64_MARK = 0xFFFFFFFF
+_COPY_CHUNK_SIZE = 1024 * 1024
+
 
 class PhysPkgReader(object):
     """
     Factory for physical package reader objects.
     """
     def __new__(cls, pkg_file):
+        # a reader class constructed directly is used as is
+        if cls is not PhysPkgReader:
+            return super(PhysPkgReader, cls).__new__(cls)
+        # a memory-mapped file gets a reader that can share its pages
+        if isinstance(pkg_file, mmap.mmap):
+            reader_cls = _MmapZipPkgReader
         # if *pkg_file* is a string, treat it as a path
-        if is_string(pkg_file):
+        elif is_string(pkg_file):
             if os.path.isdir(pkg_file):
                 reader_cls = _DirPkgReader
             elif is_zipfile(pkg_file):
                 reader_cls = _ZipPkgReader
+            elif os.path.isfile(pkg_file) and _is_flat_pkg(pkg_file):
+                reader_cls = _FlatPkgReader
             else:
                 raise PackageNotFoundError(
                     "Package not found at '%s'" % pkg_file
                 )
+        elif _is_flat_pkg(pkg_file):
+            reader_cls = _FlatPkgReader
         else:  # assume it's a stream and pass it to Zip reader to sort out
             reader_cls = _ZipPkgReader
 
@@ -38,10 +78,34 @@ class PhysPkgReader(object):
 
 class PhysPkgWriter(object):
     """
-    Factory for physical package writer objects.
+    Factory for physical package writer objects. *format* is ``'zip'`` for
+    a zip package, like a .docx file, or ``'flat'`` for a Flat OPC package,
+    a single XML document.
+    """
+    def __new__(cls, pkg_file, format='zip'):
+        if format == 'zip':
+            writer_cls = _ZipPkgWriter
+        elif format == 'flat':
+            writer_cls = _FlatPkgWriter
+        else:
+            raise ValueError("unsupported package format '%s'" % format)
+        return super(PhysPkgWriter, cls).__new__(writer_cls)
+
+
+class PhysPkgUpdater(object):
+    """
+    Factory for physical package updater objects, which update an existing
+    package, copying its unchanged members as they are, rather than writing a
+    new one.
     """
     def __new__(cls, pkg_file):
-        return super(PhysPkgWriter, cls).__new__(_ZipPkgWriter)
+        # if *pkg_file* is a string, it must be a zip package if it exists
+        if is_string(pkg_file):
+            if os.path.exists(pkg_file) and not is_zipfile(pkg_file):
+                raise PackageNotFoundError(
+                    "Package not found at '%s'" % pkg_file
+                )
+        return super(PhysPkgUpdater, cls).__new__(_ZipPkgUpdater)
 
 
 class _DirPkgReader(PhysPkgReader):
@@ -66,6 +130,13 @@ class _DirPkgReader(PhysPkgReader):
             blob = f.read()
         return blob
 
+    def open(self, pack_uri):
+        """
+        Return a readable file-like object for the file corresponding to
+        *pack_uri*, for reading a part too large to hold in memory.
+        """
+        return open(os.path.join(self._path, pack_uri.membername), 'rb')
+
     def close(self):
         """
         Provides interface consistency with |ZipFileSystem|, but does
@@ -92,6 +163,68 @@ class _DirPkgReader(PhysPkgReader):
         return rels_xml
 
 
+class _FlatPkgReader(PhysPkgReader):
+    """
+    Implements |PhysPkgReader| interface for a Flat OPC package, a single XML
+    document having a `pkg:part` element for each part, such as Word saves
+    as a "Word XML Document". The document is parsed incrementally, each
+    part being turned into its blob and discarded as soon as it is read.
+    """
+    def __init__(self, pkg_file):
+        super(_FlatPkgReader, self).__init__()
+        self._blobs = {}
+        self._content_types = {}
+        name, content_type = qn('pkg:name'), qn('pkg:contentType')
+        parts = etree.iterparse(
+            pkg_file, tag=qn('pkg:part'), huge_tree=True, resolve_entities=False
+        )
+        for _, part in parts:
+            partname = part.get(name)
+            self._content_types[partname] = part.get(content_type)
+            self._blobs[partname] = _flat_part_blob(part)
+            part.clear()
+            while part.getprevious() is not None:
+                del part.getparent()[0]
+
+    def blob_for(self, pack_uri):
+        """
+        Return blob corresponding to *pack_uri*. Raises |KeyError| if no
+        matching part is present in the package.
+        """
+        return self._blobs[pack_uri]
+
+    def close(self):
+        """
+        Provides interface consistency; the package has been read in full.
+        """
+        pass
+
+    def open(self, pack_uri):
+        """
+        Return a readable file-like object for the blob corresponding to
+        *pack_uri*, which is already in memory.
+        """
+        return BytesIO(self.blob_for(pack_uri))
+
+    @property
+    def content_types_xml(self):
+        """
+        Return a `[Content_Types].xml` blob giving the content type of each
+        part, which a Flat OPC package records on the part itself.
+        """
+        types = CT_Types.new()
+        for partname, content_type in sorted(self._content_types.items()):
+            types.add_override(partname, content_type)
+        return serialize_part_xml(types)
+
+    def rels_xml_for(self, source_uri):
+        """
+        Return rels item XML for source with *source_uri* or None if no rels
+        item is present.
+        """
+        return self._blobs.get(source_uri.rels_uri)
+
+
 class _ZipPkgReader(PhysPkgReader):
     """
     Implements |PhysPkgReader| interface for a zip file OPC package.
@@ -120,6 +253,13 @@ class _ZipPkgReader(PhysPkgReader):
         """
         return self.blob_for(CONTENT_TYPES_URI)
 
+    def open(self, pack_uri):
+        """
+        Return a readable file-like object for the member corresponding to
+        *pack_uri*, for reading a part too large to hold in memory.
+        """
+        return self._zipf.open(pack_uri.membername)
+
     def rels_xml_for(self, source_uri):
         """
         Return rels item XML for source with *source_uri* or None if no rels
@@ -132,13 +272,165 @@ class _ZipPkgReader(PhysPkgReader):
         return rels_xml
 
 
+class _MmapZipPkgReader(_ZipPkgReader):
+    """
+    Implements |PhysPkgReader| interface for a zip file OPC package that has
+    been memory-mapped by the caller.
+
+    The blob for a stored (uncompressed) member is a read-only `memoryview`
+    onto the mapped file rather than a copy, so processes mapping the same
+    file share those pages through the OS page cache. A deflated member is
+    inflated directly from the mapped bytes into a blob of its final size.
+    Either way the CRC-32 of the blob is checked, as the zip module does, so
+    a corrupt member raises |BadZipfile|; for a stored member this reads its
+    pages once without copying them. The caller owns the `mmap` object and
+    must keep it open for as long as the document it was loaded into is in
+    use.
+    """
+
+    # ---local file header: signature through extra-field length, 30 bytes---
+    _local_header_size = 30
+    _local_header_name_lengths_offset = 26
+
+    def __init__(self, pkg_mmap):
+        super(_MmapZipPkgReader, self).__init__(pkg_mmap)
+        self._mmap = pkg_mmap
+
+    def blob_for(self, pack_uri):
+        """
+        Return blob corresponding to *pack_uri*. Raises |KeyError| if no
+        matching member is present in zip archive, and |BadZipfile| if the
+        member is corrupt.
+        """
+        zinfo = self._zipf.getinfo(pack_uri.membername)
+        # ---encrypted members get no special treatment---
+        if zinfo.flag_bits & 0x1:
+            return self._zipf.read(zinfo)
+        start = self._data_offset(zinfo)
+        data = memoryview(self._mmap)[start:start + zinfo.compress_size]
+        if zinfo.compress_type == ZIP_STORED:
+            blob = data
+        elif zinfo.compress_type == ZIP_DEFLATED:
+            try:
+                blob = zlib.decompress(
+                    data, -zlib.MAX_WBITS, max(zinfo.file_size, 1)
+                )
+            except zlib.error as e:
+                raise BadZipfile('Bad compressed data for file %r: %s' % (
+                    zinfo.filename, e
+                ))
+        else:
+            return self._zipf.read(zinfo)
+        if zlib.crc32(blob) & 0xFFFFFFFF != zinfo.CRC:
+            raise BadZipfile('Bad CRC-32 for file %r' % zinfo.filename)
+        return blob
+
+    def _data_offset(self, zinfo):
+        """
+        Return the offset in the mapped file of the first byte of member data
+        for *zinfo*. The local header is read because its filename and extra
+        field lengths can differ from those in the central directory.
+        """
+        offset = zinfo.header_offset + self._local_header_name_lengths_offset
+        name_len, extra_len = struct.unpack('<HH', self._mmap[offset:offset + 4])
+        return (
+            zinfo.header_offset + self._local_header_size + name_len + extra_len
+        )
+
+
+class _FlatPkgWriter(PhysPkgWriter):
+    """
+    Implements |PhysPkgWriter| interface for a Flat OPC package, a single XML
+    document having a `pkg:part` element for each part. XML parts are written
+    as they are and binary parts base64-encoded. The content types stream is
+    not written as a part; it gives the content type of each part written
+    after it.
+    """
+    def __init__(self, pkg_file, format='flat'):
+        super(_FlatPkgWriter, self).__init__()
+        self._owns_file = is_string(pkg_file)
+        self._file = open(pkg_file, 'wb') if self._owns_file else pkg_file
+        self._defaults = {}
+        self._overrides = {}
+        self._file.write((
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<?mso-application progid="Word.Document"?>\n'
+            '<pkg:package xmlns:pkg="%s">' % nsmap['pkg']
+        ).encode('utf-8'))
+
+    def abort(self):
+        """
+        Stop writing, leaving the package document unfinished. A package
+        being written to a path is removed.
+        """
+        if self._owns_file:
+            self._file.close()
+            os.remove(self._file.name)
+
+    def close(self):
+        """
+        Write the end of the package document, closing the file if this
+        writer opened it.
+        """
+        self._file.write(b'</pkg:package>')
+        if self._owns_file:
+            self._file.close()
+
+    def write(self, pack_uri, blob):
+        """
+        Write *blob* to this package as the part named *pack_uri*.
+        """
+        if pack_uri == CONTENT_TYPES_URI:
+            types = parse_xml(blob)
+            self._defaults = dict(
+                (d.extension.lower(), d.content_type) for d in types.defaults
+            )
+            self._overrides = dict(
+                (o.partname.lower(), o.content_type) for o in types.overrides
+            )
+            return
+
+        # ---`PackURI.ext` of '/_rels/.rels' is empty, so the extension is taken here---
+        ext = pack_uri.rpartition('.')[2].lower()
+        content_type = self._overrides.get(pack_uri.lower()) or self._defaults.get(
+            ext, 'application/octet-stream'
+        )
+        start_tag = '<pkg:part pkg:name=%s pkg:contentType=%s' % (
+            quoteattr(pack_uri), quoteattr(content_type)
+        )
+        if content_type.endswith('xml'):
+            start_tag += '><pkg:xmlData>'
+            content, end_tag = _xml_content(blob), '</pkg:xmlData></pkg:part>'
+        else:
+            start_tag += ' pkg:compression="store"><pkg:binaryData>'
+            content, end_tag = b64encode(blob), '</pkg:binaryData></pkg:part>'
+        self._file.write(start_tag.encode('utf-8'))
+        self._file.write(content)
+        self._file.write(end_tag.encode('utf-8'))
+
+
 class _ZipPkgWriter(PhysPkgWriter):
     """
     Implements |PhysPkgWriter| interface for a zip file OPC package.
     """
-    def __init__(self, pkg_file):
+    def __init__(self, pkg_file, format='zip'):
         super(_ZipPkgWriter, self).__init__()
-        self._zipf = ZipFile(pkg_file, 'w', compression=ZIP_DEFLATED)
+        self._owns_file = is_string(pkg_file)
+        self._file = _AbortableFile(
+            open(pkg_file, 'wb') if self._owns_file else pkg_file
+        )
+        self._zipf = ZipFile(self._file, 'w', compression=ZIP_DEFLATED)
+
+    def abort(self):
+        """
+        Stop writing, leaving the zip archive without a central directory, so
+        it is not mistaken for a complete package. A package being written to
+        a path is removed.
+        """
+        self._file.abort()
+        if self._owns_file:
+            self._file.close()
+            os.remove(self._file.name)
 
     def close(self):
         """
@@ -146,6 +438,17 @@ class _ZipPkgWriter(PhysPkgWriter):
         releasing any resources it's using.
         """
         self._zipf.close()
+        if self._owns_file:
+            self._file.close()
+
+    def open(self, pack_uri):
+        """
+        Return a writable file-like object for the member corresponding to
+        *pack_uri*, for writing a part too large to hold in memory. The
+        stream must be closed before anything else is written to this
+        package.
+        """
+        return _open_member(self._zipf, pack_uri.membername)
 
     def write(self, pack_uri, blob):
         """
@@ -153,3 +456,437 @@ class _ZipPkgWriter(PhysPkgWriter):
         *pack_uri*.
         """
         self._zipf.writestr(pack_uri.membername, blob)
+
+
+class _AbortableFile(object):
+    """
+    Wraps writable *file* for a |ZipFile|, so writing can be abandoned. Once
+    :meth:`abort` is called, nothing more is written to *file*, not even the
+    central directory the zip file writes when it is closed or collected.
+    """
+    def __init__(self, file):
+        super(_AbortableFile, self).__init__()
+        self._file = file
+        # ---position the zip file is given once aborted, None until then---
+        self._position = None
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)
+
+    def abort(self):
+        self._position = self._file.tell()
+
+    def flush(self):
+        if self._position is None:
+            self._file.flush()
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if self._position is None:
+            return self._file.seek(offset, whence)
+        self._position = offset if whence == os.SEEK_SET else self._position + offset
+        return self._position
+
+    def tell(self):
+        return self._file.tell() if self._position is None else self._position
+
+    def write(self, data):
+        if self._position is None:
+            return self._file.write(data)
+        self._position += len(data)
+        return len(data)
+
+
+class _SpooledZipMember(object):
+    """
+    Writable stream for member *membername* of *zipf*, collecting its content
+    in a temporary file that is added to the archive on :meth:`close`.
+    """
+    def __init__(self, zipf, membername):
+        super(_SpooledZipMember, self).__init__()
+        self._zipf = zipf
+        self._membername = membername
+        self._file = tempfile.NamedTemporaryFile(delete=False)
+
+    def close(self):
+        if self._file.closed:
+            return
+        self._file.close()
+        try:
+            self._zipf.write(self._file.name, self._membername)
+        finally:
+            os.remove(self._file.name)
+
+    def write(self, data):
+        self._file.write(data)
+
+
+class _ZipPkgUpdater(PhysPkgUpdater):
+    """
+    Implements |PhysPkgWriter| interface by writing an updated copy of an
+    existing zip file OPC package.
+
+    The copy is written to a temporary file beside *pkg_file* and takes its
+    place only on :meth:`close`, by an atomic rename, so a failure or crash
+    before then leaves the original package as it was; :meth:`abort` discards
+    the copy. A member written with the blob it already has (same size and
+    CRC-32), and a member kept by :meth:`keep_unwritten`, is copied as it is,
+    compressed stream and all, so an update costs about one copy of the file
+    rather than recompressing it. Any member not written before :meth:`close`
+    is left out. When *pkg_file* is a stream, the copy is written back over
+    its content on :meth:`close`.
+    """
+    def __init__(self, pkg_file):
+        super(_ZipPkgUpdater, self).__init__()
+        self._pkg_file = pkg_file
+        self._is_path = is_string(pkg_file)
+        if self._is_path and not os.path.exists(pkg_file):
+            self._source, self._source_file, self._source_infos = None, None, {}
+        else:
+            self._source = ZipFile(pkg_file, 'r')
+            self._source_file = open(pkg_file, 'rb') if self._is_path else pkg_file
+            self._source_infos = dict(
+                (zinfo.filename, zinfo) for zinfo in self._source.infolist()
+            )
+        self._unwritten = sorted(
+            self._source_infos, key=lambda name: self._source_infos[name].header_offset
+        )
+        if self._is_path:
+            pkg_dir, pkg_name = os.path.split(os.path.abspath(pkg_file))
+            fd, self._tmp_path = tempfile.mkstemp(
+                prefix='.%s.' % pkg_name, suffix='.tmp', dir=pkg_dir
+            )
+            self._file = os.fdopen(fd, 'w+b')
+        else:
+            self._tmp_path, self._file = None, tempfile.TemporaryFile()
+        self._entries = []
+
+    def abort(self):
+        """
+        Discard the updated copy, leaving the package as it was before this
+        update, and release any resources this updater is using.
+        """
+        self._release()
+        if self._tmp_path is not None:
+            os.remove(self._tmp_path)
+
+    def close(self):
+        """
+        Write the central directory of the updated copy and put the copy in
+        place of the original package, then release any resources this
+        updater is using. Members not written during this update are left
+        out.
+        """
+        try:
+            self._write_central_directory()
+            if self._is_path:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                if self._source is not None:
+                    shutil.copymode(self._pkg_file, self._tmp_path)
+            else:
+                self._file.seek(0)
+                self._pkg_file.seek(0)
+                shutil.copyfileobj(self._file, self._pkg_file)
+                self._pkg_file.truncate()
+        except BaseException:
+            self.abort()
+            raise
+        self._release()
+        if self._is_path:
+            replace_file(self._tmp_path, self._pkg_file)
+
+    def keep_unwritten(self):
+        """
+        Copy each member not written so far to the package as it is, rather
+        than leaving it out on :meth:`close`, as when only adding to a
+        package.
+        """
+        for membername in self._unwritten:
+            self._copy_member(self._source_infos[membername])
+        self._unwritten = []
+
+    def open(self, pack_uri):
+        """
+        Return a writable file-like object for the member corresponding to
+        *pack_uri*, replacing any existing member of that name, as for
+        `_ZipPkgWriter.open()`.
+        """
+        membername = self._claim(pack_uri)
+        return _DeflatedZipMember(self._file, membername, self._entries)
+
+    def write(self, pack_uri, blob):
+        """
+        Write *blob* to this zip package with the membername corresponding to
+        *pack_uri*, copying the existing member instead when it is identical.
+        """
+        membername = self._claim(pack_uri)
+        crc = zlib.crc32(blob) & 0xFFFFFFFF
+        zinfo = self._source_infos.get(membername)
+        if zinfo is not None and zinfo.file_size == len(blob) and zinfo.CRC == crc:
+            self._copy_member(zinfo)
+            return
+        compressor = zlib.compressobj(
+            zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -zlib.MAX_WBITS
+        )
+        data = compressor.compress(blob) + compressor.flush()
+        entry = _ZipEntry(
+            membername, self._file.tell(), ZIP_DEFLATED, crc, len(data), len(blob)
+        )
+        self._file.write(entry.local_header())
+        self._file.write(data)
+        self._entries.append(entry)
+
+    def _claim(self, pack_uri):
+        """
+        Return the membername for *pack_uri*, no longer to be copied from the
+        original package.
+        """
+        membername = pack_uri.membername
+        if membername in self._unwritten:
+            self._unwritten.remove(membername)
+        return membername
+
+    def _copy_member(self, zinfo):
+        """
+        Copy the member described by *zinfo* from the original package, its
+        data as it is, under a new local header.
+        """
+        fp = self._source_file
+        fp.seek(zinfo.header_offset)
+        header = fp.read(_local_header.size)
+        name_len, extra_len = _local_header.unpack(header)[-2:]
+        fp.seek(name_len + extra_len, os.SEEK_CUR)
+        entry = _ZipEntry(
+            zinfo.filename, self._file.tell(), zinfo.compress_type, zinfo.CRC,
+            zinfo.compress_size, zinfo.file_size, zinfo.date_time,
+            zinfo.external_attr,
+        )
+        self._file.write(entry.local_header())
+        remaining = zinfo.compress_size
+        while remaining > 0:
+            chunk = fp.read(min(remaining, _COPY_CHUNK_SIZE))
+            if not chunk:
+                raise BadZipfile('truncated member %s' % zinfo.filename)
+            self._file.write(chunk)
+            remaining -= len(chunk)
+        self._entries.append(entry)
+
+    def _release(self):
+        """Close the original package and the copy, if not yet closed."""
+        if self._source is not None:
+            self._source.close()
+            if self._is_path:
+                self._source_file.close()
+            self._source = None
+        if not self._file.closed:
+            self._file.close()
+
+    def _write_central_directory(self):
+        """Write the central directory and its end records to the copy."""
+        start = self._file.tell()
+        for entry in self._entries:
+            self._file.write(entry.central_header())
+        size = self._file.tell() - start
+        count = len(self._entries)
+        if count >= 0xFFFF or size > _ZIP32_MAX or start > _ZIP32_MAX:
+            zip64_end = self._file.tell()
+            self._file.write(_zip64_end.pack(
+                b'PK\x06\x06', _zip64_end.size - 12, 45, 45, 0, 0, count, count,
+                size, start
+            ))
+            self._file.write(_zip64_locator.pack(b'PK\x06\x07', 0, zip64_end, 1))
+            count, size, start = min(count, 0xFFFF), _zip32(size), _zip32(start)
+        self._file.write(
+            _end_of_central_dir.pack(b'PK\x05\x06', 0, 0, count, count, size, start, 0)
+        )
+
+
+class _ZipEntry(object):
+    """
+    A member of a zip file being written by |_ZipPkgUpdater|, named
+    *membername*, its local header at *offset*.
+    """
+    def __init__(
+        self, membername, offset, compress_type, crc, compress_size, file_size,
+        date_time=None, external_attr=0o600 << 16
+    ):
+        super(_ZipEntry, self).__init__()
+        self.membername = membername
+        self.offset = offset
+        self.compress_type = compress_type
+        self.crc = crc
+        self.compress_size = compress_size
+        self.file_size = file_size
+        self._date_time = date_time or time.localtime(time.time())[:6]
+        self._external_attr = external_attr
+
+    def central_header(self):
+        """Return the central directory header for this member, as bytes."""
+        extra_values = [
+            value for value in (self.file_size, self.compress_size, self.offset)
+            if value > _ZIP32_MAX
+        ]
+        extra = (
+            struct.pack('<HH%dQ' % len(extra_values), 1, 8 * len(extra_values),
+                        *extra_values)
+            if extra_values else b''
+        )
+        name, flags = self._encoded_name()
+        version = 45 if extra else 20
+        dos_time, dos_date = self._dos_date_time()
+        return _central_header.pack(
+            b'PK\x01\x02', version, 3, version, 0, flags, self.compress_type,
+            dos_time, dos_date, self.crc, _zip32(self.compress_size),
+            _zip32(self.file_size), len(name), len(extra), 0, 0, 0,
+            self._external_attr, _zip32(self.offset)
+        ) + name + extra
+
+    def local_header(self, zip64=False):
+        """
+        Return the local header for this member, as bytes. The sizes are
+        given in a zip64 extra field when *zip64* is True or when they need
+        it, so a member written before its size is known can have its header
+        rewritten in place.
+        """
+        zip64 = (
+            zip64 or self.file_size > _ZIP32_MAX or self.compress_size > _ZIP32_MAX
+        )
+        extra = (
+            struct.pack('<HHQQ', 1, 16, self.file_size, self.compress_size)
+            if zip64 else b''
+        )
+        name, flags = self._encoded_name()
+        dos_time, dos_date = self._dos_date_time()
+        compress_size, file_size = (
+            (_ZIP64_MARK, _ZIP64_MARK) if zip64
+            else (self.compress_size, self.file_size)
+        )
+        return _local_header.pack(
+            b'PK\x03\x04', 45 if zip64 else 20, flags, self.compress_type,
+            dos_time, dos_date, self.crc, compress_size, file_size, len(name),
+            len(extra)
+        ) + name + extra
+
+    def _dos_date_time(self):
+        year, month, day, hour, minute, second = self._date_time
+        return (
+            hour << 11 | minute << 5 | second // 2,
+            max(year - 1980, 0) << 9 | month << 5 | day,
+        )
+
+    def _encoded_name(self):
+        """
+        Return the membername as bytes, with the general purpose flag bit
+        marking it as UTF-8 when it is not plain ASCII.
+        """
+        try:
+            return self.membername.encode('ascii'), 0
+        except UnicodeError:
+            return self.membername.encode('utf-8'), 0x800
+
+
+class _DeflatedZipMember(object):
+    """
+    Writable stream for member *membername* written at the end of *file*,
+    compressing its content as it is written. The local header is rewritten
+    with the size and CRC-32 of the content on :meth:`close`, when an entry
+    for the member is added to *entries*. Closing it again has no effect.
+    """
+    def __init__(self, file, membername, entries):
+        super(_DeflatedZipMember, self).__init__()
+        self._closed = False
+        self._file = file
+        self._entries = entries
+        self._entry = _ZipEntry(membername, file.tell(), ZIP_DEFLATED, 0, 0, 0)
+        self._compressor = zlib.compressobj(
+            zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -zlib.MAX_WBITS
+        )
+        file.write(self._entry.local_header(zip64=True))
+
+    def close(self):
+        if self._closed or self._file.closed:
+            return
+        self._closed = True
+        entry = self._entry
+        data = self._compressor.flush()
+        self._file.write(data)
+        entry.compress_size += len(data)
+        end = self._file.tell()
+        self._file.seek(entry.offset)
+        self._file.write(entry.local_header(zip64=True))
+        self._file.seek(end)
+        self._entries.append(entry)
+
+    def write(self, data):
+        entry = self._entry
+        entry.crc = zlib.crc32(data, entry.crc) & 0xFFFFFFFF
+        entry.file_size += len(data)
+        data = self._compressor.compress(data)
+        entry.compress_size += len(data)
+        self._file.write(data)
+
+
+def _zip32(value):
+    """
+    Return *value* as held by a zip record, the zip64 mark when it is too large
+    and is given in a zip64 extra field instead.
+    """
+    return value if value <= _ZIP32_MAX else _ZIP64_MARK
+
+
+def _open_member(zipf, membername):
+    """
+    Return a writable file-like object for new member *membername* of
+    *zipf*. Where the zip module cannot write a member progressively, the
+    content is collected in a temporary file and added when it is closed.
+    """
+    try:
+        return zipf.open(membername, 'w', force_zip64=True)
+    except TypeError:
+        return _SpooledZipMember(zipf, membername)
+
+
+def _flat_part_blob(part):
+    """
+    Return the blob of Flat OPC `pkg:part` element *part*, an XML document
+    for a `pkg:xmlData` child, otherwise the decoded `pkg:binaryData`.
+    """
+    xml_data = part.find(qn('pkg:xmlData'))
+    if xml_data is not None:
+        root = next(xml_data.iterchildren(tag=etree.Element))
+        # ---a copy declares only the namespaces of its own and those it uses, not
+        # ---every one in scope in the package document, like `pkg`---
+        return etree.tostring(deepcopy(root), encoding='UTF-8', standalone=True)
+    binary_data = part.find(qn('pkg:binaryData'))
+    return b64decode(binary_data.text or '')
+
+
+def _is_flat_pkg(pkg_file):
+    """
+    Return |True| if the path or stream *pkg_file* starts like a Flat OPC
+    package. A stream is left at the position it started at.
+    """
+    if is_string(pkg_file):
+        with open(pkg_file, 'rb') as f:
+            head = f.read(1024)
+    else:
+        position = pkg_file.tell()
+        head = pkg_file.read(1024)
+        pkg_file.seek(position)
+    return nsmap['pkg'].encode('utf-8') in head
+
+
+def _xml_content(blob):
+    """
+    Return XML document *blob* as UTF-8 without its XML declaration, ready to
+    be embedded in another XML document. A blob encoded as UTF-8 is used as it
+    is; any other is re-encoded.
+    """
+    blob = bytes(blob)
+    head = _utf8_xml_head.match(blob)
+    if head is not None:
+        declaration = head.group(1) or b''
+        encoding = _declared_encoding.search(declaration)
+        if encoding is None or encoding.group(1).lower() in (b'utf-8', b'utf8'):
+            return blob[head.end():]
+    return etree.tostring(etree.fromstring(blob), encoding='UTF-8')
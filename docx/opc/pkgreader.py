@@ -30,12 +30,21 @@ class PackageReader(object):
         Return a |PackageReader| instance loaded with contents of *pkg_file*.
         """
         phys_reader = PhysPkgReader(pkg_file)
+        pkg_reader = PackageReader.from_phys_reader(phys_reader)
+        phys_reader.close()
+        return pkg_reader
+
+    @staticmethod
+    def from_phys_reader(phys_reader):
+        """
+        Return a |PackageReader| instance loaded with the contents of
+        *phys_reader*, a physical package reader, which is left open.
+        """
         content_types = _ContentTypeMap.from_xml(phys_reader.content_types_xml)
         pkg_srels = PackageReader._srels_for(phys_reader, PACKAGE_URI)
         sparts = PackageReader._load_serialized_parts(
             phys_reader, pkg_srels, content_types
         )
-        phys_reader.close()
         return PackageReader(content_types, pkg_srels, sparts)
 
     def iter_sparts(self):
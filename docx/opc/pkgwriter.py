@@ -10,7 +10,8 @@ from __future__ import absolute_import
 from .constants import CONTENT_TYPE as CT
 from .oxml import CT_Types, serialize_part_xml
 from .packuri import CONTENT_TYPES_URI, PACKAGE_URI
-from .phys_pkg import PhysPkgWriter
+from .part import XmlPart
+from .phys_pkg import PhysPkgUpdater, PhysPkgWriter
 from .shared import CaseInsensitiveDict
 from .spec import default_content_types
 
@@ -23,16 +24,37 @@ class PackageWriter(object):
     be instantiated.
     """
     @staticmethod
-    def write(pkg_file, pkg_rels, parts):
+    def write(pkg_file, pkg_rels, parts, format='zip', cleanup_namespaces=False):
         """
         Write a physical package (.pptx file) to *pkg_file* containing
         *pkg_rels* and *parts* and a content types stream based on the
-        content types of the parts.
+        content types of the parts. *format* is as for |PhysPkgWriter|. When
+        *cleanup_namespaces* is |True|, each XML part is written without
+        redundant namespace declarations, as by `XmlPart.clean_blob`.
         """
-        phys_writer = PhysPkgWriter(pkg_file)
+        phys_writer = PhysPkgWriter(pkg_file, format)
         PackageWriter._write_content_types_stream(phys_writer, parts)
         PackageWriter._write_pkg_rels(phys_writer, pkg_rels)
-        PackageWriter._write_parts(phys_writer, parts)
+        PackageWriter._write_parts(phys_writer, parts, cleanup_namespaces)
+        phys_writer.close()
+
+    @staticmethod
+    def update(pkg_file, pkg_rels, parts):
+        """
+        Update the existing physical package at *pkg_file* to contain
+        *pkg_rels* and *parts* and a content types stream based on the
+        content types of the parts. Only members whose content has changed
+        are recompressed; the rest are copied as they are. The package is left
+        as it was if the update fails.
+        """
+        phys_writer = PhysPkgUpdater(pkg_file)
+        try:
+            PackageWriter._write_content_types_stream(phys_writer, parts)
+            PackageWriter._write_pkg_rels(phys_writer, pkg_rels)
+            PackageWriter._write_parts(phys_writer, parts)
+        except BaseException:
+            phys_writer.abort()
+            raise
         phys_writer.close()
 
     @staticmethod
@@ -45,13 +67,18 @@ class PackageWriter(object):
         phys_writer.write(CONTENT_TYPES_URI, cti.blob)
 
     @staticmethod
-    def _write_parts(phys_writer, parts):
+    def _write_parts(phys_writer, parts, cleanup_namespaces=False):
         """
         Write the blob of each part in *parts* to the package, along with a
-        rels item for its relationships if and only if it has any.
+        rels item for its relationships if and only if it has any. The clean
+        blob of an XML part is written when *cleanup_namespaces* is |True|.
         """
         for part in parts:
-            phys_writer.write(part.partname, part.blob)
+            if cleanup_namespaces and isinstance(part, XmlPart):
+                blob = part.clean_blob
+            else:
+                blob = part.blob
+            phys_writer.write(part.partname, blob)
             if len(part._rels):
                 phys_writer.write(part.partname.rels_uri, part._rels.xml)
 
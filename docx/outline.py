@@ -0,0 +1,276 @@
+# encoding: utf-8
+
+"""Heading levels and list labels of body paragraphs.
+
+An |Outline| reads the styles and numbering parts of a document once, resolving the
+outline level and list numbering of each paragraph style through its `w:basedOn`
+links, then answers for each paragraph whether it is a heading or a list item and
+what label Word would display for it. The export and split modules both use it.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import re
+
+from lxml import etree
+
+from docx.oxml.ns import nsmap, qn
+
+
+class Outline(object):
+    """Interprets body blocks using the styles and numbering of their document.
+
+    *styles* and *numbering* are the root elements of the styles and numbering
+    parts, either of which may be |None|.
+    """
+
+    def __init__(self, styles, numbering):
+        super(Outline, self).__init__()
+        self._default_style_id = None
+        self._outline_levels = {}
+        self._style_numPrs = {}
+        if styles is not None:
+            self._load_styles(styles)
+        self._numbering = ListNumbering(numbering)
+        self._last_p, self._last_properties = None, None
+
+    def heading_level(self, p):
+        """Return heading level of *p*, 1 for a top-level heading, or |None|.
+
+        The level comes from an outline level set directly on the paragraph or on
+        its paragraph style. Outline level 9 is body text.
+        """
+        style_id, level, _, _ = self._properties(p)
+        if level is None:
+            level = self._outline_levels.get(style_id or self._default_style_id)
+        if level is None or not 0 <= level < 9:
+            return None
+        return level + 1
+
+    def list_item(self, p):
+        """Return (ilvl, ordinal, label) for list paragraph *p*, or |None|.
+
+        `ordinal` is the paragraph's number in its list level, or |None| for a
+        bullet, and `label` is its number or bullet as Word would display it. Each
+        call for a numbered paragraph advances the count for its list.
+        """
+        style_id, _, numId, ilvl = self._properties(p)
+        if numId is None:
+            numId, style_ilvl = self._style_numPrs.get(
+                style_id or self._default_style_id, (None, 0)
+            )
+            if ilvl is None:
+                ilvl = style_ilvl
+        if not numId:
+            return None
+        ilvl = ilvl or 0
+        ordinal, label = self._numbering.next_label(numId, ilvl)
+        if label is None:
+            return None
+        return ilvl, ordinal, label
+
+    def style_id(self, p):
+        """Return id of the paragraph style of *p*, the default style if none is set."""
+        return self._properties(p)[0] or self._default_style_id
+
+    def _load_styles(self, styles):
+        """Resolve the outline level and numbering of each paragraph style."""
+        outline_levels, numPrs, based_on = {}, {}, {}
+        for style in _xpath(styles, './w:style[@w:type="paragraph"]'):
+            style_id = style.get(qn('w:styleId'))
+            if style.get(qn('w:default')) in ('1', 'true', 'on'):
+                self._default_style_id = style_id
+            level = _val(style, './w:pPr/w:outlineLvl/@w:val')
+            if level is not None:
+                outline_levels[style_id] = level
+            numId = _val(style, './w:pPr/w:numPr/w:numId/@w:val')
+            if numId is not None:
+                numPrs[style_id] = (
+                    numId, _val(style, './w:pPr/w:numPr/w:ilvl/@w:val') or 0
+                )
+            base_ids = _xpath(style, './w:basedOn/@w:val')
+            if base_ids:
+                based_on[style_id] = base_ids[0]
+
+        def inherited(values, style_id):
+            seen = set()
+            while style_id is not None and style_id not in seen:
+                if style_id in values:
+                    return values[style_id]
+                seen.add(style_id)
+                style_id = based_on.get(style_id)
+            return None
+
+        for style_id in set(based_on) | set(outline_levels) | set(numPrs):
+            level = inherited(outline_levels, style_id)
+            if level is not None:
+                self._outline_levels[style_id] = level
+            numPr = inherited(numPrs, style_id)
+            if numPr is not None:
+                self._style_numPrs[style_id] = numPr
+
+    def _properties(self, p):
+        """Return the direct properties of *p*, remembering them for the next call.
+
+        Each paragraph is asked about several times in a row while being written.
+        """
+        if p is not self._last_p:
+            self._last_p, self._last_properties = p, _direct_properties(p)
+        return self._last_properties
+
+
+class ListNumbering(object):
+    """Counters for the lists defined in `w:numbering` element *numbering*."""
+
+    def __init__(self, numbering):
+        super(ListNumbering, self).__init__()
+        # ---numId -> {ilvl: (numFmt, lvlText, start)}---
+        self._levels = {}
+        # ---numId -> [count for each ilvl]---
+        self._counts = {}
+        if numbering is not None:
+            self._load(numbering)
+
+    def next_label(self, numId, ilvl):
+        """Return (ordinal, label) pair for the next paragraph at *ilvl* of *numId*.
+
+        Counts at deeper levels of the list restart. Returns (|None|, |None|) when
+        *numId* or *ilvl* is not defined.
+        """
+        levels = self._levels.get(numId)
+        if levels is None or ilvl not in levels:
+            return None, None
+        counts = self._counts.setdefault(numId, [None] * 9)
+        for deeper in range(ilvl + 1, len(counts)):
+            counts[deeper] = None
+        numFmt, lvlText, start = levels[ilvl]
+        counts[ilvl] = start if counts[ilvl] is None else counts[ilvl] + 1
+        if numFmt == 'bullet':
+            return None, '\u2022'
+
+        def level_number(match):
+            level = int(match.group(1)) - 1
+            if level not in levels:
+                return ''
+            count = counts[level]
+            if count is None:
+                count = levels[level][2]
+            return format_number(count, levels[level][0])
+
+        return counts[ilvl], _level_ref_patt.sub(level_number, lvlText)
+
+    def _load(self, numbering):
+        abstract_levels = {}
+        for abstractNum in _xpath(numbering, './w:abstractNum'):
+            abstract_levels[abstractNum.get(qn('w:abstractNumId'))] = dict(
+                _level_definition(lvl) for lvl in _xpath(abstractNum, './w:lvl')
+            )
+        for num in _xpath(numbering, './w:num'):
+            abstractNum_ids = _xpath(num, './w:abstractNumId/@w:val')
+            if not abstractNum_ids:
+                continue
+            levels = dict(abstract_levels.get(abstractNum_ids[0], {}))
+            for lvlOverride in _xpath(num, './w:lvlOverride'):
+                for lvl in _xpath(lvlOverride, './w:lvl'):
+                    ilvl, definition = _level_definition(lvl)
+                    levels[ilvl] = definition
+                ilvl = int(lvlOverride.get(qn('w:ilvl'), 0))
+                start = _val(lvlOverride, './w:startOverride/@w:val')
+                if start is not None and ilvl in levels:
+                    numFmt, lvlText, _ = levels[ilvl]
+                    levels[ilvl] = (numFmt, lvlText, start)
+            self._levels[int(num.get(qn('w:numId')))] = levels
+
+
+def format_number(number, numFmt):
+    """Return *number* formatted as a list number having ST_NumberFormat *numFmt*."""
+    if numFmt in ('lowerLetter', 'upperLetter'):
+        letters = ''
+        while number > 0:
+            number, remainder = divmod(number - 1, 26)
+            letters = chr(ord('a') + remainder) + letters
+        return letters.upper() if numFmt == 'upperLetter' else letters
+    if numFmt in ('lowerRoman', 'upperRoman'):
+        numerals = ''
+        for value, numeral in _roman_numerals:
+            count, number = divmod(number, value)
+            numerals += numeral * count
+        return numerals.upper() if numFmt == 'upperRoman' else numerals
+    if numFmt == 'decimalZero':
+        return '%02d' % number
+    if numFmt == 'none':
+        return ''
+    return '%d' % number
+
+
+def _child_int(parent, tagname):
+    """Return the integer `w:val` of child *tagname* of *parent*, or |None|."""
+    child = parent.find(qn(tagname))
+    if child is None:
+        return None
+    try:
+        return int(child.get(qn('w:val')))
+    except (TypeError, ValueError):
+        return None
+
+
+def _direct_properties(p):
+    """Return (style_id, outline_level, numId, ilvl) set directly on paragraph *p*.
+
+    Each is |None| when not set. Child elements are found with `find()` rather than
+    XPath because this runs for every paragraph exported.
+    """
+    pPr = p.find(qn('w:pPr'))
+    if pPr is None:
+        return None, None, None, None
+    pStyle = pPr.find(qn('w:pStyle'))
+    style_id = None if pStyle is None else pStyle.get(qn('w:val'))
+    outline_level = _child_int(pPr, 'w:outlineLvl')
+    numPr = pPr.find(qn('w:numPr'))
+    if numPr is None:
+        return style_id, outline_level, None, None
+    return (
+        style_id, outline_level,
+        _child_int(numPr, 'w:numId'), _child_int(numPr, 'w:ilvl'),
+    )
+
+
+def _level_definition(lvl):
+    """Return (ilvl, (numFmt, lvlText, start)) for `w:lvl` element *lvl*."""
+    numFmts = _xpath(lvl, './w:numFmt/@w:val')
+    lvlTexts = _xpath(lvl, './w:lvlText/@w:val')
+    start = _val(lvl, './w:start/@w:val')
+    return int(lvl.get(qn('w:ilvl'), 0)), (
+        numFmts[0] if numFmts else 'decimal',
+        lvlTexts[0] if lvlTexts else '',
+        1 if start is None else start,
+    )
+
+
+def _val(element, xpath):
+    """Return the integer value found at *xpath* from *element*, or |None|."""
+    values = _xpath(element, xpath)
+    if not values:
+        return None
+    try:
+        return int(values[0])
+    except ValueError:
+        return None
+
+
+def _xpath(element, path):
+    """Return the result of XPath expression *path*, compiled once, on *element*."""
+    xpath = _xpaths.get(path)
+    if xpath is None:
+        xpath = _xpaths[path] = etree.XPath(path, namespaces=nsmap)
+    return xpath(element)
+
+
+_xpaths = {}
+
+_level_ref_patt = re.compile(r'%([1-9])')
+
+_roman_numerals = (
+    (1000, 'm'), (900, 'cm'), (500, 'd'), (400, 'cd'), (100, 'c'), (90, 'xc'),
+    (50, 'l'), (40, 'xl'), (10, 'x'), (9, 'ix'), (5, 'v'), (4, 'iv'), (1, 'i'),
+)
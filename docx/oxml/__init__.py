@@ -7,6 +7,8 @@ corresponding to Open XML elements.
 
 from __future__ import absolute_import
 
+from copy import deepcopy
+
 from lxml import etree
 
 from .ns import NamespacePrefixedTag, nsmap
@@ -29,6 +31,24 @@ def parse_xml(xml):
     return root_element
 
 
+def new_from_prototype(name, xml):
+    """
+    Return a new element that is a deep copy of the prototype registered as
+    *name*. The first time *name* is asked for, *xml*, an XML string or a
+    callable returning one, is parsed with the custom parser to produce the
+    prototype; later calls only copy it, which is several times faster than
+    parsing. *name* should identify a fixed skeleton, with any values that
+    vary filled in by the caller on the copy.
+    """
+    prototype = _prototypes.get(name)
+    if prototype is None:
+        prototype = _prototypes[name] = parse_xml(xml() if callable(xml) else xml)
+    return deepcopy(prototype)
+
+
+_prototypes = {}
+
+
 def register_element_cls(tag, cls):
     """
     Register *cls* to be constructed when the oxml parser encounters an
@@ -60,6 +80,42 @@ def OxmlElement(nsptag_str, attrs=None, nsdecls=None):
     )
 
 
+# ---attributes naming namespace prefixes, in markup-compatibility elements or
+# ---the elements they qualify---
+_mc_prefix_attrs = etree.XPath(
+    'descendant-or-self::*/@mc:Ignorable'
+    ' | descendant-or-self::*/@mc:ProcessContent'
+    ' | descendant-or-self::*/@mc:MustUnderstand'
+    ' | descendant::mc:Choice/@Requires',
+    namespaces={'mc': 'http://schemas.openxmlformats.org/markup-compatibility/2006'},
+)
+
+
+def cleanup_namespaces(element):
+    """
+    Remove redundant namespace declarations from the tree rooted at
+    *element*, hoisting declarations for the well-known namespaces in
+    |nsmap| to *element* so they are declared only once. Every prefix already
+    declared on *element* is kept, even when unused, as is every prefix named
+    in the markup-compatibility attributes of the tree, such as
+    `mc:Ignorable` and the `Requires` of `mc:Choice`, which refer to
+    namespace prefixes by name rather than use them.
+    """
+    root_nsmap = element.nsmap
+    root_uris = set(root_nsmap.values())
+    top_nsmap = dict(
+        (pfx, uri) for pfx, uri in nsmap.items()
+        if pfx != 'xml' and pfx not in root_nsmap and uri not in root_uris
+    )
+    keep_ns_prefixes = set(pfx for pfx in root_nsmap if pfx is not None)
+    # ---`mc:ProcessContent` gives qualified names, like `w15:*`---
+    for value in _mc_prefix_attrs(element):
+        keep_ns_prefixes.update(name.split(':')[0] for name in value.split())
+    etree.cleanup_namespaces(
+        element, top_nsmap=top_nsmap, keep_ns_prefixes=keep_ns_prefixes
+    )
+
+
 # ===========================================================================
 # custom element class mappings
 # ===========================================================================
@@ -107,6 +163,7 @@ from .settings import CT_Settings  # noqa
 register_element_cls("w:settings", CT_Settings)
 
 from .shape import (  # noqa
+    CT_Anchor,
     CT_Blip,
     CT_BlipFillProperties,
     CT_GraphicalObject,
@@ -131,18 +188,30 @@ register_element_cls('pic:cNvPr',     CT_NonVisualDrawingProps)
 register_element_cls('pic:nvPicPr',   CT_PictureNonVisual)
 register_element_cls('pic:pic',       CT_Picture)
 register_element_cls('pic:spPr',      CT_ShapeProperties)
+register_element_cls('wp:anchor',     CT_Anchor)
 register_element_cls('wp:docPr',      CT_NonVisualDrawingProps)
 register_element_cls('wp:extent',     CT_PositiveSize2D)
 register_element_cls('wp:inline',     CT_Inline)
 
-from .styles import CT_LatentStyles, CT_LsdException, CT_Style, CT_Styles  # noqa
+from .styles import (  # noqa
+    CT_DocDefaults,
+    CT_LatentStyles,
+    CT_LsdException,
+    CT_PPrDefault,
+    CT_RPrDefault,
+    CT_Style,
+    CT_Styles,
+)
 register_element_cls('w:basedOn',        CT_String)
+register_element_cls('w:docDefaults',    CT_DocDefaults)
 register_element_cls('w:latentStyles',   CT_LatentStyles)
 register_element_cls('w:locked',         CT_OnOff)
 register_element_cls('w:lsdException',   CT_LsdException)
 register_element_cls('w:name',           CT_String)
 register_element_cls('w:next',           CT_String)
+register_element_cls('w:pPrDefault',     CT_PPrDefault)
 register_element_cls('w:qFormat',        CT_OnOff)
+register_element_cls('w:rPrDefault',     CT_RPrDefault)
 register_element_cls('w:semiHidden',     CT_OnOff)
 register_element_cls('w:style',          CT_Style)
 register_element_cls('w:styles',         CT_Styles)
@@ -152,6 +221,7 @@ register_element_cls('w:unhideWhenUsed', CT_OnOff)
 from .table import (  # noqa
     CT_Height,
     CT_Row,
+    CT_Shd,
     CT_Tbl,
     CT_TblGrid,
     CT_TblGridCol,
@@ -159,6 +229,7 @@ from .table import (  # noqa
     CT_TblPr,
     CT_TblWidth,
     CT_Tc,
+    CT_TcBorders,
     CT_TcPr,
     CT_TrPr,
     CT_VMerge,
@@ -167,12 +238,14 @@ from .table import (  # noqa
 register_element_cls('w:bidiVisual', CT_OnOff)
 register_element_cls('w:gridCol',    CT_TblGridCol)
 register_element_cls('w:gridSpan',   CT_DecimalNumber)
+register_element_cls('w:shd',        CT_Shd)
 register_element_cls('w:tbl',        CT_Tbl)
 register_element_cls('w:tblGrid',    CT_TblGrid)
 register_element_cls('w:tblLayout',  CT_TblLayoutType)
 register_element_cls('w:tblPr',      CT_TblPr)
 register_element_cls('w:tblStyle',   CT_String)
 register_element_cls('w:tc',         CT_Tc)
+register_element_cls('w:tcBorders',  CT_TcBorders)
 register_element_cls('w:tcPr',       CT_TcPr)
 register_element_cls('w:tcW',        CT_TblWidth)
 register_element_cls('w:tr',         CT_Row)
@@ -5,6 +5,9 @@ Custom element classes that correspond to the document part, e.g.
 <w:document>.
 """
 
+from lxml import etree
+
+from .ns import qn
 from .xmlchemy import BaseOxmlElement, ZeroOrOne, ZeroOrMore
 
 
@@ -65,3 +68,24 @@ class CT_Body(BaseOxmlElement):
             content_elms = self[:]
         for content_elm in content_elms:
             self.remove(content_elm)
+
+    def _insert_p(self, p):
+        return self._insert_block_item(p)
+
+    def _insert_tbl(self, tbl):
+        return self._insert_block_item(tbl)
+
+    def _insert_block_item(self, elm):
+        """Return *elm* after appending it as the last block item in this body.
+
+        The `w:sectPr` child, when present, is always the last child element of
+        `w:body`, so only the last child element needs to be checked rather than
+        searching all children. Comments and processing instructions after it are
+        passed over.
+        """
+        last_child = next(self.iterchildren(tag=etree.Element, reversed=True), None)
+        if last_child is not None and last_child.tag == qn('w:sectPr'):
+            last_child.addprevious(elm)
+        else:
+            self.append(elm)
+        return elm
@@ -4,7 +4,7 @@
 Custom element classes for shape-related elements like ``<w:inline>``
 """
 
-from . import parse_xml
+from . import new_from_prototype
 from .ns import nsdecls
 from .simpletypes import (
     ST_Coordinate, ST_DrawingElementId, ST_PositiveCoordinate,
@@ -16,6 +16,15 @@ from .xmlchemy import (
 )
 
 
+class CT_Anchor(BaseOxmlElement):
+    """
+    ``<wp:anchor>`` element, container for a floating shape.
+    """
+    extent = OneAndOnlyOne('wp:extent')
+    docPr = OneAndOnlyOne('wp:docPr')
+    graphic = OneAndOnlyOne('a:graphic')
+
+
 class CT_Blip(BaseOxmlElement):
     """
     ``<a:blip>`` element, specifies image source and adjustments such as
@@ -63,7 +72,7 @@ class CT_Inline(BaseOxmlElement):
         Return a new ``<wp:inline>`` element populated with the values passed
         as parameters.
         """
-        inline = parse_xml(cls._inline_xml())
+        inline = new_from_prototype('wp:inline', cls._inline_xml)
         inline.extent.cx = cx
         inline.extent.cy = cy
         inline.docPr.id = shape_id
@@ -133,7 +142,7 @@ class CT_Picture(BaseOxmlElement):
         contents required to define a viable picture element, based on the
         values passed as parameters.
         """
-        pic = parse_xml(cls._pic_xml())
+        pic = new_from_prototype('pic:pic', cls._pic_xml)
         pic.nvPicPr.cNvPr.id = pic_id
         pic.nvPicPr.cNvPr.name = filename
         pic.blipFill.blip.embed = rId
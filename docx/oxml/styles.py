@@ -31,6 +31,15 @@ def styleId_from_name(name):
     }.get(name, name.replace(' ', ''))
 
 
+class CT_DocDefaults(BaseOxmlElement):
+    """
+    `w:docDefaults` element, holding the document-wide default run and
+    paragraph properties that all styles build on.
+    """
+    rPrDefault = ZeroOrOne('w:rPrDefault', successors=('w:pPrDefault',))
+    pPrDefault = ZeroOrOne('w:pPrDefault', successors=())
+
+
 class CT_LatentStyles(BaseOxmlElement):
     """
     `w:latentStyles` element, defining behavior defaults for latent styles
@@ -105,6 +114,22 @@ class CT_LsdException(BaseOxmlElement):
         setattr(self, attr_name, value)
 
 
+class CT_PPrDefault(BaseOxmlElement):
+    """
+    `w:pPrDefault` element, containing the default paragraph properties for
+    the document.
+    """
+    pPr = ZeroOrOne('w:pPr', successors=())
+
+
+class CT_RPrDefault(BaseOxmlElement):
+    """
+    `w:rPrDefault` element, containing the default run properties for the
+    document.
+    """
+    rPr = ZeroOrOne('w:rPr', successors=())
+
+
 class CT_Style(BaseOxmlElement):
     """
     A ``<w:style>`` element, representing a style definition
@@ -292,6 +317,7 @@ class CT_Styles(BaseOxmlElement):
     styles.xml
     """
     _tag_seq = ('w:docDefaults', 'w:latentStyles', 'w:style')
+    docDefaults = ZeroOrOne('w:docDefaults', successors=_tag_seq[1:])
     latentStyles = ZeroOrOne('w:latentStyles', successors=_tag_seq[2:])
     style = ZeroOrMore('w:style', successors=())
     del _tag_seq
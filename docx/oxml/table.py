@@ -6,13 +6,16 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
-from . import parse_xml
+from copy import deepcopy
+
+from . import new_from_prototype
 from ..enum.table import WD_CELL_VERTICAL_ALIGNMENT, WD_ROW_HEIGHT_RULE
 from ..exceptions import InvalidSpanError
 from .ns import nsdecls, qn
 from ..shared import Emu, Twips
 from .simpletypes import (
-    ST_Merge, ST_TblLayoutType, ST_TblWidth, ST_TwipsMeasure, XsdInt
+    ST_HexColor, ST_Merge, ST_TblLayoutType, ST_TblWidth, ST_TwipsMeasure,
+    XsdInt, XsdString
 )
 from .xmlchemy import (
     BaseOxmlElement, OneAndOnlyOne, OneOrMore, OptionalAttribute,
@@ -36,6 +39,13 @@ class CT_Row(BaseOxmlElement):
     trPr = ZeroOrOne('w:trPr')        # custom inserter below
     tc = ZeroOrMore('w:tc')
 
+    def add_tc_of_width(self, width):
+        """
+        Return a newly added ``<w:tc>`` element having a ``<w:tcW>`` of
+        *width*, or no width when *width* is |None|.
+        """
+        return self._insert_tc(CT_Tc.new(width))
+
     def tc_at_grid_col(self, idx):
         """
         The ``<w:tc>`` element appearing at grid column *idx*. Raises
@@ -149,13 +159,74 @@ class CT_Tbl(BaseOxmlElement):
             for tc in tr.tc_lst:
                 yield tc
 
+    def merge_ranges(self, ranges):
+        """
+        Merge each rectangular range of cells in *ranges*, a sequence of
+        ``(row_0, col_0, row_1, col_1)`` tuples giving the row and grid
+        column of diagonally opposite corner cells, both included. Return
+        a list containing the top-left ``<w:tc>`` of the span each range
+        ends up in, in the order of *ranges*.
+
+        As for a single merge, a range is extended to take in the spans of
+        its corner cells, and the content of each merged cell is appended to
+        the top-left cell. All ranges are planned on a grid model of the
+        table before any row is changed, and each affected row is then
+        rewritten once. Raises |InvalidSpanError| if a range does not form
+        a rectangle, in which case the table is left unchanged.
+        """
+        grid = _SpanGrid(self)
+        spans = [grid.merge(*range_) for range_ in ranges]
+        grid.rewrite()
+        return [grid.top_tc(span) for span in spans]
+
+    @staticmethod
+    def update_tcPrs(tcs, update):
+        """
+        Change the `w:tcPr` of each of *tcs* by calling *update* with it,
+        adding a `w:tcPr` to a cell not having one. *update* is called once
+        for each distinct `w:tcPr` among *tcs*, in place on the first cell
+        having it; each later cell having the same properties gets a copy of
+        the result.
+        """
+        updated = {}
+        for tc in tcs:
+            tcPr = tc.tcPr
+            key = None if tcPr is None else _element_key(tcPr)
+            new_tcPr = updated.get(key)
+            if new_tcPr is None:
+                new_tcPr = tc.get_or_add_tcPr()
+                update(new_tcPr)
+                updated[key] = new_tcPr
+            elif tcPr is None:
+                tc._insert_tcPr(deepcopy(new_tcPr))
+            else:
+                tc.replace(tcPr, deepcopy(new_tcPr))
+
     @classmethod
     def new_tbl(cls, rows, cols, width):
         """
         Return a new `w:tbl` element having *rows* rows and *cols* columns
-        with *width* distributed evenly between the columns.
+        with *width* distributed evenly between the columns. The first cell
+        is built once and each other cell and row is a copy.
         """
-        return parse_xml(cls._tbl_xml(rows, cols, width))
+        col_width = Emu(width/cols) if cols > 0 else Emu(0)
+        tbl = new_from_prototype('w:tbl', cls._tbl_xml)
+        tblGrid = tbl.tblGrid
+        for i in range(cols):
+            tblGrid.add_gridCol().w = col_width
+        if rows == 0 or cols == 0:
+            for i in range(rows):
+                tbl.add_tr()
+            return tbl
+
+        tc = CT_Tc.new(col_width)
+        tr = tbl.add_tr()
+        tr.append(tc)
+        for i in range(1, cols):
+            tr.append(deepcopy(tc))
+        for i in range(1, rows):
+            tbl.append(deepcopy(tr))
+        return tbl
 
     @property
     def tblStyle_val(self):
@@ -181,8 +252,7 @@ class CT_Tbl(BaseOxmlElement):
         tblPr._add_tblStyle().val = styleId
 
     @classmethod
-    def _tbl_xml(cls, rows, cols, width):
-        col_width = Emu(width/cols) if cols > 0 else Emu(0)
+    def _tbl_xml(cls):
         return (
             '<w:tbl %s>\n'
             '  <w:tblPr>\n'
@@ -191,47 +261,9 @@ class CT_Tbl(BaseOxmlElement):
             '               w:lastColumn="0" w:lastRow="0" w:noHBand="0"\n'
             '               w:noVBand="1" w:val="04A0"/>\n'
             '  </w:tblPr>\n'
-            '%s'  # tblGrid
-            '%s'  # trs
+            '  <w:tblGrid/>\n'
             '</w:tbl>\n'
-        ) % (
-            nsdecls('w'),
-            cls._tblGrid_xml(cols, col_width),
-            cls._trs_xml(rows, cols, col_width)
-        )
-
-    @classmethod
-    def _tblGrid_xml(cls, col_count, col_width):
-        xml = '  <w:tblGrid>\n'
-        for i in range(col_count):
-            xml += '    <w:gridCol w:w="%d"/>\n' % col_width.twips
-        xml += '  </w:tblGrid>\n'
-        return xml
-
-    @classmethod
-    def _trs_xml(cls, row_count, col_count, col_width):
-        xml = ''
-        for i in range(row_count):
-            xml += (
-                '  <w:tr>\n'
-                '%s'
-                '  </w:tr>\n'
-            ) % cls._tcs_xml(col_count, col_width)
-        return xml
-
-    @classmethod
-    def _tcs_xml(cls, col_count, col_width):
-        xml = ''
-        for i in range(col_count):
-            xml += (
-                '    <w:tc>\n'
-                '      <w:tcPr>\n'
-                '        <w:tcW w:type="dxa" w:w="%d"/>\n'
-                '      </w:tcPr>\n'
-                '      <w:p/>\n'
-                '    </w:tc>\n'
-            ) % col_width.twips
-        return xml
+        ) % nsdecls('w')
 
 
 class CT_TblGrid(BaseOxmlElement):
@@ -366,6 +398,15 @@ class CT_TblWidth(BaseOxmlElement):
         self.w = Emu(value).twips
 
 
+class CT_Shd(BaseOxmlElement):
+    """
+    ``<w:shd>`` element, specifying the shading of a cell, paragraph or run.
+    """
+    val = RequiredAttribute('w:val', XsdString)
+    color = OptionalAttribute('w:color', ST_HexColor)
+    fill = OptionalAttribute('w:fill', ST_HexColor)
+
+
 class CT_Tc(BaseOxmlElement):
     """`w:tc` table cell element"""
 
@@ -446,16 +487,22 @@ class CT_Tc(BaseOxmlElement):
         return top_tc
 
     @classmethod
-    def new(cls):
+    def new(cls, width=None):
         """
         Return a new ``<w:tc>`` element, containing an empty paragraph as the
-        required EG_BlockLevelElt.
-        """
-        return parse_xml(
-            '<w:tc %s>\n'
-            '  <w:p/>\n'
-            '</w:tc>' % nsdecls('w')
-        )
+        required EG_BlockLevelElt, and having a ``<w:tcW>`` of *width* when
+        *width* is not |None|.
+        """
+        if width is None:
+            return new_from_prototype(
+                'w:tc', '<w:tc %s><w:p/></w:tc>' % nsdecls('w')
+            )
+        tc = new_from_prototype('w:tc/w:tcW', (
+            '<w:tc %s><w:tcPr><w:tcW w:type="dxa" w:w="0"/></w:tcPr><w:p/></w:tc>'
+            % nsdecls('w')
+        ))
+        tc.tcPr.tcW.width = width
+        return tc
 
     @property
     def right(self):
@@ -761,9 +808,29 @@ class CT_TcPr(BaseOxmlElement):
     tcW = ZeroOrOne('w:tcW', successors=_tag_seq[2:])
     gridSpan = ZeroOrOne('w:gridSpan', successors=_tag_seq[3:])
     vMerge = ZeroOrOne('w:vMerge', successors=_tag_seq[5:])
+    tcBorders = ZeroOrOne('w:tcBorders', successors=_tag_seq[6:])
+    shd = ZeroOrOne('w:shd', successors=_tag_seq[7:])
     vAlign = ZeroOrOne('w:vAlign', successors=_tag_seq[12:])
     del _tag_seq
 
+    def set_borders(self, borders):
+        """
+        Replace the borders of this cell with those in *borders*, a mapping
+        of edge name, like 'top' or 'insideH', to a border style such as
+        'single' or 'double'. Each border is a half-point line in the
+        automatic color.
+        """
+        self._remove_tcBorders()
+        tcBorders = self._add_tcBorders()
+        for edge in CT_TcBorders.edges:
+            val = borders.get(edge)
+            if val is None:
+                continue
+            border = getattr(tcBorders, '_add_%s' % edge)()
+            border.set(qn('w:val'), val)
+            border.set(qn('w:sz'), '4')
+            border.set(qn('w:space'), '0')
+
     @property
     def grid_span(self):
         """
@@ -781,6 +848,26 @@ class CT_TcPr(BaseOxmlElement):
         if value > 1:
             self.get_or_add_gridSpan().val = value
 
+    @property
+    def shd_fill(self):
+        """
+        The fill color of `w:shd`, as an |RGBColor|, or |None| if this cell
+        is not shaded.
+        """
+        shd = self.shd
+        if shd is None:
+            return None
+        return shd.fill
+
+    @shd_fill.setter
+    def shd_fill(self, value):
+        self._remove_shd()
+        if value is None:
+            return
+        shd = self._add_shd()
+        shd.val = 'clear'
+        shd.fill = value
+
     @property
     def vAlign_val(self):
         """Value of `w:val` attribute on  `w:vAlign` child.
@@ -834,6 +921,29 @@ class CT_TcPr(BaseOxmlElement):
         tcW.width = value
 
 
+class CT_TcBorders(BaseOxmlElement):
+    """
+    ``<w:tcBorders>`` element, specifying the borders of a cell.
+
+    The edge elements, like ``<w:top>``, have no custom element class. The
+    same tags are the edges of ``<w:tcMar>`` and ``<w:tblCellMar>``, where
+    they hold a width rather than a border, and the class of an element is
+    chosen by its tag alone.
+    """
+    edges = ('top', 'left', 'bottom', 'right', 'insideH', 'insideV')
+    _tag_seq = (
+        'w:top', 'w:left', 'w:bottom', 'w:right', 'w:insideH', 'w:insideV',
+        'w:tl2br', 'w:tr2bl'
+    )
+    top = ZeroOrOne('w:top', successors=_tag_seq[1:])
+    left = ZeroOrOne('w:left', successors=_tag_seq[2:])
+    bottom = ZeroOrOne('w:bottom', successors=_tag_seq[3:])
+    right = ZeroOrOne('w:right', successors=_tag_seq[4:])
+    insideH = ZeroOrOne('w:insideH', successors=_tag_seq[5:])
+    insideV = ZeroOrOne('w:insideV', successors=_tag_seq[6:])
+    del _tag_seq
+
+
 class CT_TrPr(BaseOxmlElement):
     """
     ``<w:trPr>`` element, defining table row properties
@@ -892,3 +1002,156 @@ class CT_VMerge(BaseOxmlElement):
     ``<w:vMerge>`` element, specifying vertical merging behavior of a cell.
     """
     val = OptionalAttribute('w:val', ST_Merge, default=ST_Merge.CONTINUE)
+
+
+class _Span(object):
+    """
+    Rectangular region of the grid of a table occupied by one cell, from row
+    *top* and grid column *left* up to, but not including, row *bottom* and
+    grid column *right*.
+    """
+
+    __slots__ = ('top', 'left', 'bottom', 'right', 'is_new')
+
+    def __init__(self, top, left, bottom, right, is_new=False):
+        self.top = top
+        self.left = left
+        self.bottom = bottom
+        self.right = right
+        self.is_new = is_new
+
+
+class _SpanGrid(object):
+    """
+    Model of the spans in the layout grid of *tbl*, on which any number of
+    merges are planned before the XML is changed. Each grid position refers
+    to the |_Span| covering it, so planning a merge touches only the
+    positions in its range.
+    """
+
+    def __init__(self, tbl):
+        super(_SpanGrid, self).__init__()
+        self._trs = tbl.tr_lst
+        self._cells = []
+        self._spans = []
+        self._tcs = {}
+        self._dirty_rows = set()
+        for row_idx, tr in enumerate(self._trs):
+            self._add_row(row_idx, tr)
+
+    def merge(self, row_0, col_0, row_1, col_1):
+        """
+        Plan the merge of the range having the cells at *row_0*, *col_0*
+        and *row_1*, *col_1* as diagonal corners, returning its |_Span|.
+        """
+        a, b = self._span_at(row_0, col_0), self._span_at(row_1, col_1)
+        top, left = min(a.top, b.top), min(a.left, b.left)
+        bottom, right = max(a.bottom, b.bottom), max(a.right, b.right)
+
+        covered = []
+        for row_idx in range(top, bottom):
+            row_spans = self._spans[row_idx]
+            for col_idx in range(left, right):
+                span = row_spans[col_idx] if col_idx < len(row_spans) else None
+                if span is None:
+                    raise InvalidSpanError('not enough grid columns')
+                if (
+                    span.top < top or span.left < left
+                    or span.bottom > bottom or span.right > right
+                ):
+                    raise InvalidSpanError('requested span not rectangular')
+                if not covered or covered[-1] is not span:
+                    covered.append(span)
+        if len(covered) == 1:
+            return covered[0]
+
+        merged = _Span(top, left, bottom, right, is_new=True)
+        for row_idx in range(top, bottom):
+            self._spans[row_idx][left:right] = [merged] * (right - left)
+            self._dirty_rows.add(row_idx)
+        return merged
+
+    def rewrite(self):
+        """
+        Change the cells of each row having a planned merge, top to bottom,
+        so the table has the planned spans.
+        """
+        for row_idx in sorted(self._dirty_rows):
+            row_spans = self._spans[row_idx]
+            keeper = None
+            for tc, left, width in self._cells[row_idx]:
+                span = row_spans[left]
+                if not span.is_new:
+                    continue
+                tc._move_content_to(self._tcs[(span.top, span.left)])
+                if left != span.left:
+                    keeper._add_width_of(tc)
+                    tc._remove()
+                    continue
+                keeper = tc
+                tc.grid_span = span.right - span.left
+                if row_idx > span.top:
+                    tc.vMerge = ST_Merge.CONTINUE
+                elif span.bottom - span.top > 1:
+                    tc.vMerge = ST_Merge.RESTART
+                else:
+                    tc.vMerge = None
+        self._dirty_rows.clear()
+
+    def top_tc(self, span):
+        """
+        The ``<w:tc>`` at the top-left of the span now covering the top-left
+        of *span*, which may since have been merged into a larger span.
+        """
+        span = self._spans[span.top][span.left]
+        return self._tcs[(span.top, span.left)]
+
+    def _add_row(self, row_idx, tr):
+        """
+        Add the cells of *tr* to the model, a continuation cell extending
+        the span above it when the two line up.
+        """
+        above = self._spans[row_idx - 1] if row_idx else []
+        cells, row_spans, left = [], [], 0
+        for tc in tr.tc_lst:
+            width = tc.grid_span
+            right = left + width
+            span = above[left] if left < len(above) else None
+            if not (
+                tc.vMerge == ST_Merge.CONTINUE and span is not None
+                and span.left == left and span.right == right
+                and span.bottom == row_idx
+            ):
+                span = _Span(row_idx, left, row_idx + 1, right)
+                self._tcs[(row_idx, left)] = tc
+            span.bottom = row_idx + 1
+            cells.append((tc, left, width))
+            row_spans.extend([span] * width)
+            left = right
+        self._cells.append(cells)
+        self._spans.append(row_spans)
+
+    def _span_at(self, row_idx, col_idx):
+        """
+        The |_Span| covering the cell at *row_idx* and *col_idx*. Raises
+        |IndexError| when there is no cell there.
+        """
+        if not (0 <= row_idx < len(self._spans)):
+            raise IndexError('row index [%d] out of range' % row_idx)
+        row_spans = self._spans[row_idx]
+        if not (0 <= col_idx < len(row_spans)):
+            raise IndexError('column index [%d] out of range' % col_idx)
+        return row_spans[col_idx]
+
+
+def _element_key(element):
+    """
+    Return a hashable value equal for any two elements having the same tag,
+    attributes, text and children, used to find cells having the same
+    properties. It is cheaper than serializing *element*, which repeats the
+    namespace declarations in scope.
+    """
+    return (
+        element.tag, tuple(element.attrib.items()), element.text,
+        tuple(_element_key(child) for child in element)
+    )
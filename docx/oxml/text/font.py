@@ -89,6 +89,7 @@ class CT_RPr(BaseOxmlElement):
     cs = ZeroOrOne('w:cs', successors=_tag_seq[34:])
     specVanish = ZeroOrOne('w:specVanish', successors=_tag_seq[38:])
     oMath = ZeroOrOne('w:oMath', successors=_tag_seq[39:])
+    _child_ranks = dict((qn(tag), idx) for idx, tag in enumerate(_tag_seq))
     del _tag_seq
 
     def _new_color(self):
@@ -4,6 +4,8 @@
 Custom element classes related to text runs (CT_R).
 """
 
+import re
+
 from ..ns import qn
 from ..simpletypes import ST_BrClear, ST_BrType
 from ..xmlchemy import (
@@ -117,11 +119,13 @@ class _RunContentAppender(object):
     sequences of regular characters are appended in a single ``<w:t>``
     element. Each tab character ('\t') causes a ``<w:tab/>`` element to be
     appended. Likewise a newline or carriage return character ('\n', '\r')
-    causes a ``<w:cr>`` element to be appended.
+    causes a ``<w:br/>`` element to be appended.
     """
+
+    _separator_patt = re.compile('([\t\r\n])')
+
     def __init__(self, r):
         self._r = r
-        self._bfr = []
 
     @classmethod
     def append_to_run_from_text(cls, r, text):
@@ -136,31 +140,23 @@ class _RunContentAppender(object):
     def add_text(self, text):
         """
         Append the run content elements corresponding to *text* to the
-        ``<w:r>`` element of this instance.
-        """
-        for char in text:
-            self.add_char(char)
-        self.flush()
-
-    def add_char(self, char):
-        """
-        Process the next character of input through the translation finite
-        state maching (FSM). There are two possible states, buffer pending
-        and not pending, but those are hidden behind the ``.flush()`` method
-        which must be called at the end of text to ensure any pending
-        ``<w:t>`` element is written.
-        """
-        if char == '\t':
-            self.flush()
-            self._r.add_tab()
-        elif char in '\r\n':
-            self.flush()
-            self._r.add_br()
-        else:
-            self._bfr.append(char)
-
-    def flush(self):
-        text = ''.join(self._bfr)
-        if text:
-            self._r.add_t(text)
-        del self._bfr[:]
+        ``<w:r>`` element of this instance. *text* is segmented on tab and
+        line-break characters in a single pass and the resulting elements are
+        appended together.
+        """
+        r = self._r
+        new_elms = []
+        for segment in self._separator_patt.split(text):
+            if not segment:
+                continue
+            if segment == '\t':
+                new_elms.append(r._new_tab())
+            elif segment in '\r\n':
+                new_elms.append(r._new_br())
+            else:
+                t = r._new_t()
+                t.text = segment
+                if len(segment.strip()) < len(segment):
+                    t.set(qn('xml:space'), 'preserve')
+                new_elms.append(t)
+        r.extend(new_elms)
@@ -721,6 +721,26 @@ class _OxmlElementBase(etree.ElementBase):
             self.append(elm)
         return elm
 
+    def merge_children(self, children):
+        """
+        Add each element in *children* to this element, rebuilding the child
+        sequence in a single step such that each child appears in schema
+        order. Relies on a `_child_ranks` class attribute mapping the Clark
+        name of each known child tag to its position in the sequence. An
+        existing child with an unknown tag keeps its place after the child
+        that precedes it.
+        """
+        ranks = self._child_ranks
+        keyed = []
+        rank = -1
+        for child in self:
+            rank = ranks.get(child.tag, rank)
+            keyed.append((rank, len(keyed), child))
+        for child in children:
+            keyed.append((ranks.get(child.tag, len(ranks)), len(keyed), child))
+        keyed.sort(key=lambda item: item[:2])
+        self[:] = [child for _, _, child in keyed]
+
     def remove_all(self, *tagnames):
         """
         Remove all child elements whose tagname (e.g. 'a:p') appears in
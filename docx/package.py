@@ -52,6 +52,7 @@ class ImageParts(object):
 
     def __init__(self):
         self._image_parts = []
+        self._image_parts_by_sha1 = None
 
     def __contains__(self, item):
         return self._image_parts.__contains__(item)
@@ -64,6 +65,8 @@ class ImageParts(object):
 
     def append(self, item):
         self._image_parts.append(item)
+        if self._image_parts_by_sha1 is not None:
+            self._image_parts_by_sha1.setdefault(item.sha1, item)
 
     def get_or_add_image_part(self, image_descriptor):
         """Return |ImagePart| object containing image identified by *image_descriptor*.
@@ -90,12 +93,15 @@ class ImageParts(object):
     def _get_by_sha1(self, sha1):
         """
         Return the image part in this collection having a SHA1 hash matching
-        *sha1*, or |None| if not found.
+        *sha1*, or |None| if not found. The hashes are computed once, on first
+        lookup, and kept up to date as image parts are appended.
         """
-        for image_part in self._image_parts:
-            if image_part.sha1 == sha1:
-                return image_part
-        return None
+        if self._image_parts_by_sha1 is None:
+            by_sha1 = {}
+            for image_part in reversed(self._image_parts):
+                by_sha1[image_part.sha1] = image_part
+            self._image_parts_by_sha1 = by_sha1
+        return self._image_parts_by_sha1.get(sha1)
 
     def _next_image_partname(self, ext):
         """
@@ -106,7 +112,7 @@ class ImageParts(object):
         """
         def image_partname(n):
             return PackURI('/word/media/image%d.%s' % (n, ext))
-        used_numbers = [image_part.partname.idx for image_part in self]
+        used_numbers = set(image_part.partname.idx for image_part in self)
         for n in range(1, len(self)+1):
             if n not in used_numbers:
                 return image_partname(n)
@@ -11,7 +11,8 @@ from docx.parts.numbering import NumberingPart
 from docx.parts.settings import SettingsPart
 from docx.parts.story import BaseStoryPart
 from docx.parts.styles import StylesPart
-from docx.shape import InlineShapes
+from docx.search import TextIndex
+from docx.section import SectionMap
 from docx.shared import lazyproperty
 
 
@@ -24,6 +25,8 @@ class DocumentPart(BaseStoryPart):
     objects provides access to this part object for that purpose.
     """
 
+    _text_index = None
+
     def add_footer_part(self):
         """Return (footer_part, rId) pair for newly-created footer part."""
         footer_part = FooterPart.new(self.package)
@@ -36,6 +39,23 @@ class DocumentPart(BaseStoryPart):
         rId = self.relate_to(header_part, RT.HEADER)
         return header_part, rId
 
+    def build_text_index(self):
+        """Return a |TextIndex| newly built over the text of this document.
+
+        The index covers the document body, including tables, and each header and
+        footer part. It is kept as :attr:`text_index`, replacing any earlier one.
+        """
+        stories = [(self.partname, self._element.body)] + sorted(
+            (
+                (rel.target_part.partname, rel.target_part.element)
+                for rel in self.rels.values()
+                if rel.reltype in (RT.HEADER, RT.FOOTER) and not rel.is_external
+            ),
+            key=lambda story: story[0],
+        )
+        self._text_index = TextIndex(stories)
+        return self._text_index
+
     @property
     def core_properties(self):
         """
@@ -81,14 +101,6 @@ class DocumentPart(BaseStoryPart):
         """Return |HeaderPart| related by *rId*."""
         return self.related_parts[rId]
 
-    @lazyproperty
-    def inline_shapes(self):
-        """
-        The |InlineShapes| instance containing the inline shapes in the
-        document.
-        """
-        return InlineShapes(self._element.body, self)
-
     @lazyproperty
     def numbering_part(self):
         """
@@ -103,12 +115,44 @@ class DocumentPart(BaseStoryPart):
             self.relate_to(numbering_part, RT.NUMBERING)
             return numbering_part
 
-    def save(self, path_or_stream):
+    @lazyproperty
+    def section_map(self):
+        """
+        The |SectionMap| indexing the sections of this document, shared by
+        every |Sections| object for it.
+        """
+        return SectionMap(self._element)
+
+    def save(self, path_or_stream, cleanup_namespaces=False, format='zip'):
         """
         Save this document to *path_or_stream*, which can be either a path to
-        a filesystem location (a string) or a file-like object.
+        a filesystem location (a string) or a file-like object, in package
+        format *format*.
         """
-        self.package.save(path_or_stream)
+        self.package.save(path_or_stream, cleanup_namespaces, format)
+
+    def save_incremental(self, path_or_stream):
+        """
+        Save this document to the existing package at *path_or_stream*,
+        recompressing only the package members that have changed.
+        """
+        self.package.save_incremental(path_or_stream)
+
+    @property
+    def text_index(self):
+        """
+        The |TextIndex| most recently built by :meth:`build_text_index`, or
+        |None| if no index has been built.
+        """
+        return self._text_index
+
+    @property
+    def style_resolver(self):
+        """
+        A |StyleResolver| object that resolves the effective formatting of
+        runs and paragraphs in this document.
+        """
+        return self._styles_part.style_resolver
 
     @property
     def settings(self):
@@ -126,6 +170,11 @@ class DocumentPart(BaseStoryPart):
         """
         return self._styles_part.styles
 
+    @property
+    def _story_element(self):
+        """The `w:body` element, containing the content of the document."""
+        return self._element.body
+
     @property
     def _settings_part(self):
         """
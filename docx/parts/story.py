@@ -7,6 +7,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.part import XmlPart
 from docx.oxml.shape import CT_Inline
+from docx.shape import InlineShapes, ShapeIndex
 from docx.shared import lazyproperty
 
 
@@ -18,6 +19,13 @@ class BaseStoryPart(XmlPart):
     `.add_paragraph()`, `.add_table()` etc.
     """
 
+    @lazyproperty
+    def drawing_shapes(self):
+        """|InlineShapes| object for the inline and floating shapes in this story."""
+        return InlineShapes(
+            self._story_element, self, self.shape_index, anchored=True
+        )
+
     def get_or_add_image(self, image_descriptor):
         """Return (rId, image) pair for image identified by *image_descriptor*.
 
@@ -47,6 +55,11 @@ class BaseStoryPart(XmlPart):
         """
         return self._document_part.get_style_id(style_or_name, style_type)
 
+    @lazyproperty
+    def inline_shapes(self):
+        """|InlineShapes| object for the inline shapes in this story."""
+        return InlineShapes(self._story_element, self, self.shape_index)
+
     def new_pic_inline(self, image_descriptor, width, height):
         """Return a newly-created `w:inline` element.
 
@@ -56,6 +69,7 @@ class BaseStoryPart(XmlPart):
         rId, image = self.get_or_add_image(image_descriptor)
         cx, cy = image.scaled_dimensions(width, height)
         shape_id, filename = self.next_id, image.filename
+        self.shape_index.invalidate()
         return CT_Inline.new_pic_inline(shape_id, rId, filename, cx, cy)
 
     @property
@@ -72,7 +86,17 @@ class BaseStoryPart(XmlPart):
             return 1
         return max(used_ids) + 1
 
+    @lazyproperty
+    def shape_index(self):
+        """|ShapeIndex| of the drawings in this story, shared by its shape sequences."""
+        return ShapeIndex(self._story_element)
+
     @lazyproperty
     def _document_part(self):
         """|DocumentPart| object for this package."""
         return self.package.main_document_part
+
+    @property
+    def _story_element(self):
+        """Element containing the content of this story, the root element by default."""
+        return self._element
@@ -14,6 +14,8 @@ from ..opc.constants import CONTENT_TYPE as CT
 from ..opc.packuri import PackURI
 from ..opc.part import XmlPart
 from ..oxml import parse_xml
+from ..shared import lazyproperty
+from ..styles.resolver import StyleResolver
 from ..styles.styles import Styles
 
 
@@ -33,6 +35,14 @@ class StylesPart(XmlPart):
         element = parse_xml(cls._default_styles_xml())
         return cls(partname, content_type, element, package)
 
+    @lazyproperty
+    def style_resolver(self):
+        """
+        The |StyleResolver| instance that resolves and caches the style
+        cascade of this styles part.
+        """
+        return StyleResolver(self.element)
+
     @property
     def styles(self):
         """
@@ -0,0 +1,387 @@
+# encoding: utf-8
+
+"""Find and replace over paragraph text, including matches that span runs.
+
+The text of a paragraph is usually split across several runs, and Word splits it
+further for reasons that are invisible to the user, such as spell-check state. Each
+paragraph is therefore searched through a |ParagraphText| index, which joins the text
+of all its runs and maps each character offset back to the `w:t` (or `w:tab`, `w:br`,
+`w:cr`) element it came from. A regular expression runs once against the joined text
+and each replacement rewrites only the elements the match touches. Replacement text
+takes on the formatting of the run where the match begins.
+
+For many queries against the same document, a |TextIndex| maps each word to the
+paragraphs and offsets where it occurs, so a term or phrase query costs a few dict
+lookups rather than a pass over the document.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import re
+
+from bisect import bisect_right
+from collections import namedtuple
+
+from lxml import etree
+
+from docx.compat import is_string
+from docx.oxml import OxmlElement
+from docx.oxml.ns import nsmap, qn
+
+
+_text_nodes_xpath = etree.XPath(
+    './w:r/*[self::w:t or self::w:tab or self::w:br or self::w:cr]'
+    ' | ./w:hyperlink/w:r/*[self::w:t or self::w:tab or self::w:br or self::w:cr]',
+    namespaces=nsmap,
+)
+
+_word_patt = re.compile(r'\w+', re.UNICODE)
+
+_node_text = {qn('w:tab'): '\t', qn('w:br'): '\n', qn('w:cr'): '\n'}
+
+
+class ParagraphText(object):
+    """Offset index over the run text of `w:p` element *p*.
+
+    :attr:`text` is `Paragraph.text` plus the text of runs in hyperlinks, which
+    `Paragraph.text` leaves out. :meth:`locate` maps a character offset in it to
+    the run content element holding that character.
+    """
+
+    __slots__ = ('_p', '_nodes', '_starts', 'text')
+
+    def __init__(self, p):
+        self._p = p
+        self._nodes = nodes = _text_nodes_xpath(p)
+        self._starts = starts = []
+        pieces = []
+        offset = 0
+        t_tag = qn('w:t')
+        for node in nodes:
+            starts.append(offset)
+            piece = (node.text or '') if node.tag == t_tag else _node_text[node.tag]
+            pieces.append(piece)
+            offset += len(piece)
+        self.text = ''.join(pieces)
+
+    def locate(self, offset):
+        """Return (element, offset_in_element) for character *offset* of the text."""
+        idx = bisect_right(self._starts, offset) - 1
+        return self._nodes[idx], offset - self._starts[idx]
+
+    def replace(self, spans):
+        """Replace the text at each (start, end, text) in *spans*.
+
+        The spans must not overlap. Replacement text is inserted into the run where
+        its span starts, with tab and newline characters becoming `w:tab` and
+        `w:br` elements. Elements wholly inside a span are removed.
+        """
+        for start, end, text in sorted(spans, key=lambda span: span[0], reverse=True):
+            self._splice(start, end, text)
+
+    def _splice(self, start, end, text):
+        nodes, starts = self._nodes, self._starts
+        first = bisect_right(starts, start) - 1
+        node = nodes[first]
+        offset = start - starts[first]
+        new_elms = _run_content(text)
+
+        if node.tag != qn('w:t'):
+            # ---a tab or break is one character, wholly replaced or not at all---
+            if end == start and offset == 0:
+                for elm in new_elms:
+                    node.addprevious(elm)
+                return
+            head, tail = None, ''
+        else:
+            head, tail = node.text[:offset], node.text[offset:]
+
+        if end > start:
+            last = bisect_right(starts, end - 1) - 1
+            if last == first:
+                tail = tail[end - start:]
+            else:
+                tail = ''
+                last_node = nodes[last]
+                if last_node.tag == qn('w:t') and last_node.text[end - starts[last]:]:
+                    _set_t_text(last_node, last_node.text[end - starts[last]:])
+                else:
+                    _remove(last_node)
+                for middle_node in nodes[first + 1:last]:
+                    _remove(middle_node)
+
+        if tail:
+            new_elms.append(_new_t(tail))
+        anchor = node
+        for elm in new_elms:
+            anchor.addnext(elm)
+            anchor = elm
+        if head:
+            _set_t_text(node, head)
+        elif end > start or head == '':
+            _remove(node)
+
+
+def find(element, pattern, flags=0):
+    """Generate (p, match) pair for each match of *pattern* in *element*.
+
+    *element* is a `w:body`, `w:hdr`, `w:ftr`, or any other element containing
+    paragraphs; paragraphs nested in tables are searched too. *pattern* is a
+    regular expression string or compiled pattern.
+    """
+    regex = _compile(pattern, flags)
+    for p in element.iter(qn('w:p')):
+        text = ParagraphText(p).text
+        for match in regex.finditer(text):
+            yield p, match
+
+
+def replace(element, pattern, repl, flags=0, index=None):
+    """Replace each match of *pattern* in paragraphs of *element* with *repl*.
+
+    *repl* is a string, in which backslash escapes such as ``\\1`` are expanded as
+    for :func:`re.sub`, or a function taking a match and returning the replacement
+    string. When *index* is a |TextIndex|, the paragraphs changed are updated in it.
+    Returns the number of replacements made.
+    """
+    total = 0
+    for p, count in _replace(element, pattern, repl, flags):
+        if index is not None:
+            index.update(p)
+        total += count
+    return total
+
+
+def replace_many(element, replacements, index=None):
+    """Replace each key of *replacements* with its value, in a single pass.
+
+    The keys are literal strings. They are combined into one alternation, tried
+    longest first, so each paragraph is scanned just once however many keys there
+    are; where keys overlap the leftmost, then longest, match wins. *index* is as
+    for :func:`replace`. Returns the number of replacements made.
+    """
+    if not replacements:
+        return 0
+    regex, repl = _replacements_pattern(replacements)
+    return replace(element, regex, repl, index=index)
+
+
+IndexHit = namedtuple('IndexHit', ('partname', 'p', 'start', 'end'))
+IndexHit.__doc__ = """
+Location of a term or phrase found by |TextIndex|: the partname of the story, such
+as '/word/document.xml' or '/word/header1.xml', the `w:p` element, and the start and
+end character offsets of the match in the paragraph text."""
+
+
+class TextIndex(object):
+    """Inverted index of the words in the paragraphs of one or more stories.
+
+    *stories* is a sequence of (partname, element) pairs, where element is the
+    `w:body`, `w:hdr` or `w:ftr` element of the story. Words are runs of letters and
+    digits, compared case-insensitively.
+
+    `Document.replace` and `Document.replace_many` update the index as they change
+    paragraphs. Other edits are not tracked. :meth:`search` checks the text of each
+    paragraph it is about to return and re-indexes any that changed or left the
+    document, so a hit is never stale. It cannot see a paragraph that is added or
+    that gains a word through another API, though. Call :meth:`update` with the
+    paragraphs changed, or :meth:`refresh` to re-examine the whole document.
+    """
+
+    def __init__(self, stories):
+        super(TextIndex, self).__init__()
+        self._stories = list(stories)
+        self._story_order = dict(
+            (element, idx) for idx, (_, element) in enumerate(self._stories)
+        )
+        # ---word -> {p: [(word_position, start, end), ...]}---
+        self._postings = {}
+        # ---p -> (story_idx, sequence, text, words)---
+        self._paragraphs = {}
+        self._next_sequence = 0
+        self.refresh()
+
+    def refresh(self):
+        """Bring the index up to date with the whole document.
+
+        Paragraphs are renumbered in document order, paragraphs no longer in the
+        document are dropped, and only paragraphs whose text changed are
+        re-tokenized.
+        """
+        seen = set()
+        sequence = 0
+        for story_idx, (_, element) in enumerate(self._stories):
+            for p in element.iter(qn('w:p')):
+                seen.add(p)
+                self._index(p, story_idx, sequence)
+                sequence += 1
+        self._next_sequence = sequence
+        for p in [p for p in self._paragraphs if p not in seen]:
+            self._drop(p)
+
+    def search(self, query):
+        """Return list of |IndexHit| for each occurrence of the words in *query*.
+
+        A single word is a term query; several words are a phrase query, matching
+        only where the words occur consecutively in one paragraph, regardless of the
+        punctuation and whitespace between them. Hits are in document order. A
+        paragraph having the words whose text has changed since it was indexed is
+        re-indexed first.
+        """
+        words = [match.group(0).lower() for match in _word_patt.finditer(query)]
+        if not words:
+            return []
+        postings = [self._postings.get(word) for word in words]
+        if not all(postings):
+            return []
+
+        candidates = [
+            p for p in min(postings, key=len)
+            if all(p in posting for posting in postings)
+        ]
+        stale = [p for p in candidates if not self._is_current(p)]
+        if stale:
+            self.update(*stale)
+            return self.search(query)
+
+        hits = []
+        for p in candidates:
+            positions = [
+                set(position for position, _, _ in posting[p])
+                for posting in postings[1:]
+            ]
+            last_ends = dict(
+                (position, end) for position, _, end in postings[-1][p]
+            )
+            for position, start, _ in postings[0][p]:
+                if all(
+                    position + offset + 1 in word_positions
+                    for offset, word_positions in enumerate(positions)
+                ):
+                    end = last_ends[position + len(words) - 1]
+                    hits.append(self._hit(p, start, end))
+        hits.sort(key=self._sort_key)
+        return hits
+
+    def update(self, *paragraphs):
+        """Re-index each of *paragraphs* after it has been changed.
+
+        Each item is a |Paragraph| object or a `w:p` element. A paragraph newly
+        added to the document is indexed, and one no longer in the document is
+        dropped. A new paragraph sorts after the existing ones until the next
+        :meth:`refresh`.
+        """
+        for paragraph in paragraphs:
+            p = getattr(paragraph, '_p', paragraph)
+            story_idx = self._story_of(p)
+            if story_idx is None:
+                self._drop(p)
+                continue
+            entry = self._paragraphs.get(p)
+            if entry is None:
+                sequence = self._next_sequence
+                self._next_sequence += 1
+            else:
+                sequence = entry[1]
+            self._index(p, story_idx, sequence)
+
+    def _drop(self, p):
+        entry = self._paragraphs.pop(p, None)
+        if entry is None:
+            return
+        for word in entry[3]:
+            posting = self._postings[word]
+            del posting[p]
+            if not posting:
+                del self._postings[word]
+
+    def _hit(self, p, start, end):
+        partname = self._stories[self._paragraphs[p][0]][0]
+        return IndexHit(partname, p, start, end)
+
+    def _index(self, p, story_idx, sequence):
+        """Add or refresh the entry for *p*, re-tokenizing only if its text changed."""
+        text = ParagraphText(p).text
+        entry = self._paragraphs.get(p)
+        if entry is not None and entry[2] == text:
+            self._paragraphs[p] = (story_idx, sequence, text, entry[3])
+            return
+        self._drop(p)
+        words = set()
+        for position, match in enumerate(_word_patt.finditer(text)):
+            word = match.group(0).lower()
+            words.add(word)
+            self._postings.setdefault(word, {}).setdefault(p, []).append(
+                (position, match.start(), match.end())
+            )
+        self._paragraphs[p] = (story_idx, sequence, text, frozenset(words))
+
+    def _is_current(self, p):
+        """True if *p* is in the story and has the text it was indexed with."""
+        story_idx, _, text, _ = self._paragraphs[p]
+        return self._story_of(p) == story_idx and ParagraphText(p).text == text
+
+    def _sort_key(self, hit):
+        story_idx, sequence = self._paragraphs[hit.p][:2]
+        return (story_idx, sequence, hit.start)
+
+    def _story_of(self, p):
+        """Return the index of the story containing *p*, or |None| if there is none."""
+        for ancestor in p.iterancestors():
+            story_idx = self._story_order.get(ancestor)
+            if story_idx is not None:
+                return story_idx
+        return None
+
+
+def _replace(element, pattern, repl, flags=0):
+    """Generate (p, count) pair for each paragraph of *element* changed by a replace."""
+    regex = _compile(pattern, flags)
+    expand = repl if callable(repl) else (lambda match: match.expand(repl))
+    for p in list(element.iter(qn('w:p'))):
+        paragraph_text = ParagraphText(p)
+        if not paragraph_text.text:
+            continue
+        spans = [
+            (match.start(), match.end(), expand(match))
+            for match in regex.finditer(paragraph_text.text)
+        ]
+        if spans:
+            paragraph_text.replace(spans)
+            yield p, len(spans)
+
+
+def _replacements_pattern(replacements):
+    """Return (regex, repl) pair that replaces each key of *replacements* at once."""
+    keys = sorted(replacements, key=len, reverse=True)
+    regex = re.compile('|'.join(re.escape(key) for key in keys))
+    return regex, lambda match: replacements[match.group(0)]
+
+
+def _compile(pattern, flags):
+    if is_string(pattern):
+        return re.compile(pattern, flags)
+    return pattern
+
+
+def _new_t(text):
+    t = OxmlElement('w:t')
+    _set_t_text(t, text)
+    return t
+
+
+def _remove(element):
+    element.getparent().remove(element)
+
+
+def _run_content(text):
+    """Return list of run content elements, like `w:t` and `w:tab`, for *text*."""
+    r = OxmlElement('w:r')
+    r.text = text
+    return list(r)
+
+
+def _set_t_text(t, text):
+    t.text = text
+    if len(text.strip()) < len(text):
+        t.set(qn('xml:space'), 'preserve')
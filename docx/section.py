@@ -7,6 +7,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 from docx.blkcntnr import BlockItemContainer
 from docx.compat import Sequence
 from docx.enum.section import WD_HEADER_FOOTER
+from docx.oxml.ns import qn
 from docx.shared import lazyproperty
 
 
@@ -25,16 +26,90 @@ class Sections(Sequence):
         if isinstance(key, slice):
             return [
                 Section(sectPr, self._document_part)
-                for sectPr in self._document_elm.sectPr_lst[key]
+                for sectPr in self._section_map.sectPrs[key]
             ]
-        return Section(self._document_elm.sectPr_lst[key], self._document_part)
+        if key == -1:
+            return Section(self._section_map.last, self._document_part)
+        return Section(self._section_map.sectPrs[key], self._document_part)
 
     def __iter__(self):
-        for sectPr in self._document_elm.sectPr_lst:
+        for sectPr in self._section_map.sectPrs:
             yield Section(sectPr, self._document_part)
 
     def __len__(self):
-        return len(self._document_elm.sectPr_lst)
+        return len(self._section_map.sectPrs)
+
+    @property
+    def _section_map(self):
+        return self._document_part.section_map
+
+
+class SectionMap(object):
+    """Index of the `w:sectPr` elements of *document_elm*, in document order.
+
+    The index is kept by the document part and built when first used. Rather than
+    search the document again, each later use checks that the `w:sectPr` elements it
+    holds are all still in the document and rebuilds it when one is not, as after
+    clearing the body. `Document.add_section`, `Composer.append` and `Template.render`
+    call :meth:`invalidate`; any other change adding a section break, such as
+    inserting copied XML, calls for an explicit
+    ``document.part.section_map.invalidate()``.
+    """
+
+    def __init__(self, document_elm):
+        super(SectionMap, self).__init__()
+        self._document_elm = document_elm
+        self._sectPrs = None
+        self._idxs = {}
+
+    def index(self, sectPr):
+        """Return the position of *sectPr* among the sections, or |None|."""
+        self._refresh()
+        return self._idxs.get(sectPr)
+
+    def invalidate(self):
+        """Cause the index to be rebuilt the next time it is used."""
+        self._sectPrs = None
+
+    @property
+    def last(self):
+        """The `w:sectPr` of the last section.
+
+        This is the `w:sectPr` ending the body when there is one, found without
+        consulting, or building, the index. Raises |IndexError| when the document
+        has no sections.
+        """
+        body = self._document_elm.body
+        if body is not None and len(body) and body[-1].tag == qn('w:sectPr'):
+            return body[-1]
+        return self.sectPrs[-1]
+
+    def preceding(self, sectPr):
+        """Return the `w:sectPr` of the section before that of *sectPr*, or |None|."""
+        idx = self.index(sectPr)
+        if idx is None:
+            return sectPr.preceding_sectPr
+        return self._sectPrs[idx - 1] if idx > 0 else None
+
+    @property
+    def sectPrs(self):
+        """List of the `w:sectPr` elements of the document, in document order."""
+        self._refresh()
+        return self._sectPrs
+
+    def _is_current(self):
+        """True when each `w:sectPr` indexed is still in the document."""
+        document_elm = self._document_elm
+        return all(
+            any(ancestor is document_elm for ancestor in sectPr.iterancestors())
+            for sectPr in self._sectPrs
+        )
+
+    def _refresh(self):
+        if self._sectPrs is not None and self._is_current():
+            return
+        self._sectPrs = self._document_elm.sectPr_lst
+        self._idxs = dict((sectPr, idx) for idx, sectPr in enumerate(self._sectPrs))
 
 
 class Section(object):
@@ -391,7 +466,7 @@ class _Footer(_BaseHeaderFooter):
     @property
     def _prior_headerfooter(self):
         """|_Footer| proxy on prior sectPr element or None if this is first section."""
-        preceding_sectPr = self._sectPr.preceding_sectPr
+        preceding_sectPr = self._document_part.section_map.preceding(self._sectPr)
         return (
             None
             if preceding_sectPr is None
@@ -435,7 +510,7 @@ class _Header(_BaseHeaderFooter):
     @property
     def _prior_headerfooter(self):
         """|_Header| proxy on prior sectPr element or None if this is first section."""
-        preceding_sectPr = self._sectPr.preceding_sectPr
+        preceding_sectPr = self._document_part.section_map.preceding(self._sectPr)
         return (
             None
             if preceding_sectPr is None
@@ -11,24 +11,33 @@ from __future__ import (
 
 from .enum.shape import WD_INLINE_SHAPE
 from .oxml.ns import nsmap
-from .shared import Parented
+from .shared import Parented, lazyproperty
 
 
 class InlineShapes(Parented):
     """
     Sequence of |InlineShape| instances, supporting len(), iteration, and
     indexed access.
+
+    The shapes are those of the ``<w:drawing>`` elements anywhere in the
+    story, including those in tables and in runs nested in hyperlinks or
+    content controls. Only inline shapes are included unless *anchored* is
+    True, in which case floating (anchored) shapes are included too, in
+    document order. The elements are looked up through *shape_index*, shared
+    with the story part, so repeated access does not search the story again.
     """
-    def __init__(self, body_elm, parent):
+    def __init__(self, body_elm, parent, shape_index=None, anchored=False):
         super(InlineShapes, self).__init__(parent)
         self._body = body_elm
+        self._shape_index = shape_index
+        self._anchored = anchored
 
     def __getitem__(self, idx):
         """
         Provide indexed access, e.g. 'inline_shapes[idx]'
         """
         try:
-            inline = self._inline_lst[idx]
+            inline = self._index.get(idx, self._anchored)
         except IndexError:
             msg = "inline shape index [%d] out of range" % idx
             raise IndexError(msg)
@@ -40,11 +49,94 @@ class InlineShapes(Parented):
     def __len__(self):
         return len(self._inline_lst)
 
+    def scale_to_fit(self, max_width=None, max_height=None):
+        """
+        Shrink each shape larger than *max_width* or *max_height* to fit
+        within them, keeping its aspect ratio. Either limit can be |None|,
+        meaning no limit in that direction. Shapes already small enough are
+        left as they are. Returns the number of shapes resized.
+        """
+        count = 0
+        for inline in self._inline_lst:
+            extent = inline.extent
+            cx, cy = extent.cx, extent.cy
+            scale = 1.0
+            if max_width is not None and cx > max_width:
+                scale = min(scale, max_width / cx)
+            if max_height is not None and cy > max_height:
+                scale = min(scale, max_height / cy)
+            if scale == 1.0:
+                continue
+            _set_size(inline, int(round(cx * scale)), int(round(cy * scale)))
+            count += 1
+        return count
+
+    @lazyproperty
+    def _index(self):
+        if self._shape_index is not None:
+            return self._shape_index
+        return ShapeIndex(self._body)
+
     @property
     def _inline_lst(self):
-        body = self._body
-        xpath = '//w:p/w:r/w:drawing/wp:inline'
-        return body.xpath(xpath)
+        return self._index.drawings(self._anchored)
+
+
+class ShapeIndex(object):
+    """List of the inline and anchored drawing elements in *story_elm*.
+
+    The index is kept by the story part and built when first used. Rather than search
+    the story again, each later use checks that the drawings it holds are all still in
+    the story, a walk up from each drawing, and rebuilds it when one is not, as after
+    clearing a paragraph holding a picture. Adding a picture, `Composer.append` and
+    `Template.render` call :meth:`invalidate`; any other change adding a drawing, such
+    as inserting copied XML, calls for an explicit ``part.shape_index.invalidate()``
+    on the part of the story.
+    """
+
+    def __init__(self, story_elm):
+        super(ShapeIndex, self).__init__()
+        self._story_elm = story_elm
+        self._inlines = None
+        self._drawings = None
+
+    def drawings(self, anchored=False):
+        """List of `wp:inline` elements, including `wp:anchor` when *anchored*."""
+        self._refresh()
+        if not anchored:
+            return self._inlines
+        if self._drawings is None:
+            self._drawings = self._story_elm.xpath(
+                './/w:drawing/wp:inline | .//w:drawing/wp:anchor'
+            )
+        return self._drawings
+
+    def get(self, idx, anchored=False):
+        """Return drawing element at *idx*.
+
+        Raises |IndexError| when *idx* is out of range.
+        """
+        return self.drawings(anchored)[idx]
+
+    def invalidate(self):
+        """Cause the index to be rebuilt the next time it is used."""
+        self._inlines = None
+        self._drawings = None
+
+    def _is_current(self):
+        """True when each drawing indexed is still in the story."""
+        drawings = self._inlines if self._drawings is None else self._drawings
+        return all(self._is_in_story(drawing) for drawing in drawings)
+
+    def _is_in_story(self, element):
+        story_elm = self._story_elm
+        return any(ancestor is story_elm for ancestor in element.iterancestors())
+
+    def _refresh(self):
+        if self._inlines is not None and self._is_current():
+            return
+        self._drawings = None
+        self._inlines = self._story_elm.xpath('.//w:drawing/wp:inline')
 
 
 class InlineShape(object):
@@ -67,7 +159,9 @@ class InlineShape(object):
     @height.setter
     def height(self, cy):
         self._inline.extent.cy = cy
-        self._inline.graphic.graphicData.pic.spPr.cy = cy
+        pic = self._inline.graphic.graphicData.pic
+        if pic is not None:
+            pic.spPr.cy = cy
 
     @property
     def type(self):
@@ -100,4 +194,16 @@ class InlineShape(object):
     @width.setter
     def width(self, cx):
         self._inline.extent.cx = cx
-        self._inline.graphic.graphicData.pic.spPr.cx = cx
+        pic = self._inline.graphic.graphicData.pic
+        if pic is not None:
+            pic.spPr.cx = cx
+
+
+def _set_size(inline, cx, cy):
+    """Set the display size of drawing *inline*, and of the picture it contains."""
+    inline.extent.cx = cx
+    inline.extent.cy = cy
+    pic = inline.graphic.graphicData.pic
+    if pic is not None:
+        pic.spPr.cx = cx
+        pic.spPr.cy = cy
@@ -6,6 +6,8 @@ Objects shared by docx modules.
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+from copy import deepcopy
+
 
 class Length(int):
     """
@@ -248,3 +250,93 @@ class Parented(object):
         The package part containing this object
         """
         return self._parent.part
+
+
+class FormatSpec(object):
+    """
+    A set of formatting property values, built once and applied to any number
+    of |Font| or |ParagraphFormat| objects. Created using
+    :meth:`.Font.spec` or :meth:`.ParagraphFormat.spec`.
+
+    A property value that does not depend on the formatting already present
+    is stored as a prototype child element, a copy of which is inserted into
+    each target. The remaining values are assigned by the property setters
+    on a detached copy of the child elements they affect. Either way the
+    target's `w:rPr` or `w:pPr` element is rebuilt just once.
+    """
+
+    # ---prototype child elements by (format class, property, value); the
+    # ---values in use in a document are few, so this stays small---
+    _prototype_cache = {}
+
+    def __init__(self, format_cls, properties):
+        super(FormatSpec, self).__init__()
+        tags = format_cls._property_tags
+        for name in properties:
+            if name not in tags:
+                raise TypeError(
+                    "%s has no property '%s'" % (format_cls.__name__, name)
+                )
+        items = sorted(properties.items(), key=lambda item: item[0])
+        property_tags = [tags[name] for name, _ in items]
+        contextual_tags = set(
+            tag for (name, _), tag in zip(items, property_tags)
+            if name in format_cls._contextual_properties
+            or property_tags.count(tag) > 1
+        )
+
+        self._format_cls = format_cls
+        self._tags = frozenset(property_tags)
+        self._contextual_tags = frozenset(contextual_tags)
+        self._contextual = []
+        self._prototypes = []
+        for name, value in items:
+            if tags[name] in contextual_tags:
+                self._contextual.append((name, value))
+            else:
+                self._prototypes.extend(self._prototype(name, value))
+
+    def apply(self, *formats):
+        """
+        Apply these property values to each |Font| or |ParagraphFormat|
+        object in *formats*.
+        """
+        for format_ in formats:
+            self._apply(format_)
+
+    def _apply(self, format_):
+        format_cls = self._format_cls
+        properties = format_cls._get_or_add_properties(format_._element)
+        tags, contextual_tags = self._tags, self._contextual_tags
+
+        if self._contextual:
+            scratch_parent = format_cls._new_properties_parent()
+            scratch = format_cls._get_or_add_properties(scratch_parent)
+        for child in list(properties):
+            if child.tag in contextual_tags:
+                scratch.append(child)
+            elif child.tag in tags:
+                properties.remove(child)
+
+        children = [deepcopy(prototype) for prototype in self._prototypes]
+        if self._contextual:
+            scratch_format = format_cls(scratch_parent)
+            for name, value in self._contextual:
+                scratch_format._set_property(name, value)
+            children.extend(list(scratch))
+        properties.merge_children(children)
+
+    def _prototype(self, name, value):
+        """
+        Return list of the child elements produced by assigning *value* to
+        property *name* of an empty properties element.
+        """
+        format_cls = self._format_cls
+        key = (format_cls, name, value)
+        prototype = self._prototype_cache.get(key)
+        if prototype is None:
+            parent = format_cls._new_properties_parent()
+            format_cls(parent)._set_property(name, value)
+            prototype = list(format_cls._get_or_add_properties(parent))
+            self._prototype_cache[key] = prototype
+        return prototype
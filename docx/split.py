@@ -0,0 +1,180 @@
+# encoding: utf-8
+
+"""Splitting of one document into several, by heading or by section.
+
+Both splitters make a single pass over the body of the source document and generate
+one new |Document| object per piece, each ready to be saved::
+
+    for idx, chapter in enumerate(by_heading(Document('filing.docx'), level=1)):
+        chapter.save('chapter-%d.docx' % idx)
+
+The pieces are built directly from the parts already loaded for the source, so
+nothing is re-read or re-parsed. Parts describing the document as a whole, such as
+styles, numbering, theme and settings, are shared by every piece rather than copied.
+Each piece relates only to the images, hyperlinks and other parts referenced from its
+own content, under the same relationship ids as in the source, and gets its own copy
+of the headers and footers its sections use. Since shared parts are the same objects
+in every piece, and in the source, a change to, say, the styles of one piece is a
+change to all of them.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from copy import deepcopy
+
+from docx.document import Document
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.oxml.ns import nsmap, qn
+from docx.outline import Outline
+from docx.package import Package
+from docx.parts.document import DocumentPart
+from docx.parts.hdrftr import FooterPart, HeaderPart
+
+
+def by_heading(doc, level=1):
+    """Generate a |Document| for each part of *doc* that begins with a heading.
+
+    A piece begins at each paragraph having a heading level of *level* or higher,
+    where Heading 1 is level 1; so with `level=2` both Heading 1 and Heading 2
+    paragraphs begin a new piece. Any content before the first such heading is a
+    piece of its own. Each piece takes the page layout of the section its last
+    block belongs to.
+    """
+    outline = Outline(_related_element(doc.part, RT.STYLES), None)
+    p_tag = qn('w:p')
+
+    def starts_piece(block, previous):
+        if block.tag != p_tag:
+            return False
+        heading_level = outline.heading_level(block)
+        return heading_level is not None and heading_level <= level
+
+    return _Splitter(doc).split(starts_piece)
+
+
+def by_section(doc):
+    """Generate a |Document| for each section of *doc*, in document order."""
+
+    def starts_piece(block, previous):
+        return previous is not None and _sectPr_of(previous) is not None
+
+    return _Splitter(doc).split(starts_piece)
+
+
+class _Splitter(object):
+    """Builds a new package for each piece of the body of *doc*."""
+
+    def __init__(self, doc):
+        super(_Splitter, self).__init__()
+        self._part = doc.part
+        self._document = doc.element
+        self._body = doc.element.body
+        self._referenced_rIds = set(
+            self._body.xpath('.//@*[namespace-uri()="%s"]' % nsmap['r'])
+        )
+
+    def split(self, starts_piece):
+        """Generate a |Document| for each run of body blocks.
+
+        A piece begins at each block for which ``starts_piece(block, previous)`` is
+        true, *previous* being the block before it, or |None| for the first.
+        """
+        blocks = [child for child in self._body if child.tag != qn('w:sectPr')]
+        sectPrs = self._section_ends(blocks, self._body.sectPr)
+
+        start = 0
+        for idx in range(1, len(blocks) + 1):
+            if idx < len(blocks) and not starts_piece(blocks[idx], blocks[idx - 1]):
+                continue
+            yield self._new_document(blocks[start:idx], sectPrs[idx - 1])
+            start = idx
+
+    def _copy_story_part(self, part, package):
+        """Return a copy of header or footer *part* belonging to *package*."""
+        part_cls = HeaderPart if isinstance(part, HeaderPart) else FooterPart
+        copy = part_cls(
+            part.partname, part.content_type, deepcopy(part.element), package
+        )
+        for rel in part.rels.values():
+            target = rel.target_ref if rel.is_external else rel.target_part
+            copy.load_rel(rel.reltype, target, rel.rId, rel.is_external)
+        return copy
+
+    def _new_document(self, blocks, sectPr):
+        """Return a |Document| in a new package containing copies of *blocks*."""
+        source = self._document
+        document = source.makeelement(source.tag, source.attrib, nsmap=source.nsmap)
+        for child in source:
+            if child is self._body:
+                break
+            document.append(deepcopy(child))
+        body = self._body.makeelement(self._body.tag, self._body.attrib)
+        document.append(body)
+        for block in blocks:
+            body.append(deepcopy(block))
+        if sectPr is not None:
+            # ---a section break ending the piece becomes its final section---
+            last_sectPr = _sectPr_of(body[-1]) if len(body) else None
+            if last_sectPr is not None:
+                last_sectPr.getparent().remove(last_sectPr)
+            body.append(deepcopy(sectPr))
+
+        package = Package()
+        document_part = DocumentPart(
+            self._part.partname, self._part.content_type, document, package
+        )
+        for rel in self._part.package.rels.values():
+            if rel.is_external:
+                target = rel.target_ref
+            elif rel.target_part is self._part:
+                target = document_part
+            else:
+                target = rel.target_part
+            package.load_rel(rel.reltype, target, rel.rId, rel.is_external)
+
+        rIds = set(body.xpath('.//@*[namespace-uri()="%s"]' % nsmap['r']))
+        for rId, rel in self._part.rels.items():
+            if rId in self._referenced_rIds and rId not in rIds:
+                continue
+            if rel.is_external:
+                document_part.load_rel(rel.reltype, rel.target_ref, rId, True)
+                continue
+            target = rel.target_part
+            if isinstance(target, (HeaderPart, FooterPart)):
+                target = self._copy_story_part(target, package)
+            document_part.load_rel(rel.reltype, target, rId)
+
+        package.after_unmarshal()
+        return Document(document, document_part)
+
+    @staticmethod
+    def _section_ends(blocks, body_sectPr):
+        """Return list of the `w:sectPr` ending the section of each of *blocks*.
+
+        For a block in the last section this is *body_sectPr*, which may be |None|.
+        """
+        sectPrs = [None] * len(blocks)
+        sectPr = body_sectPr
+        for idx in range(len(blocks) - 1, -1, -1):
+            block_sectPr = _sectPr_of(blocks[idx])
+            if block_sectPr is not None:
+                sectPr = block_sectPr
+            sectPrs[idx] = sectPr
+        return sectPrs
+
+
+def _related_element(part, reltype):
+    try:
+        return part.part_related_by(reltype).element
+    except KeyError:
+        return None
+
+
+def _sectPr_of(block):
+    """Return the `w:pPr/w:sectPr` of *block* if it ends a section, else |None|."""
+    if block.tag != qn('w:p'):
+        return None
+    pPr = block.find(qn('w:pPr'))
+    if pPr is None:
+        return None
+    return pPr.find(qn('w:sectPr'))
@@ -0,0 +1,507 @@
+# encoding: utf-8
+
+"""Writing a very large document without holding its body in memory.
+
+A |DocumentWriter| writes each paragraph, table row or picture given to it straight to
+the `word/document.xml` member of the output package and then lets it go, so memory
+use does not grow with the size of the document::
+
+    with DocumentWriter('letterhead.docx', 'audit.docx') as writer:
+        writer.write_paragraph('Audit log', style='Heading 1')
+        for entry in entries:
+            writer.write_paragraph(entry.text)
+
+Everything outside the body, such as styles, numbering, headers and footers, comes
+from the template and is written to the output package when the writer is created.
+The body of the template is not used, except for its final section properties, which
+are written at the end of the new body so the document keeps the template's page
+layout.
+
+:func:`append` and |DocumentAppender| add blocks to the end of an existing document in
+the same way, without parsing its body. An updated copy of the package is written
+beside it and takes its place once complete, so a failure leaves the document as it
+was. The body is copied a chunk at a time, with the new blocks spliced in before its
+final section properties; every other member is copied as it is, without being
+recompressed, unless it gains new relationships::
+
+    append('log-2024.docx', ['12 March: backup verified', ('Notes', 'Heading 2')])
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import re
+
+from copy import deepcopy
+
+from lxml import etree
+
+from docx.api import Document
+from docx.compat import is_string
+from docx.document import Document as DocumentObject
+from docx.enum.style import WD_STYLE_TYPE
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.package import PartFactory, Unmarshaller
+from docx.opc.packuri import PACKAGE_URI
+from docx.opc.phys_pkg import PhysPkgReader, PhysPkgUpdater, PhysPkgWriter
+from docx.opc.pkgreader import PackageReader
+from docx.opc.pkgwriter import PackageWriter
+from docx.oxml import OxmlElement
+from docx.oxml.ns import NamespacePrefixedTag, qn
+from docx.oxml.shape import CT_Inline
+from docx.oxml.table import CT_Tbl
+from docx.package import Package
+from docx.shape import InlineShape
+from docx.table import _Row, Table
+from docx.tables import _cell_template, _new_tr
+from docx.text.paragraph import Paragraph
+
+# ---the trailing part of the body held back while copying it, which must hold the
+# ---final section properties---
+_TAIL_SIZE = 64 * 1024
+_CHUNK_SIZE = 1024 * 1024
+
+_body_start = re.compile(br'<([\w.-]+:)?body(\s[^>]*)?>')
+_id_attr = re.compile(br'\sid=["\'](\d+)["\']')
+
+
+def append(path, blocks):
+    """Add a paragraph for each of *blocks* to the end of the document at *path*.
+
+    Each item of *blocks* is either a text string or a `(text, style)` pair, as for
+    `Document.append_many()`. The document is changed in place, without its body being
+    loaded; use |DocumentAppender| to also add tables and pictures.
+    """
+    with DocumentAppender(path) as appender:
+        for block in blocks:
+            if is_string(block):
+                appender.write_paragraph(block)
+            else:
+                appender.write_paragraph(*block)
+
+
+class DocumentWriter(object):
+    """Writes a new document to *path_or_stream*, based on *template*.
+
+    *template* is a |Document| object, a path or file-like object for a .docx package,
+    or |None| for the default template. *path_or_stream* is a path or a writable
+    file-like object for the new package.
+
+    Each ``write_*()`` method returns an object for the block it adds, which can be
+    changed until the next call to the writer, when the block is written out; changes
+    made after that are lost. :meth:`close` must be called to complete the package,
+    either directly or by using the writer as a context manager. When the ``with``
+    block raises, the writer is aborted instead, as by :meth:`abort`.
+    """
+
+    def __init__(self, template, path_or_stream):
+        super(DocumentWriter, self).__init__()
+        if not isinstance(template, DocumentObject):
+            template = Document(template)
+        self._set_document(template)
+        self._phys_writer = PhysPkgWriter(path_or_stream)
+        self._written = set()
+        self._write_parts()
+        self._open_body()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def abort(self):
+        """Stop writing without completing the package.
+
+        The package is left without its central directory, so it cannot be mistaken
+        for a complete document, and is removed when it was written to a path.
+        """
+        if self._phys_writer is None:
+            return
+        self._stream.close()
+        self._phys_writer.abort()
+        self._phys_writer = None
+
+    def close(self):
+        """Finish the body of the document and complete the package."""
+        if self._phys_writer is None:
+            return
+        try:
+            self._flush()
+            self._end_table()
+            self._close_body()
+            self._write_package()
+        except BaseException:
+            self.abort()
+            raise
+        self._phys_writer = None
+
+    def end_table(self):
+        """End the table being written, so the next row written starts a new one."""
+        self._flush()
+        self._end_table()
+
+    @property
+    def part(self):
+        """The |DocumentPart| of the template, to which new images are related."""
+        return self._part
+
+    def write_paragraph(self, text='', style=None):
+        """Write a paragraph having *text* and paragraph style *style*.
+
+        Return the new |Paragraph|, which can be given more runs or formatting until
+        the next call to this writer.
+        """
+        self._flush()
+        self._end_table()
+        p = OxmlElement('w:p')
+        paragraph = Paragraph(p, self)
+        if text:
+            paragraph.add_run(text)
+        if style is not None:
+            p.style = self._style_id(style, WD_STYLE_TYPE.PARAGRAPH)
+        self._pending = p
+        return paragraph
+
+    def write_picture(self, image_path_or_stream, width=None, height=None):
+        """Write a paragraph containing the picture at *image_path_or_stream*.
+
+        The picture is sized as for `Document.add_picture()`. Return an |InlineShape|
+        for the picture. An image used more than once is stored only once. Images are
+        held in memory until the writer is closed, as the zip member for the body
+        must be complete before any other member can be written.
+        """
+        paragraph = self.write_paragraph()
+        rId, image = self._part.get_or_add_image(image_path_or_stream)
+        cx, cy = image.scaled_dimensions(width, height)
+        inline = CT_Inline.new_pic_inline(
+            self._next_shape_id, rId, image.filename, cx, cy
+        )
+        self._next_shape_id += 1
+        paragraph._p.add_r().add_drawing(inline)
+        return InlineShape(inline)
+
+    def write_table_row(self, values, style=None):
+        """Write a table row having a cell for the text of each of *values*.
+
+        The first row written after anything other than a table row starts a new
+        table, having a column for each of *values*, spread across the page width, and
+        table style *style*, which is ignored for later rows. Return the new |_Row|.
+        Raises |ValueError| when a later row has a different number of values than
+        the table has columns; call :meth:`end_table` first to start a new table.
+        """
+        values = list(values)
+        if self._table is not None and len(values) != len(self._row_template):
+            raise ValueError(
+                'row has %d values, table has %d columns'
+                % (len(values), len(self._row_template))
+            )
+        self._flush()
+        if self._table is None:
+            self._start_table(len(values), style)
+        tr = _new_tr(self._row_template, ['%s' % (value,) for value in values])
+        self._pending = tr
+        return _Row(tr, self._table)
+
+    def _close_body(self):
+        """Write the final section properties and the end of `word/document.xml`."""
+        sectPr = self._document.element.body.sectPr
+        if sectPr is not None:
+            self._xf.write(deepcopy(sectPr))
+        for context in reversed(self._contexts):
+            context.__exit__(None, None, None)
+        self._stream.close()
+
+    def _end_table(self):
+        if self._table is None:
+            return
+        self._table_context.__exit__(None, None, None)
+        self._table = None
+
+    def _flush(self):
+        """Write out the block most recently added, if not yet written."""
+        if self._pending is None:
+            return
+        self._xf.write(self._pending)
+        self._pending = None
+
+    def _open_body(self):
+        """Start `word/document.xml`, writing up to the start of the body content."""
+        document = self._document.element
+        self._stream = self._phys_writer.open(self._part.partname)
+        xf_context = etree.xmlfile(self._stream, encoding='UTF-8')
+        self._xf = xf = xf_context.__enter__()
+        xf.write_declaration(standalone=True)
+        document_context = xf.element(document.tag, document.attrib, document.nsmap)
+        document_context.__enter__()
+        for child in document:
+            if child is document.body:
+                break
+            xf.write(child)
+        body_context = xf.element(qn('w:body'))
+        body_context.__enter__()
+        self._contexts = [xf_context, document_context, body_context]
+
+    def _set_document(self, document):
+        """Base the blocks written on |Document| object *document*."""
+        self._document = document
+        self._part = document.part
+        self._style_ids = {}
+        self._pending = None
+        self._table = None
+        self._next_shape_id = self._part.next_id
+
+    def _start_table(self, cols, style):
+        """Open a new table of *cols* columns, writing its properties and grid."""
+        section = self._document.sections[-1]
+        width = section.page_width - section.left_margin - section.right_margin
+        tbl = CT_Tbl.new_tbl(0, cols, width)
+        table = Table(tbl, self)
+        if style is not None:
+            tbl.tblStyle_val = self._style_id(style, WD_STYLE_TYPE.TABLE)
+        self._row_template = row_template = OxmlElement('w:tr')
+        for gridCol in tbl.tblGrid.gridCol_lst:
+            row_template.append(_cell_template(table, gridCol.w, None))
+        self._table_context = self._xf.element(qn('w:tbl'))
+        self._table_context.__enter__()
+        self._xf.write(tbl.tblPr)
+        self._xf.write(tbl.tblGrid)
+        self._table = table
+
+    def _style_id(self, style, style_type):
+        """Return the style id for *style*, looking up each style only once."""
+        key = (style, style_type)
+        if key not in self._style_ids:
+            self._style_ids[key] = self._part.get_style_id(style, style_type)
+        return self._style_ids[key]
+
+    def _write_package(self):
+        """Write the members of the package other than `word/document.xml`."""
+        phys_writer = self._phys_writer
+        package = self._part.package
+        parts = list(package.iter_parts())
+        PackageWriter._write_content_types_stream(phys_writer, parts)
+        PackageWriter._write_pkg_rels(phys_writer, package.rels)
+        if len(self._part.rels):
+            phys_writer.write(self._part.partname.rels_uri, self._part.rels.xml)
+        self._write_parts()
+        phys_writer.close()
+
+    def _write_parts(self):
+        """Write each part of the package not yet written, other than the body."""
+        for part in self._part.package.iter_parts():
+            if part is self._part or part.partname in self._written:
+                continue
+            PackageWriter._write_parts(self._phys_writer, [part])
+            self._written.add(part.partname)
+
+
+class DocumentAppender(DocumentWriter):
+    """Adds blocks to the end of the existing document at *path*, in place.
+
+    Blocks are written as by |DocumentWriter|, following the existing content and
+    before the final section properties. The existing body is read twice, a chunk at a
+    time: once to find where the new blocks go, then to copy it to the updated copy of
+    the package. The parts other than the body are loaded as usual, so styles,
+    numbering and existing images are available to the new blocks. The document at
+    *path* is replaced by the updated copy only on :meth:`close`; on :meth:`abort`, or
+    an exception in the ``with`` block, it is left untouched.
+    """
+
+    def __init__(self, path):
+        phys_reader = PhysPkgReader(path)
+        try:
+            partname = _related_partname(phys_reader, PACKAGE_URI, RT.OFFICE_DOCUMENT)
+            source = phys_reader.open(partname)
+            try:
+                head, self._tail, last_id, body_size = _scan_body(source)
+            finally:
+                source.close()
+            pkg_reader = PackageReader.from_phys_reader(
+                _StubBodyReader(phys_reader, partname, head + self._tail)
+            )
+            package = Package()
+            Unmarshaller.unmarshal(pkg_reader, package, PartFactory)
+
+            self._phys_writer = PhysPkgUpdater(path)
+            try:
+                self._stream = self._phys_writer.open(partname)
+                source = phys_reader.open(partname)
+                try:
+                    _copy_head(source, self._stream, body_size)
+                finally:
+                    source.close()
+            except BaseException:
+                self._phys_writer.abort()
+                raise
+        finally:
+            phys_reader.close()
+
+        self._set_document(package.main_document_part.document)
+        self._next_shape_id = max(self._next_shape_id, last_id + 1)
+        self._loaded = set(part.partname for part in package.iter_parts())
+        self._rel_count = len(self._part.rels)
+        self._xf = _FragmentWriter(self._stream)
+
+    def _close_body(self):
+        self._stream.write(self._tail)
+        self._stream.close()
+
+    def _write_package(self):
+        """Write the new parts and whatever changed because of them."""
+        phys_writer = self._phys_writer
+        parts = list(self._part.package.iter_parts())
+        new_parts = [part for part in parts if part.partname not in self._loaded]
+        if new_parts:
+            PackageWriter._write_content_types_stream(phys_writer, parts)
+            PackageWriter._write_parts(phys_writer, new_parts)
+        if len(self._part.rels) != self._rel_count:
+            phys_writer.write(self._part.partname.rels_uri, self._part.rels.xml)
+        phys_writer.keep_unwritten()
+        phys_writer.close()
+
+
+class _FragmentWriter(object):
+    """Writes elements to *stream* as fragments of an XML document already begun.
+
+    Has the `write()` and `element()` methods of an `lxml.etree.xmlfile` writer, which
+    only writes a document as a whole. Each element written declares the namespaces it
+    uses.
+    """
+
+    def __init__(self, stream):
+        super(_FragmentWriter, self).__init__()
+        self._stream = stream
+
+    def element(self, tag):
+        """Return a context manager writing the start and end tags of *tag*."""
+        return _FragmentElement(self._stream, tag)
+
+    def write(self, element):
+        self._stream.write(etree.tostring(element, encoding='UTF-8'))
+
+
+class _FragmentElement(object):
+    """Context manager writing the start tag of *tag* on entry, its end tag on exit."""
+
+    def __init__(self, stream, tag):
+        super(_FragmentElement, self).__init__()
+        self._stream = stream
+        self._nstag = NamespacePrefixedTag.from_clark_name(tag)
+
+    def __enter__(self):
+        empty = etree.tostring(OxmlElement(self._nstag), encoding='UTF-8')
+        self._stream.write(empty[:-2] + b'>')
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._stream.write(('</%s>' % self._nstag).encode('utf-8'))
+
+
+class _StubBodyReader(object):
+    """Physical package reader giving *blob* as the content of part *partname*.
+
+    Wraps *phys_reader*, to load a package with a small stand-in for its main document
+    part.
+    """
+
+    def __init__(self, phys_reader, partname, blob):
+        super(_StubBodyReader, self).__init__()
+        self._phys_reader = phys_reader
+        self._partname = partname
+        self._blob = blob
+
+    def blob_for(self, pack_uri):
+        if pack_uri == self._partname:
+            return self._blob
+        return self._phys_reader.blob_for(pack_uri)
+
+    @property
+    def content_types_xml(self):
+        return self._phys_reader.content_types_xml
+
+    def rels_xml_for(self, source_uri):
+        return self._phys_reader.rels_xml_for(source_uri)
+
+
+def _copy_head(source, stream, size):
+    """Copy the first *size* bytes of *source* to *stream*, a chunk at a time."""
+    while size > 0:
+        chunk = source.read(min(size, _CHUNK_SIZE))
+        if not chunk:
+            raise ValueError('main document part changed while appending')
+        stream.write(chunk)
+        size -= len(chunk)
+
+
+def _scan_body(source):
+    """Find where blocks are added to the main document XML in *source*.
+
+    New blocks go before the final section properties of the body. Return `(head,
+    tail, last_id, body_size)`, where *head* is the XML up to and including the start
+    tag of the body, *tail* is the XML from the final section properties to the end,
+    *last_id* is the largest `id` attribute value in the XML, 0 if there is none, and
+    *body_size* is the length of the XML before *tail*. Raises |ValueError| if the
+    body or its end cannot be found.
+    """
+    head, body, held, last_id, passed = b'', None, b'', 0, 0
+    while True:
+        chunk = source.read(_CHUNK_SIZE)
+        if not chunk:
+            break
+        data = held + chunk
+        if body is None:
+            head += chunk
+            body = _body_start.search(head)
+            if body is not None:
+                head = head[:body.end()]
+        for id_str in _id_attr.findall(data):
+            last_id = max(last_id, int(id_str))
+        held = data[-_TAIL_SIZE:]
+        passed += len(data) - len(held)
+
+    if body is None:
+        raise ValueError('main document part has no body')
+    prefix = body.group(1) or b''
+    body_end = held.rfind(b'</' + prefix + b'body>')
+    if body_end < 0:
+        raise ValueError('end of body not found in main document part')
+    split = _final_sectPr_start(held[:body_end], prefix)
+    return head, held[split:], last_id, passed + split
+
+
+def _final_sectPr_start(content, prefix):
+    """Return offset of the `w:sectPr` element ending body *content*.
+
+    Return the length of *content* when it does not end with a `w:sectPr` element.
+    *prefix* is the namespace prefix of the WordprocessingML elements, like ``w:``.
+    A `w:sectPr` element can contain another, in its revision record.
+    """
+    content = content.rstrip()
+    sectPr_tag = re.compile(b'<(/?)' + re.escape(prefix) + br'sectPr(?=[\s/>])')
+    last_tag = sectPr_tag.match(content, content.rfind(b'<'))
+    if last_tag is None:
+        return len(content)
+
+    depth = 0
+    for match in reversed(list(sectPr_tag.finditer(content))):
+        if match.group(1):
+            depth += 1
+            continue
+        if content[content.find(b'>', match.start()) - 1:].startswith(b'/'):
+            if depth == 0:
+                return match.start()
+            continue
+        depth -= 1
+        if depth == 0:
+            return match.start()
+    raise ValueError('start of final section properties not found')
+
+
+def _related_partname(phys_reader, source_uri, reltype):
+    """Return partname of the part *source_uri* is related to by *reltype*."""
+    for srel in PackageReader._srels_for(phys_reader, source_uri):
+        if srel.reltype == reltype and not srel.is_external:
+            return srel.target_partname
+    raise ValueError('package has no part related by %s' % reltype)
@@ -0,0 +1,225 @@
+# encoding: utf-8
+
+"""Resolution of effective character and paragraph formatting.
+
+The effective value of a formatting property is found by walking the style cascade:
+document defaults, then the paragraph style and its base styles, then the character
+style and its base styles, then formatting applied directly to the run or paragraph.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml.ns import qn
+from docx.text.font import Font
+from docx.text.parfmt import ParagraphFormat
+
+
+FONT_PROPERTIES = (
+    'all_caps', 'bold', 'color', 'complex_script', 'cs_bold', 'cs_italic',
+    'double_strike', 'emboss', 'hidden', 'highlight_color', 'imprint', 'italic',
+    'math', 'name', 'no_proof', 'outline', 'rtl', 'shadow', 'size', 'small_caps',
+    'snap_to_grid', 'spec_vanish', 'strike', 'subscript', 'superscript',
+    'underline', 'web_hidden',
+)
+
+PARAGRAPH_FORMAT_PROPERTIES = (
+    'alignment', 'first_line_indent', 'keep_together', 'keep_with_next',
+    'left_indent', 'line_spacing', 'line_spacing_rule', 'page_break_before',
+    'right_indent', 'space_after', 'space_before', 'widow_control',
+)
+
+# ---ISO/IEC 29500 §17.7.3, a toggle property set in both the paragraph style and the
+# ---character style hierarchy is the exclusive-or of the two
+_TOGGLE_FONT_PROPERTIES = frozenset((
+    'all_caps', 'bold', 'cs_bold', 'cs_italic', 'emboss', 'hidden', 'imprint',
+    'italic', 'outline', 'shadow', 'small_caps', 'strike',
+))
+
+
+def font_properties(element):
+    """Return dict of font properties directly applied to *element*.
+
+    *element* is any element having an optional `w:rPr` child, such as `w:r`,
+    `w:style` or `w:rPrDefault`. Properties that are not specified are omitted. The
+    `color` property holds the RGB color value, if any.
+    """
+    if element is None:
+        return {}
+    return Font(element).to_dict()
+
+
+def paragraph_format_properties(element):
+    """Return dict of paragraph properties directly applied to *element*.
+
+    *element* is any element having an optional `w:pPr` child, such as `w:p`,
+    `w:style` or `w:pPrDefault`. Properties that are not specified are omitted.
+    """
+    if element is None:
+        return {}
+    return ParagraphFormat(element).to_dict()
+
+
+class StyleResolver(object):
+    """Resolves effective formatting for runs and paragraphs against a styles part.
+
+    The cascade for each style id, and for each combination of paragraph and character
+    style, is resolved once and cached, so resolving the formatting of a run or
+    paragraph costs only a read of its direct formatting and a dict merge. The caches
+    are not aware of later changes to the styles; call :meth:`reset` after modifying
+    styles.
+    """
+
+    def __init__(self, styles_elm):
+        super(StyleResolver, self).__init__()
+        self._styles_elm = styles_elm
+        self.reset()
+
+    def effective_font(self, r):
+        """Return dict of the effective font properties of `w:r` element *r*.
+
+        The dict has a key for each name in `FONT_PROPERTIES`. The value of a property
+        not specified anywhere in the cascade is |None|.
+        """
+        p = r.getparent()
+        while p is not None and p.tag != qn('w:p'):
+            p = p.getparent()
+        pStyle_id = self._style_id(
+            None if p is None else p.style, WD_STYLE_TYPE.PARAGRAPH
+        )
+        rStyle_id = self._style_id(r.style, WD_STYLE_TYPE.CHARACTER)
+
+        key = (pStyle_id, rStyle_id)
+        inherited = self._run_cascade.get(key)
+        if inherited is None:
+            inherited = self._run_cascade[key] = self._resolve_run_cascade(
+                pStyle_id, rStyle_id
+            )
+
+        properties = dict(inherited)
+        properties.update(font_properties(r))
+        return properties
+
+    def effective_paragraph_format(self, p):
+        """Return dict of the effective paragraph properties of `w:p` element *p*.
+
+        The dict has a key for each name in `PARAGRAPH_FORMAT_PROPERTIES`. The value of
+        a property not specified anywhere in the cascade is |None|.
+        """
+        pStyle_id = self._style_id(p.style, WD_STYLE_TYPE.PARAGRAPH)
+        inherited = self._paragraph_cascade.get(pStyle_id)
+        if inherited is None:
+            inherited = dict.fromkeys(PARAGRAPH_FORMAT_PROPERTIES)
+            pPrDefault = self._doc_default('pPrDefault')
+            inherited.update(paragraph_format_properties(pPrDefault))
+            inherited.update(
+                self._style_properties(
+                    pStyle_id, self._style_paragraph_format, paragraph_format_properties
+                )
+            )
+            self._paragraph_cascade[pStyle_id] = inherited
+
+        properties = dict(inherited)
+        properties.update(paragraph_format_properties(p))
+        return properties
+
+    def reset(self):
+        """Discard all cached resolutions, for example after a style is changed."""
+        self._styles_by_id = None
+        self._default_style_ids = {}
+        self._style_font = {}
+        self._style_paragraph_format = {}
+        self._run_cascade = {}
+        self._paragraph_cascade = {}
+
+    def style_font(self, style_id):
+        """Return dict of the font properties defined by style *style_id*.
+
+        Properties defined by its base styles are included, overridden by those
+        defined closer to *style_id*. Properties not defined in the chain, and those
+        of the document defaults, are omitted.
+        """
+        return dict(self._style_properties(style_id, self._style_font, font_properties))
+
+    def style_paragraph_format(self, style_id):
+        """Return dict of the paragraph properties defined by style *style_id*.
+
+        Resolved like :meth:`style_font`.
+        """
+        return dict(
+            self._style_properties(
+                style_id, self._style_paragraph_format, paragraph_format_properties
+            )
+        )
+
+    def _doc_default(self, tagname):
+        """Return `w:docDefaults/w:{tagname}` element or |None| if not present."""
+        docDefaults = self._styles_elm.docDefaults
+        if docDefaults is None:
+            return None
+        return getattr(docDefaults, tagname)
+
+    def _resolve_run_cascade(self, pStyle_id, rStyle_id):
+        """Return dict of font properties inherited from run styles and defaults."""
+        properties = dict.fromkeys(FONT_PROPERTIES)
+        properties.update(font_properties(self._doc_default('rPrDefault')))
+        paragraph_style_props = self._style_properties(
+            pStyle_id, self._style_font, font_properties
+        )
+        properties.update(paragraph_style_props)
+        character_style_props = self._style_properties(
+            rStyle_id, self._style_font, font_properties
+        )
+        for name, value in character_style_props.items():
+            if name in _TOGGLE_FONT_PROPERTIES and name in paragraph_style_props:
+                value = bool(value) != bool(paragraph_style_props[name])
+            properties[name] = value
+        return properties
+
+    def _style_id(self, style_id, style_type):
+        """Return the id of the style of *style_type* that applies for *style_id*.
+
+        The default style for *style_type* applies when *style_id* is |None| or does not
+        identify a style of that type. Returns |None| when no style applies.
+        """
+        style = self._styles.get(style_id)
+        if style is not None and style.type == style_type:
+            return style_id
+        if style_type not in self._default_style_ids:
+            default = self._styles_elm.default_for(style_type)
+            self._default_style_ids[style_type] = (
+                None if default is None else default.styleId
+            )
+        return self._default_style_ids[style_type]
+
+    def _style_properties(self, style_id, cache, read_properties):
+        """Return flattened dict of properties defined by style *style_id*.
+
+        Properties of the base style chain are included, overridden by those defined
+        closer to *style_id*. *read_properties* reads the properties defined directly
+        on a single `w:style` element; resolved chains are stored in *cache*.
+        """
+        if style_id in cache:
+            return cache[style_id]
+        # ---guard against a cycle in the basedOn chain---
+        cache[style_id] = {}
+        properties = {}
+        style = self._styles.get(style_id)
+        if style is not None:
+            base_id = style.basedOn_val
+            if base_id is not None:
+                properties.update(
+                    self._style_properties(base_id, cache, read_properties)
+                )
+            properties.update(read_properties(style))
+        cache[style_id] = properties
+        return properties
+
+    @property
+    def _styles(self):
+        """dict mapping style id to its `w:style` element, built on first use."""
+        if self._styles_by_id is None:
+            self._styles_by_id = dict(
+                (style.styleId, style) for style in self._styles_elm.style_lst
+            )
+        return self._styles_by_id
@@ -7,9 +7,12 @@ The |Table| object and related proxy classes.
 from __future__ import absolute_import, print_function, unicode_literals
 
 from .blkcntnr import BlockItemContainer
+from .compat import is_string
 from .enum.style import WD_STYLE_TYPE
+from .oxml.ns import qn
 from .oxml.simpletypes import ST_Merge
-from .shared import Inches, lazyproperty, Parented
+from .search import ParagraphText
+from .shared import Emu, Inches, lazyproperty, Parented
 
 
 class Table(Parented):
@@ -29,8 +32,7 @@ class Table(Parented):
         gridCol = tblGrid.add_gridCol()
         gridCol.w = width
         for tr in self._tbl.tr_lst:
-            tc = tr.add_tc()
-            tc.width = width
+            tr.add_tc_of_width(width)
         return _Column(gridCol, self)
 
     def add_row(self):
@@ -40,8 +42,7 @@ class Table(Parented):
         tbl = self._tbl
         tr = tbl.add_tr()
         for gridCol in tbl.tblGrid.gridCol_lst:
-            tc = tr.add_tc()
-            tc.width = gridCol.w
+            tr.add_tc_of_width(gridCol.w)
         return _Row(tr, self)
 
     @property
@@ -96,6 +97,95 @@ class Table(Parented):
         """
         return _Columns(self._tbl, self)
 
+    def format_range(
+        self, rows=None, cols=None, width=None, vertical_alignment=None,
+        shading=None, borders=None
+    ):
+        """
+        Apply cell formatting to each cell in *rows* and *cols* of this
+        table, in a single pass over the table. *rows* and *cols* are each
+        a slice or a sequence of indices, and default to all rows and all
+        grid columns respectively; a merged cell is formatted when its first
+        grid column is in *cols*.
+
+        Each of the remaining arguments is applied only when not |None|.
+        *width* sets the cell width, a |Length| value. *vertical_alignment*
+        is a member of :ref:`WdCellVerticalAlignment`. *shading* is an
+        |RGBColor| for the cell background. *borders* replaces the borders
+        of each cell and is either a border style such as 'single' or
+        'nil', drawn on all four edges, or a dict mapping edge names, like
+        'top' or 'insideH', to border styles.
+
+        Each distinct set of existing cell properties is updated once and
+        copied to the other cells having it, so formatting a large table of
+        uniformly formatted cells costs about as much as copying its cell
+        properties.
+        """
+        if is_string(borders):
+            borders = dict.fromkeys(('top', 'left', 'bottom', 'right'), borders)
+
+        def update(tcPr):
+            if width is not None:
+                tcPr.width = width
+            if vertical_alignment is not None:
+                tcPr.vAlign_val = vertical_alignment
+            if shading is not None:
+                tcPr.shd_fill = shading
+            if borders is not None:
+                tcPr.set_borders(borders)
+
+        self._tbl.update_tcPrs(self._iter_range_tcs(rows, cols), update)
+
+    def iter_rows_text(self):
+        """
+        Generate a list of the cell text in each row of this table, with an
+        item for each grid column. A merged cell appears once for each grid
+        column and row it spans, as it does for :meth:`cell`. A row having
+        fewer cells than the table has grid columns is padded with empty
+        strings and the text of cells beyond the last grid column is left
+        out, so every row has the same length. The text of a cell is that of
+        `_Cell.text` plus the text of any runs in hyperlinks, which
+        `_Cell.text` leaves out.
+
+        This reads the table XML in a single pass without creating any cell,
+        paragraph or run objects, so it suits reading large tables.
+        """
+        col_count = self._column_count
+        above = []
+        for tr in self._tbl.iterchildren(qn('w:tr')):
+            row = []
+            for tc in tr.iterchildren(qn('w:tc')):
+                col = len(row)
+                grid_span, continues_merge = _tc_layout(tc)
+                if continues_merge and col < len(above):
+                    text = above[col]
+                else:
+                    text = '\n'.join(
+                        ParagraphText(p).text for p in tc.iterchildren(qn('w:p'))
+                    )
+                row.extend([text] * grid_span)
+            if len(row) < col_count:
+                row.extend([''] * (col_count - len(row)))
+            else:
+                del row[col_count:]
+            yield row
+            above = row
+
+    def merge_ranges(self, ranges):
+        """
+        Merge each range of cells in *ranges*, a sequence of ``(row_0, col_0,
+        row_1, col_1)`` tuples naming the cells at two diagonally opposite
+        corners of the range, and return a list of the resulting merged
+        cells, one for each range. Each range is merged as by
+        :meth:`_Cell.merge`, but the merges are all planned before the table
+        is changed, and each affected row is rewritten only once, making this
+        much faster than merging many ranges one at a time. A range may
+        include one merged earlier in the same call. Raises
+        |InvalidSpanError| if a range is not rectangular, in which case no
+        range is merged.
+        """
+        return [_Cell(tc, self) for tc in self._tbl.merge_ranges(ranges)]
+
     def row_cells(self, row_idx):
         """
         Sequence of cells in the row at *row_idx* in this table.
@@ -112,6 +202,33 @@ class Table(Parented):
         """
         return _Rows(self._tbl, self)
 
+    def set_column_widths(self, widths):
+        """
+        Set the width of each grid column of this table to the |Length| in
+        *widths*, one for each column, along with the width of each cell,
+        which becomes the total width of the grid columns it spans. Raises
+        |ValueError| when *widths* does not have one item per grid column.
+        """
+        widths = list(widths)
+        gridCols = self._tbl.tblGrid.gridCol_lst
+        if len(widths) != len(gridCols):
+            raise ValueError(
+                'expected %d column widths, got %d' % (len(gridCols), len(widths))
+            )
+        for gridCol, width in zip(gridCols, widths):
+            gridCol.w = width
+
+        tcs_by_width = {}
+        for tr in self._tbl.tr_lst:
+            left = 0
+            for tc in tr.tc_lst:
+                span = tc.grid_span
+                cell_width = Emu(sum(widths[left:left + span]))
+                tcs_by_width.setdefault(cell_width, []).append(tc)
+                left += span
+        for cell_width, tcs in tcs_by_width.items():
+            self._tbl.update_tcPrs(tcs, lambda tcPr: setattr(tcPr, 'width', cell_width))
+
     @property
     def style(self):
         """
@@ -158,6 +275,42 @@ class Table(Parented):
     def table_direction(self, value):
         self._element.bidiVisual_val = value
 
+    def to_arrow(self):
+        """
+        Return a `pyarrow.Table` having a string column for each grid column
+        of this table, named by the text of the first row and holding the
+        text of the rest. Requires the `pyarrow` package.
+        """
+        import pyarrow
+
+        names, columns = self._columns_text()
+        return pyarrow.table(columns, names=names)
+
+    def to_numpy(self):
+        """
+        Return a two-dimensional `numpy` array of the cell text of this table,
+        one row for each table row and one column for each grid column, as
+        produced by :meth:`iter_rows_text`. Requires the `numpy` package.
+        """
+        import numpy
+
+        rows = list(self.iter_rows_text())
+        array = numpy.empty((len(rows), self._column_count), dtype=object)
+        for idx, row in enumerate(rows):
+            array[idx] = row
+        return array
+
+    def to_records(self):
+        """
+        Return a list containing a dict for each row of this table after the
+        first, mapping the text of each cell in the first row to the text of
+        the cell below it in that row. Where two first-row cells have the
+        same text, the value is that of the rightmost one.
+        """
+        rows = self.iter_rows_text()
+        names = next(rows, [])
+        return [dict(zip(names, row)) for row in rows]
+
     @property
     def _cells(self):
         """
@@ -177,6 +330,40 @@ class Table(Parented):
                     cells.append(_Cell(tc, self))
         return cells
 
+    def _columns_text(self):
+        """
+        Return (names, columns) pair, *names* being the cell text of the first
+        row and *columns* a list of the cell text below each of them.
+        """
+        rows = self.iter_rows_text()
+        names = next(rows, [])
+        columns = [[] for name in names]
+        for row in rows:
+            for column, text in zip(columns, row):
+                column.append(text)
+        return names, columns
+
+    def _iter_range_tcs(self, rows, cols):
+        """
+        Generate each `w:tc` in *rows* having its first grid column in
+        *cols*, each either a slice, a sequence of indices or |None| for all.
+        """
+        tr_lst = self._tbl.tr_lst
+        if rows is None:
+            rows = slice(None)
+        trs = tr_lst[rows] if isinstance(rows, slice) else [tr_lst[i] for i in rows]
+        if cols is None:
+            cols = slice(None)
+        if isinstance(cols, slice):
+            cols = range(*cols.indices(self._column_count))
+        cols = set(cols)
+        for tr in trs:
+            left = 0
+            for tc in tr.tc_lst:
+                if left in cols:
+                    yield tc
+                left += tc.grid_span
+
     @property
     def _column_count(self):
         """
@@ -189,6 +376,25 @@ class Table(Parented):
         return self._tbl.tblPr
 
 
+def _tc_layout(tc):
+    """
+    Return (grid_span, continues_merge) pair for *tc*, *continues_merge* being
+    True when the cell continues a vertical merge. Reads the XML directly,
+    being used once for each cell when reading a whole table.
+    """
+    tcPr = tc.find(qn('w:tcPr'))
+    if tcPr is None:
+        return 1, False
+    gridSpan = tcPr.find(qn('w:gridSpan'))
+    grid_span = 1 if gridSpan is None else int(gridSpan.get(qn('w:val'), 1))
+    vMerge = tcPr.find(qn('w:vMerge'))
+    continues_merge = (
+        vMerge is not None
+        and vMerge.get(qn('w:val'), ST_Merge.CONTINUE) == ST_Merge.CONTINUE
+    )
+    return grid_span, continues_merge
+
+
 class _Cell(BlockItemContainer):
     """Table cell"""
 
@@ -0,0 +1,151 @@
+# encoding: utf-8
+
+"""Writing tabular data, such as a pandas DataFrame, to a table in one pass.
+
+:func:`from_dataframe` adds a table holding the column names and values of a
+DataFrame::
+
+    table = from_dataframe(
+        document, df,
+        number_formats={'price': '{:,.2f}', 'date': '%d %b %Y'},
+        column_styles={'price': {'alignment': WD_ALIGN_PARAGRAPH.RIGHT}},
+    )
+
+Values are turned into text a column at a time, through pandas, rather than one cell at
+a time, and the formatting of the cells of each column is prepared once, as a template
+`w:tc` element. The table XML is then built in a single pass over the rows, each row a
+copy of a template row made of those cells, so the cost per cell is little more than
+setting its text. pandas is not a dependency of this package; it is only needed by
+whoever has a DataFrame to write.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import re
+
+from copy import deepcopy
+
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.oxml.table import CT_Tc
+from docx.table import _Cell
+
+_special_chars = re.compile('[\t\n\r]')
+_space_attr = qn('xml:space')
+_t_tag = qn('w:t')
+
+
+def from_dataframe(
+    container, df, number_formats=None, column_styles=None, header=True, style=None
+):
+    """Return a |Table| holding the values of DataFrame *df*, added to *container*.
+
+    *container* is a |Document| or a table cell. The table has a column for each
+    column of *df* and, when *header* is true, a first row holding the column names.
+    *style* is a table style or table style name, as for `Document.add_table()`.
+
+    *number_formats* maps column names to formats. A format is a callable taking a
+    value and returning its text, a `str.format()` string such as ``'{:,.2f}'``, or,
+    for a datetime column, a `strftime()` string such as ``'%Y-%m-%d'``. A column
+    without a format is converted with `str()`. Missing values, such as `NaN` and
+    `NaT`, are always written as empty cells.
+
+    *column_styles* maps column names to the formatting of their cells, either a
+    paragraph style or style name, or a dict which can have any of the keys
+    ``'style'`` (a paragraph style or style name), ``'alignment'``, ``'bold'``,
+    ``'italic'``, ``'width'``, ``'vertical_alignment'`` and ``'shading'`` (an
+    |RGBColor| for the cell background). Header cells take the formatting of their
+    column.
+    """
+    number_formats = number_formats or {}
+    column_styles = column_styles or {}
+    names = list(df.columns)
+
+    table = container.add_table(0, len(names))
+    if style is not None:
+        table.style = style
+    tbl = table._tbl
+    row_template = OxmlElement('w:tr')
+    for name, gridCol in zip(names, tbl.tblGrid.gridCol_lst):
+        row_template.append(
+            _cell_template(table, gridCol.w, column_styles.get(name))
+        )
+    columns = [
+        _column_text(df.iloc[:, idx], number_formats.get(name))
+        for idx, name in enumerate(names)
+    ]
+
+    if header:
+        tbl.append(_new_tr(row_template, ['%s' % (name,) for name in names]))
+    for texts in zip(*columns):
+        tbl.append(_new_tr(row_template, texts))
+    return table
+
+
+def _cell_template(table, width, column_style):
+    """Return a `w:tc` element formatted as *column_style*, to be copied for a cell.
+
+    The template has a single paragraph containing a single run ending in an empty
+    `w:t` element, which receives the text of each copy.
+    """
+    cell = _Cell(CT_Tc.new(width), table)
+    if column_style is None:
+        column_style = {}
+    elif not isinstance(column_style, dict):
+        column_style = {'style': column_style}
+
+    paragraph = cell.paragraphs[0]
+    run = paragraph.add_run()
+    get = column_style.get
+    if get('style') is not None:
+        paragraph.style = get('style')
+    if get('alignment') is not None:
+        paragraph.alignment = get('alignment')
+    if get('bold') is not None:
+        run.bold = get('bold')
+    if get('italic') is not None:
+        run.italic = get('italic')
+    if get('width') is not None:
+        cell.width = get('width')
+    if get('vertical_alignment') is not None:
+        cell.vertical_alignment = get('vertical_alignment')
+    if get('shading') is not None:
+        cell._tc.get_or_add_tcPr().shd_fill = get('shading')
+    run._r.add_t('')
+    return cell._tc
+
+
+def _column_text(series, number_format):
+    """Return list of the text of each value in pandas *series*, formatted as a whole.
+
+    Missing values become empty strings. Formatting is applied to the other values
+    through pandas, a column at a time.
+    """
+    present = series.notna()
+    values = series[present]
+    if number_format is None:
+        text = values.astype(str)
+    elif callable(number_format):
+        text = values.map(number_format)
+    elif series.dtype.kind == 'M':
+        text = values.dt.strftime(number_format)
+    else:
+        text = values.map(number_format.format)
+
+    if present.all():
+        return text.tolist()
+    text = iter(text.tolist())
+    return [next(text) if is_present else '' for is_present in present.tolist()]
+
+
+def _new_tr(row_template, texts):
+    """Return a copy of `w:tr` element *row_template* holding *texts*, one per cell."""
+    tr = deepcopy(row_template)
+    for t, text in zip(tr.iter(_t_tag), texts):
+        if _special_chars.search(text):
+            t.getparent().text = text
+            continue
+        t.text = text
+        if text.strip() != text:
+            t.set(_space_attr, 'preserve')
+    return tr
@@ -0,0 +1,314 @@
+# encoding: utf-8
+
+"""Compiled mail-merge templates.
+
+A |Template| is compiled once from a document containing `{{field}}` placeholders and
+then rendered any number of times, once per record::
+
+    template = Template(document)
+    for idx, record in enumerate(records):
+        template.render(record)
+        document.save('letter-%d.docx' % idx)
+
+Compiling finds each placeholder, even when Word has split its text across several
+runs, and normalizes the template so each placeholder is the whole text of a single
+`w:t` element in the run where the placeholder begins, taking on that run's
+formatting. The path to each of these "slots" is recorded for each top-level block
+(paragraph or table) of the document body that contains a placeholder.
+
+Rendering replaces only those blocks, each with a fresh copy of its compiled original
+having the record's values written directly into its slots, so the per-record cost
+depends on the number and size of the blocks containing fields rather than on the size
+of the document.
+
+A table row containing a `{{#name}}` marker is a repeat row. It is rendered once for
+each item in the sequence `record[name]`, with the fields in that row looked up first
+in the item and then in the record. A field name may be a dotted path such as
+`{{customer.name}}`, each step being either a key or an attribute lookup.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import re
+
+from copy import deepcopy
+
+from docx.compat import Mapping, Sequence
+from docx.oxml.ns import qn
+
+
+_placeholder_patt = re.compile(r'\{\{\s*(#?[\w.]+)\s*\}\}')
+
+
+class Template(object):
+    """Compiled form of the placeholders in the body of *document*.
+
+    Compiling normalizes the runs containing placeholders in place, so the document
+    looks the same but may have a different run structure. Rendering replaces the
+    blocks containing placeholders; any proxy object, such as a |Paragraph|, obtained
+    for one of those blocks before rendering no longer refers to the document.
+    """
+
+    def __init__(self, document):
+        super(Template, self).__init__()
+        self._part = document.part
+        self._body = document.element.body
+        self._block_plans = [
+            plan for plan in (
+                _BlockPlan.compile(block) for block in self._body.iterchildren(
+                    qn('w:p'), qn('w:tbl')
+                )
+            ) if plan is not None
+        ]
+
+    @property
+    def fields(self):
+        """Sorted list of the distinct field names used in the template.
+
+        A repeat row contributes its `#name` marker and the names of its fields.
+        """
+        names = set()
+        for plan in self._block_plans:
+            names.update(plan.fields)
+        return sorted(names)
+
+    def render(self, record):
+        """Fill the document with the values in mapping *record*.
+
+        Each block containing a placeholder is replaced with a freshly filled copy of
+        its compiled original, so :meth:`render` can be called any number of times.
+        Raises |KeyError| when a field is not found in *record*.
+        """
+        for plan in self._block_plans:
+            plan.render(self._body, record)
+        self._part.section_map.invalidate()
+        self._part.shape_index.invalidate()
+
+
+class _BlockPlan(object):
+    """The compiled slots of one top-level block item, and how to fill them."""
+
+    def __init__(self, block, slots, repeats):
+        super(_BlockPlan, self).__init__()
+        self._original = deepcopy(block)
+        self._current = block
+        self._slots = slots
+        self._repeats = repeats
+
+    @classmethod
+    def compile(cls, block):
+        """Return a |_BlockPlan| for `w:p` or `w:tbl` *block*, or |None| if none needed.
+
+        *block* is normalized in place so each placeholder has a `w:t` of its own.
+        """
+        slot_ts, markers = [], []
+        for p in block.iter(qn('w:p')):
+            for name, t in _normalize_placeholders(p):
+                if name.startswith('#'):
+                    markers.append((name[1:], t))
+                else:
+                    slot_ts.append((name, t))
+        if not slot_ts and not markers:
+            return None
+
+        repeats, repeat_rows = [], {}
+        for name, t in markers:
+            tr = _ancestor(t, 'w:tr', block)
+            if tr is None:
+                raise ValueError(
+                    "repeat marker '{{#%s}}' must be in a table row" % name
+                )
+            t.getparent().remove(t)
+            repeat_rows[tr] = name
+        for tr, name in repeat_rows.items():
+            if any(_is_descendant(tr, other) for other in repeat_rows):
+                raise ValueError('nested repeat rows are not supported')
+            row_slots = [
+                (field, _path(t, tr)) for field, t in slot_ts if _is_descendant(t, tr)
+            ]
+            repeats.append((name, _path(tr, block), row_slots))
+
+        slots = [
+            (field, _path(t, block)) for field, t in slot_ts
+            if not any(_is_descendant(t, tr) for tr in repeat_rows)
+        ]
+        return cls(block, slots, repeats)
+
+    @property
+    def fields(self):
+        """Set of field names filled by this plan."""
+        names = set(field for field, _ in self._slots)
+        for name, _, row_slots in self._repeats:
+            names.add('#%s' % name)
+            names.update(field for field, _ in row_slots)
+        return names
+
+    def render(self, container, record):
+        """Replace this plan's block in *container* with a copy filled from *record*."""
+        block = deepcopy(self._original)
+        slots = [(field, _follow(block, path)) for field, path in self._slots]
+        rows = [
+            (name, _follow(block, path), row_slots)
+            for name, path, row_slots in self._repeats
+        ]
+
+        for field, t in slots:
+            t.text = _text(_lookup(record, field))
+        for name, tr, row_slots in rows:
+            for item in _lookup(record, name):
+                new_tr = deepcopy(tr)
+                for field, path in row_slots:
+                    _follow(new_tr, path).text = _text(
+                        _lookup(item, field, record)
+                    )
+                tr.addprevious(new_tr)
+            tr.getparent().remove(tr)
+
+        container.replace(self._current, block)
+        self._current = block
+
+
+def _ancestor(element, tagname, stop):
+    """Return the nearest ancestor of *element* having *tagname*, up to *stop*."""
+    tag = qn(tagname)
+    parent = element.getparent()
+    while parent is not None:
+        if parent.tag == tag:
+            return parent
+        if parent is stop:
+            return None
+        parent = parent.getparent()
+    return None
+
+
+def _follow(element, path):
+    """Return the descendant of *element* reached by the child indices in *path*."""
+    for idx in path:
+        element = element[idx]
+    return element
+
+
+def _is_descendant(element, ancestor):
+    parent = element.getparent()
+    while parent is not None:
+        if parent is ancestor:
+            return True
+        parent = parent.getparent()
+    return False
+
+
+def _lookup(record, name, fallback=None):
+    """Return the value of dotted field *name* in *record*, else in *fallback*."""
+    try:
+        value = record
+        for step in name.split('.'):
+            value = _step(value, step, name)
+        return value
+    except KeyError:
+        if fallback is None:
+            raise
+        return _lookup(fallback, name)
+
+
+def _step(value, step, name):
+    """Return item or attribute *step* of *value*, one step of looking up *name*.
+
+    A mapping gives only its items and a sequence only its items by index, so a field
+    named like a method of either, such as `items`, is not found rather than giving
+    the method. Other objects give an item where they have one, else an attribute.
+    Raises |KeyError| for *name* when there is no such value.
+    """
+    if isinstance(value, Mapping):
+        if step not in value:
+            raise KeyError(name)
+        return value[step]
+    if isinstance(value, Sequence):
+        try:
+            return value[int(step)]
+        except (ValueError, IndexError):
+            raise KeyError(name)
+    try:
+        return value[step]
+    except (KeyError, IndexError, TypeError):
+        try:
+            return getattr(value, step)
+        except AttributeError:
+            raise KeyError(name)
+
+
+def _normalize_placeholders(p):
+    """Generate (name, t) pair for each placeholder in paragraph *p*.
+
+    The runs of *p* are rewritten so that each placeholder is the entire text of
+    `w:t` element `t`, located in the run where the placeholder text starts. Text of
+    the placeholder in following `w:t` elements is removed.
+    """
+    ts = p.xpath('./w:r/w:t | ./w:hyperlink/w:r/w:t')
+    text = ''.join(t.text or '' for t in ts)
+    matches = list(_placeholder_patt.finditer(text))
+    if not matches:
+        return []
+
+    # ---character offset at which the text of each `w:t` starts---
+    starts, offset = [], 0
+    for t in ts:
+        starts.append(offset)
+        offset += len(t.text or '')
+
+    def locate(offset):
+        idx = len(starts) - 1
+        while starts[idx] > offset:
+            idx -= 1
+        return idx
+
+    slots = []
+    # ---work from the end so offsets of earlier placeholders stay valid---
+    for match in reversed(matches):
+        first, last = locate(match.start()), locate(match.end() - 1)
+        t = ts[first]
+        head_len = match.start() - starts[first]
+        if first == last:
+            tail = t.text[match.end() - starts[first]:]
+        else:
+            last_t = ts[last]
+            last_t.text = last_t.text[match.end() - starts[last]:]
+            last_t.set(qn('xml:space'), 'preserve')
+            for middle_t in ts[first + 1:last]:
+                middle_t.text = ''
+            tail = ''
+        head = t.text[:head_len]
+
+        slot = _new_t(t, match.group(0))
+        t.addnext(slot)
+        if tail:
+            slot.addnext(_new_t(t, tail))
+        t.text = head
+        t.set(qn('xml:space'), 'preserve')
+        slots.append((match.group(1), slot))
+
+    for t in ts:
+        if not t.text:
+            t.getparent().remove(t)
+    slots.reverse()
+    return slots
+
+
+def _new_t(t, text):
+    """Return a new `w:t` element like *t*, containing *text*."""
+    new_t = t.makeelement(qn('w:t'), {qn('xml:space'): 'preserve'})
+    new_t.text = text
+    return new_t
+
+
+def _path(element, ancestor):
+    """Return tuple of child indices leading from *ancestor* down to *element*."""
+    path = []
+    while element is not ancestor:
+        parent = element.getparent()
+        path.append(parent.index(element))
+        element = parent
+    return tuple(reversed(path))
+
+
+def _text(value):
+    return '' if value is None else '%s' % value
@@ -9,7 +9,11 @@ from __future__ import (
 )
 
 from ..enum.text import WD_LINE_SPACING
-from ..shared import ElementProxy, Emu, lazyproperty, Length, Pt, Twips
+from ..oxml import OxmlElement
+from ..oxml.ns import qn
+from ..shared import (
+    ElementProxy, Emu, FormatSpec, lazyproperty, Length, Pt, Twips
+)
 from .tabstops import TabStops
 
 
@@ -22,6 +26,27 @@ class ParagraphFormat(ElementProxy):
 
     __slots__ = ('_tab_stops',)
 
+    _property_tags = {
+        'alignment': qn('w:jc'),
+        'first_line_indent': qn('w:ind'),
+        'keep_together': qn('w:keepLines'),
+        'keep_with_next': qn('w:keepNext'),
+        'left_indent': qn('w:ind'),
+        'line_spacing': qn('w:spacing'),
+        'line_spacing_rule': qn('w:spacing'),
+        'page_break_before': qn('w:pageBreakBefore'),
+        'right_indent': qn('w:ind'),
+        'space_after': qn('w:spacing'),
+        'space_before': qn('w:spacing'),
+        'widow_control': qn('w:widowControl'),
+    }
+
+    # ---properties stored as one attribute of an element shared with others---
+    _contextual_properties = frozenset((
+        'first_line_indent', 'left_indent', 'line_spacing',
+        'line_spacing_rule', 'right_indent', 'space_after', 'space_before',
+    ))
+
     @property
     def alignment(self):
         """
@@ -244,6 +269,15 @@ class ParagraphFormat(ElementProxy):
     def space_before(self, value):
         self._element.get_or_add_pPr().spacing_before = value
 
+    @classmethod
+    def spec(cls, **properties):
+        """
+        Return a |FormatSpec| object that applies the paragraph format
+        property values in *properties* to any number of |ParagraphFormat|
+        objects. Keyword names are those of the properties of this class.
+        """
+        return FormatSpec(cls, properties)
+
     @lazyproperty
     def tab_stops(self):
         """
@@ -253,6 +287,31 @@ class ParagraphFormat(ElementProxy):
         pPr = self._element.get_or_add_pPr()
         return TabStops(pPr)
 
+    def to_dict(self):
+        """
+        Return a dict of the paragraph properties directly applied, read in a
+        single pass over the `w:pPr` element. Properties that are not
+        specified, and so inherit their value, are omitted.
+        """
+        pPr = self._element.pPr
+        properties = {}
+        if pPr is None:
+            return properties
+        for child in pPr:
+            read = _property_readers.get(child.tag)
+            if read is not None:
+                read(child, properties)
+        return properties
+
+    def update(self, **properties):
+        """
+        Assign each of the paragraph format property values in *properties*,
+        rebuilding the `w:pPr` element once rather than once per property.
+        Keyword names are those of the properties of this class. A value of
+        |None| removes the property, as it does for the property setter.
+        """
+        FormatSpec(ParagraphFormat, properties).apply(self)
+
     @property
     def widow_control(self):
         """
@@ -270,6 +329,17 @@ class ParagraphFormat(ElementProxy):
     def widow_control(self, value):
         self._element.get_or_add_pPr().widowControl_val = value
 
+    @staticmethod
+    def _get_or_add_properties(element):
+        return element.get_or_add_pPr()
+
+    @staticmethod
+    def _new_properties_parent():
+        return OxmlElement('w:p')
+
+    def _set_property(self, name, value):
+        setattr(self, name, value)
+
     @staticmethod
     def _line_spacing(spacing_line, spacing_lineRule):
         """
@@ -301,3 +371,52 @@ class ParagraphFormat(ElementProxy):
             if line == Twips(480):
                 return WD_LINE_SPACING.DOUBLE
         return lineRule
+
+
+def _read_ind(child, properties):
+    left, right = child.left, child.right
+    if left is not None:
+        properties['left_indent'] = left
+    if right is not None:
+        properties['right_indent'] = right
+    hanging, firstLine = child.hanging, child.firstLine
+    if hanging is not None:
+        properties['first_line_indent'] = Length(-hanging)
+    elif firstLine is not None:
+        properties['first_line_indent'] = firstLine
+
+
+def _read_spacing(child, properties):
+    after, before = child.after, child.before
+    if after is not None:
+        properties['space_after'] = after
+    if before is not None:
+        properties['space_before'] = before
+    line, lineRule = child.line, child.lineRule
+    if lineRule is None and line is not None:
+        lineRule = WD_LINE_SPACING.MULTIPLE
+    if line is not None:
+        properties['line_spacing'] = ParagraphFormat._line_spacing(
+            line, lineRule
+        )
+    if lineRule is not None:
+        properties['line_spacing_rule'] = (
+            ParagraphFormat._line_spacing_rule(line, lineRule)
+        )
+
+
+def _value_reader(name):
+    def read(child, properties):
+        properties[name] = child.val
+    return read
+
+
+_property_readers = {
+    qn('w:ind'): _read_ind,
+    qn('w:jc'): _value_reader('alignment'),
+    qn('w:keepLines'): _value_reader('keep_together'),
+    qn('w:keepNext'): _value_reader('keep_with_next'),
+    qn('w:pageBreakBefore'): _value_reader('page_break_before'),
+    qn('w:spacing'): _read_spacing,
+    qn('w:widowControl'): _value_reader('widow_control'),
+}
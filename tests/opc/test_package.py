@@ -10,7 +10,7 @@ from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.coreprops import CoreProperties
 from docx.opc.package import OpcPackage, Unmarshaller
 from docx.opc.packuri import PACKAGE_URI, PackURI
-from docx.opc.part import Part
+from docx.opc.part import Part, XmlPart
 from docx.opc.parts.coreprops import CorePropertiesPart
 from docx.opc.pkgreader import PackageReader
 from docx.opc.rel import _Relationship, Relationships
@@ -128,6 +128,28 @@ class DescribeOpcPackage(object):
         for part in parts_:
             part.before_marshal.assert_called_once_with()
         PackageWriter_.write.assert_called_once_with(
+            pkg_file_, pkg._rels, parts_, 'zip', False
+        )
+
+    def it_can_clean_up_namespaces_of_xml_parts_on_save(
+            self, pkg_file_, PackageWriter_, parts, parts_, xml_part_):
+        parts.return_value = parts_ + [xml_part_]
+        pkg = OpcPackage()
+
+        pkg.save(pkg_file_, cleanup_namespaces=True)
+
+        xml_part_.before_marshal.assert_called_once_with()
+        PackageWriter_.write.assert_called_once_with(
+            pkg_file_, pkg._rels, parts_ + [xml_part_], 'zip', True
+        )
+
+    def it_can_save_incrementally_to_a_pkg_file(
+            self, pkg_file_, PackageWriter_, parts, parts_):
+        pkg = OpcPackage()
+        pkg.save_incremental(pkg_file_)
+        for part in parts_:
+            part.before_marshal.assert_called_once_with()
+        PackageWriter_.update.assert_called_once_with(
             pkg_file_, pkg._rels, parts_
         )
 
@@ -279,6 +301,10 @@ class DescribeOpcPackage(object):
     def pkg_file_(self, request):
         return loose_mock(request)
 
+    @pytest.fixture
+    def xml_part_(self, request):
+        return instance_mock(request, XmlPart)
+
     @pytest.fixture
     def pkg_with_rels_(self, request, rels_):
         pkg = OpcPackage()
@@ -10,6 +10,8 @@ from docx.opc.package import OpcPackage
 from docx.opc.packuri import PackURI
 from docx.opc.part import Part, PartFactory, XmlPart
 from docx.opc.rel import _Relationship, Relationships
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
 from docx.oxml.xmlchemy import BaseOxmlElement
 
 from ..unitutil.cxml import element
@@ -454,6 +456,17 @@ class DescribeXmlPart(object):
         xml_part = part_fixture
         assert xml_part.part is xml_part
 
+    def it_provides_its_blob_with_namespaces_cleaned_up_from_a_copy(self):
+        document = parse_xml(
+            '<w:document %s><w:body xmlns:x="urn:x"/></w:document>' % nsdecls('w')
+        )
+        xml_part = XmlPart(None, None, document, None)
+
+        blob = xml_part.clean_blob
+
+        assert b'urn:x' not in blob
+        assert document[0].nsmap['x'] == 'urn:x'
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
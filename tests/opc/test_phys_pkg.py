@@ -12,14 +12,26 @@ except ImportError:
     from StringIO import StringIO as BytesIO
 
 import hashlib
+import os
+import mmap
 import pytest
 
-from zipfile import ZIP_DEFLATED, ZipFile
+from zipfile import BadZipfile, ZIP_DEFLATED, ZIP_STORED, ZipFile, is_zipfile
 
 from docx.opc.exceptions import PackageNotFoundError
-from docx.opc.packuri import PACKAGE_URI, PackURI
+from docx.opc.oxml import nsmap, parse_xml
+from docx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI, PackURI
 from docx.opc.phys_pkg import (
-    _DirPkgReader, PhysPkgReader, PhysPkgWriter, _ZipPkgReader, _ZipPkgWriter
+    _DirPkgReader,
+    _FlatPkgReader,
+    _FlatPkgWriter,
+    _MmapZipPkgReader,
+    PhysPkgReader,
+    PhysPkgUpdater,
+    PhysPkgWriter,
+    _ZipPkgReader,
+    _ZipPkgUpdater,
+    _ZipPkgWriter,
 )
 
 from ..unitutil.file import absjoin, test_file_dir
@@ -79,6 +91,80 @@ class DescribePhysPkgReader(object):
             PhysPkgReader('foobar')
 
 
+class DescribeFlatPkgReader(object):
+
+    def it_is_used_by_PhysPkgReader_when_pkg_is_flat_xml(self, flat_pkg_file):
+        phys_reader = PhysPkgReader(flat_pkg_file)
+        assert isinstance(phys_reader, _FlatPkgReader)
+
+    def it_reads_each_part_written_by_the_flat_writer(self, flat_pkg_file):
+        phys_reader = PhysPkgReader(flat_pkg_file)
+
+        assert phys_reader.blob_for(PackURI('/word/document.xml')) == (
+            b"<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+            b'<doc xmlns="urn:doc">caf\xc3\xa9</doc>'
+        )
+        assert phys_reader.blob_for(PackURI('/word/media/image1.png')) == b'\x89PNG'
+        assert phys_reader.open(PackURI('/word/media/image1.png')).read() == (
+            b'\x89PNG'
+        )
+        assert phys_reader.rels_xml_for(PackURI('/word/document.xml')) is None
+        assert b'<Relationships/>' in phys_reader.rels_xml_for(PACKAGE_URI)
+        content_types_xml = phys_reader.content_types_xml
+        assert (
+            b'<Override PartName="/word/document.xml" ContentType="app/doc+xml"/>'
+        ) in content_types_xml
+        assert (
+            b'<Override PartName="/word/media/image1.png" ContentType="image/png"/>'
+        ) in content_types_xml
+
+    def it_keeps_a_package_namespace_declaration_of_the_part_itself(self):
+        pkg_file = BytesIO()
+        phys_writer = PhysPkgWriter(pkg_file, 'flat')
+        phys_writer.write(CONTENT_TYPES_URI, (
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-'
+            'types"><Default Extension="xml" ContentType="app/xml"/></Types>'
+        ).encode('utf-8'))
+        part_xml = (
+            '<doc xmlns="urn:doc" xmlns:pkg="%s" xmlns:mc="urn:mc" mc:Ignorable="pkg"'
+            '/>' % nsmap['pkg']
+        ).encode('utf-8')
+        phys_writer.write(PackURI('/part.xml'), part_xml)
+        phys_writer.close()
+        pkg_file.seek(0)
+
+        blob = PhysPkgReader(pkg_file).blob_for(PackURI('/part.xml'))
+
+        assert parse_xml(blob).nsmap == {
+            None: 'urn:doc', 'pkg': nsmap['pkg'], 'mc': 'urn:mc'
+        }
+
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture
+    def flat_pkg_file(self):
+        pkg_file = BytesIO()
+        phys_writer = PhysPkgWriter(pkg_file, 'flat')
+        assert isinstance(phys_writer, _FlatPkgWriter)
+        phys_writer.write(CONTENT_TYPES_URI, (
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-'
+            'types"><Default Extension="rels" ContentType="app/rels+xml"/>'
+            '<Default Extension="png" ContentType="image/png"/>'
+            '<Override PartName="/word/document.xml" ContentType="app/doc+xml"/>'
+            '</Types>'
+        ).encode('utf-8'))
+        phys_writer.write(PACKAGE_URI.rels_uri, b'<Relationships/>')
+        phys_writer.write(
+            PackURI('/word/document.xml'),
+            '<?xml version="1.0" encoding="ISO-8859-1"?>\n<doc xmlns="urn:doc">'
+            'caf\xe9</doc>'.encode('latin-1'),
+        )
+        phys_writer.write(PackURI('/word/media/image1.png'), b'\x89PNG')
+        phys_writer.close()
+        pkg_file.seek(0)
+        return pkg_file
+
+
 class DescribeZipPkgReader(object):
 
     def it_is_used_by_PhysPkgReader_when_pkg_is_a_zip(self):
@@ -136,18 +222,90 @@ class DescribeZipPkgReader(object):
         return loose_mock(request)
 
 
+class DescribeMmapZipPkgReader(object):
+
+    def it_is_used_by_PhysPkgReader_when_pkg_is_an_mmap(self, pkg_mmap):
+        phys_reader = PhysPkgReader(pkg_mmap)
+        assert isinstance(phys_reader, _MmapZipPkgReader)
+        phys_reader.close()
+
+    def it_shares_the_mapped_bytes_of_a_stored_member(self, pkg_mmap):
+        phys_reader = PhysPkgReader(pkg_mmap)
+        blob = phys_reader.blob_for(PackURI('/stored.bin'))
+        assert isinstance(blob, memoryview)
+        assert blob.tobytes() == b'stored-bytes'
+        phys_reader.close()
+
+    def it_inflates_a_deflated_member(self, pkg_mmap):
+        phys_reader = PhysPkgReader(pkg_mmap)
+        blob = phys_reader.blob_for(PackURI('/deflated.xml'))
+        assert blob == b'<deflated/>' * 100
+        phys_reader.close()
+
+    @pytest.mark.parametrize('membername', ['stored.bin', 'deflated.xml'])
+    def it_raises_on_a_corrupt_member(self, pkg_mmap, membername):
+        phys_reader = PhysPkgReader(pkg_mmap)
+        start = phys_reader._data_offset(phys_reader._zipf.getinfo(membername))
+        pkg_mmap[start:start + 1] = b'X' if pkg_mmap[start:start + 1] != b'X' else b'Y'
+
+        with pytest.raises(BadZipfile):
+            phys_reader.blob_for(PackURI('/%s' % membername))
+        phys_reader.close()
+
+    def it_reads_the_same_blobs_as_the_zip_reader(self, docx_mmap):
+        mmap_reader = PhysPkgReader(docx_mmap)
+        zip_reader = PhysPkgReader(zip_pkg_path)
+        for membername in zip_reader._zipf.namelist():
+            pack_uri = PackURI('/%s' % membername)
+            mmap_blob = mmap_reader.blob_for(pack_uri)
+            assert bytes(mmap_blob) == zip_reader.blob_for(pack_uri)
+        mmap_reader.close()
+        zip_reader.close()
+
+    def it_returns_none_when_part_has_no_rels_xml(self, docx_mmap):
+        phys_reader = PhysPkgReader(docx_mmap)
+        partname = PackURI('/ppt/viewProps.xml')
+        assert phys_reader.rels_xml_for(partname) is None
+        phys_reader.close()
+
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture
+    def docx_mmap(self, request):
+        with open(zip_pkg_path, 'rb') as f:
+            docx_mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return docx_mmap
+
+    @pytest.fixture
+    def pkg_mmap(self, request):
+        stream = BytesIO()
+        zipf = ZipFile(stream, 'w')
+        zipf.writestr('stored.bin', b'stored-bytes', ZIP_STORED)
+        zipf.writestr('deflated.xml', b'<deflated/>' * 100, ZIP_DEFLATED)
+        zipf.close()
+        zip_bytes = stream.getvalue()
+        pkg_mmap = mmap.mmap(-1, len(zip_bytes))
+        pkg_mmap.write(zip_bytes)
+        return pkg_mmap
+
+
 class DescribeZipPkgWriter(object):
 
     def it_is_used_by_PhysPkgWriter_unconditionally(self, tmp_docx_path):
         phys_writer = PhysPkgWriter(tmp_docx_path)
         assert isinstance(phys_writer, _ZipPkgWriter)
 
+    def it_raises_on_an_unsupported_format(self):
+        with pytest.raises(ValueError):
+            PhysPkgWriter(BytesIO(), 'tar')
+
     def it_opens_pkg_file_zip_on_construction(self, ZipFile_):
         pkg_file = Mock(name='pkg_file')
-        _ZipPkgWriter(pkg_file)
+        zip_pkg_writer = _ZipPkgWriter(pkg_file)
         ZipFile_.assert_called_once_with(
-            pkg_file, 'w', compression=ZIP_DEFLATED
+            zip_pkg_writer._file, 'w', compression=ZIP_DEFLATED
         )
+        assert zip_pkg_writer._file._file is pkg_file
 
     def it_can_be_closed(self, ZipFile_):
         # mockery ----------------------
@@ -174,11 +332,144 @@ class DescribeZipPkgWriter(object):
         retrieved_blob_sha1 = hashlib.sha1(retrieved_blob).hexdigest()
         assert retrieved_blob_sha1 == written_blob_sha1
 
+    def it_can_write_a_member_as_a_stream(self, pkg_file):
+        pkg_writer = PhysPkgWriter(pkg_file)
+        stream = pkg_writer.open(PackURI('/part/big.xml'))
+        stream.write(b'<Big>')
+        stream.write(b'</Big>')
+        stream.close()
+        pkg_writer.write(PackURI('/part/name.xml'), b'<Foo/>')
+        pkg_writer.close()
+
+        zipf = ZipFile(pkg_file, 'r')
+        assert zipf.read('part/big.xml') == b'<Big></Big>'
+        assert zipf.read('part/name.xml') == b'<Foo/>'
+        zipf.close()
+
+    def it_leaves_no_package_behind_when_aborted(self, pkg_file, tmp_docx_path):
+        for target in (pkg_file, tmp_docx_path):
+            pkg_writer = PhysPkgWriter(target)
+            pkg_writer.write(PackURI('/part/name.xml'), b'<Foo/>')
+            stream = pkg_writer.open(PackURI('/part/big.xml'))
+            stream.write(b'<Big>')
+            stream.close()
+            pkg_writer.abort()
+
+        assert not is_zipfile(pkg_file)
+        assert not os.path.exists(tmp_docx_path)
+
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture
+    def pkg_file(self, request):
+        pkg_file = BytesIO()
+        request.addfinalizer(pkg_file.close)
+        return pkg_file
+
+
+class DescribeZipPkgUpdater(object):
+
+    def it_is_used_by_PhysPkgUpdater_unconditionally(self, tmp_docx_path):
+        phys_updater = PhysPkgUpdater(tmp_docx_path)
+        assert isinstance(phys_updater, _ZipPkgUpdater)
+        phys_updater.close()
+
+    def it_raises_when_pkg_path_is_not_a_package(self):
+        with pytest.raises(PackageNotFoundError):
+            PhysPkgUpdater(dir_pkg_path + '/[Content_Types].xml')
+
+    def it_rewrites_only_changed_members(self, pkg_file):
+        pkg_updater = PhysPkgUpdater(pkg_file)
+        pkg_updater.write(PackURI('/foo.xml'), b'<foo/>')
+        pkg_updater.write(PackURI('/baz.xml'), b'<baz-changed/>')
+        pkg_updater.close()
+
+        zipf = ZipFile(pkg_file, 'r')
+        assert sorted(zipf.namelist()) == ['baz.xml', 'foo.xml']
+        assert zipf.read('foo.xml') == b'<foo/>'
+        assert zipf.read('baz.xml') == b'<baz-changed/>'
+        assert zipf.testzip() is None
+        zipf.close()
+
+    def it_can_replace_a_member_as_a_stream_keeping_the_rest(self, pkg_file):
+        pkg_updater = PhysPkgUpdater(pkg_file)
+        stream = pkg_updater.open(PackURI('/bar.xml'))
+        stream.write(b'<bar>streamed</bar>')
+        stream.close()
+        pkg_updater.keep_unwritten()
+        pkg_updater.close()
+
+        zipf = ZipFile(pkg_file, 'r')
+        assert sorted(zipf.namelist()) == ['bar.xml', 'baz.xml', 'foo.xml']
+        assert zipf.read('bar.xml') == b'<bar>streamed</bar>'
+        assert zipf.read('baz.xml') == b'<baz/>'
+        assert zipf.testzip() is None
+        zipf.close()
+
+    def it_replaces_a_package_at_a_path_only_on_close(self, pkg_file, tmpdir):
+        pkg_path = str(tmpdir.join('pkg.zip'))
+        original = pkg_file.getvalue()
+        with open(pkg_path, 'wb') as f:
+            f.write(original)
+
+        pkg_updater = PhysPkgUpdater(pkg_path)
+        pkg_updater.write(PackURI('/baz.xml'), b'<baz-changed/>')
+        pkg_updater.keep_unwritten()
+        with open(pkg_path, 'rb') as f:
+            assert f.read() == original
+        pkg_updater.close()
+
+        zipf = ZipFile(pkg_path, 'r')
+        assert zipf.read('baz.xml') == b'<baz-changed/>'
+        assert zipf.read('foo.xml') == b'<foo/>'
+        zipf.close()
+        assert tmpdir.listdir() == [tmpdir.join('pkg.zip')]
+
+    def it_uses_zip64_records_for_sizes_and_offsets_too_large(
+        self, pkg_file, monkeypatch
+    ):
+        monkeypatch.setattr('docx.opc.phys_pkg._ZIP32_MAX', 10)
+        pkg_updater = PhysPkgUpdater(pkg_file)
+        pkg_updater.write(PackURI('/baz.xml'), b'<baz-changed/>')
+        stream = pkg_updater.open(PackURI('/big.xml'))
+        stream.write(b'<big/>' * 100)
+        stream.close()
+        pkg_updater.keep_unwritten()
+        pkg_updater.close()
+
+        zipf = ZipFile(pkg_file, 'r')
+        assert zipf.testzip() is None
+        assert zipf.read('big.xml') == b'<big/>' * 100
+        assert zipf.read('foo.xml') == b'<foo/>'
+        zipf.close()
+
+    def it_leaves_the_package_untouched_when_aborted(self, pkg_file, tmpdir):
+        pkg_path = str(tmpdir.join('pkg.zip'))
+        original = pkg_file.getvalue()
+        with open(pkg_path, 'wb') as f:
+            f.write(original)
+
+        for target in (pkg_file, pkg_path):
+            pkg_updater = PhysPkgUpdater(target)
+            stream = pkg_updater.open(PackURI('/bar.xml'))
+            stream.write(b'<bar>partial')
+            pkg_updater.abort()
+
+        assert pkg_file.getvalue() == original
+        with open(pkg_path, 'rb') as f:
+            assert f.read() == original
+        assert tmpdir.listdir() == [tmpdir.join('pkg.zip')]
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
     def pkg_file(self, request):
         pkg_file = BytesIO()
+        zipf = ZipFile(pkg_file, 'w', compression=ZIP_DEFLATED)
+        zipf.writestr('foo.xml', b'<foo/>')
+        zipf.writestr('bar.xml', b'<bar/>')
+        zipf.writestr('baz.xml', b'<baz/>')
+        zipf.close()
         request.addfinalizer(pkg_file.close)
         return pkg_file
 
@@ -8,7 +8,7 @@ import pytest
 
 from docx.opc.constants import CONTENT_TYPE as CT
 from docx.opc.packuri import PackURI
-from docx.opc.part import Part
+from docx.opc.part import Part, XmlPart
 from docx.opc.phys_pkg import _ZipPkgWriter
 from docx.opc.pkgwriter import _ContentTypesItem, PackageWriter
 
@@ -32,12 +32,36 @@ class DescribePackageWriter(object):
         expected_calls = [
             call._write_content_types_stream(phys_writer, parts),
             call._write_pkg_rels(phys_writer, pkg_rels),
-            call._write_parts(phys_writer, parts),
+            call._write_parts(phys_writer, parts, False),
         ]
-        PhysPkgWriter_.assert_called_once_with(pkg_file)
+        PhysPkgWriter_.assert_called_once_with(pkg_file, 'zip')
         assert _write_methods.mock_calls == expected_calls
         phys_writer.close.assert_called_once_with()
 
+    def it_can_update_a_package(self, PhysPkgUpdater_, _write_methods):
+        pkg_file, pkg_rels, parts = 'foo.docx', Mock(name='pkg_rels'), []
+        phys_writer = PhysPkgUpdater_.return_value
+
+        PackageWriter.update(pkg_file, pkg_rels, parts)
+
+        PhysPkgUpdater_.assert_called_once_with(pkg_file)
+        assert _write_methods.mock_calls == [
+            call._write_content_types_stream(phys_writer, parts),
+            call._write_pkg_rels(phys_writer, pkg_rels),
+            call._write_parts(phys_writer, parts),
+        ]
+        phys_writer.close.assert_called_once_with()
+
+    def it_abandons_the_update_when_it_fails(self, PhysPkgUpdater_, _write_methods):
+        phys_writer = PhysPkgUpdater_.return_value
+        _write_methods._write_parts.side_effect = ValueError
+
+        with pytest.raises(ValueError):
+            PackageWriter.update('foo.docx', Mock(name='pkg_rels'), [])
+
+        phys_writer.abort.assert_called_once_with()
+        assert phys_writer.close.call_count == 0
+
     def it_can_write_a_content_types_stream(self, write_cti_fixture):
         _ContentTypesItem_, parts_, phys_pkg_writer_, blob_ = (
             write_cti_fixture
@@ -75,6 +99,18 @@ class DescribePackageWriter(object):
         ]
         assert phys_writer.write.mock_calls == expected_calls
 
+    def it_can_write_xml_parts_with_their_namespaces_cleaned_up(self):
+        phys_writer = Mock(name='phys_writer')
+        xml_part = Mock(name='xml_part', spec=XmlPart, _rels=[])
+        part = Mock(name='part', _rels=[])
+
+        PackageWriter._write_parts(phys_writer, [xml_part, part], True)
+
+        assert phys_writer.write.mock_calls == [
+            call(xml_part.partname, xml_part.clean_blob),
+            call(part.partname, part.blob),
+        ]
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -97,6 +133,12 @@ class DescribePackageWriter(object):
     def parts_(self, request):
         return instance_mock(request, list)
 
+    @pytest.fixture
+    def PhysPkgUpdater_(self, request):
+        _patch = patch('docx.opc.pkgwriter.PhysPkgUpdater')
+        request.addfinalizer(_patch.stop)
+        return _patch.start()
+
     @pytest.fixture
     def PhysPkgWriter_(self, request):
         _patch = patch('docx.opc.pkgwriter.PhysPkgWriter')
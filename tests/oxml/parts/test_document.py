@@ -8,6 +8,10 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import pytest
 
+from lxml import etree
+
+from docx.oxml.ns import qn
+
 from ...unitutil.cxml import element, xml
 
 
@@ -24,6 +28,22 @@ class DescribeCT_Body(object):
         assert body.xml == expected_xml
         assert sectPr is body.get_or_add_sectPr()
 
+    def it_inserts_block_items_before_the_sentinel_sectPr(self, insert_fixture):
+        body, expected_xml = insert_fixture
+        body.add_p()
+        body.add_tbl()
+        assert body.xml == expected_xml
+
+    def it_inserts_block_items_before_a_sectPr_followed_by_a_comment(self):
+        body = element('w:body/(w:p,w:sectPr)')
+        body.append(etree.Comment('end'))
+        body.append(etree.ProcessingInstruction('foo'))
+
+        p = body.add_p()
+
+        assert p.getnext() is body[-3]
+        assert body[-3].tag == qn('w:sectPr')
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(params=[
@@ -39,6 +59,18 @@ class DescribeCT_Body(object):
         expected_xml = xml(after_cxml)
         return body, expected_xml
 
+    @pytest.fixture(params=[
+        ('w:body',                 'w:body/(w:p,w:tbl)'),
+        ('w:body/w:p',             'w:body/(w:p,w:p,w:tbl)'),
+        ('w:body/w:sectPr',        'w:body/(w:p,w:tbl,w:sectPr)'),
+        ('w:body/(w:tbl,w:sectPr)', 'w:body/(w:tbl,w:p,w:tbl,w:sectPr)'),
+    ])
+    def insert_fixture(self, request):
+        before_cxml, after_cxml = request.param
+        body = element(before_cxml)
+        expected_xml = xml(after_cxml)
+        return body, expected_xml
+
     @pytest.fixture
     def section_break_fixture(self):
         body = element('w:body/w:sectPr/w:type{w:val=foobar}')
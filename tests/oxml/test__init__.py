@@ -11,9 +11,10 @@ import pytest
 from lxml import etree
 
 from docx.oxml import (
-    OxmlElement, oxml_parser, parse_xml, register_element_cls
+    cleanup_namespaces, new_from_prototype, OxmlElement, oxml_parser, parse_xml,
+    register_element_cls
 )
-from docx.oxml.ns import qn
+from docx.oxml.ns import nsdecls, qn
 from docx.oxml.shared import BaseOxmlElement
 
 
@@ -42,6 +43,40 @@ class DescribeOxmlElement(object):
         assert element.nsmap['x'] == ns2
 
 
+class Describe_cleanup_namespaces(object):
+
+    def it_hoists_repeated_namespace_declarations_to_the_root(self):
+        root = parse_xml(
+            '<w:body %s xmlns:x="urn:unused"/>' % nsdecls('w')
+        )
+        for _ in range(2):
+            root.append(parse_xml('<a:foo %s/>' % nsdecls('a', 'pic')))
+
+        cleanup_namespaces(root)
+
+        xml = etree.tostring(root, encoding='unicode')
+        assert xml.count('xmlns:a=') == 1
+        assert 'xmlns:pic=' not in xml
+        # ---prefixes declared on the root are kept, even when unused---
+        assert root.nsmap['x'] == 'urn:unused'
+        assert root[0].nsmap['a'] == root.nsmap['a']
+
+    def it_keeps_prefixes_named_by_markup_compatibility_attributes(self):
+        root = parse_xml(
+            '<w:body %s xmlns:mc="http://schemas.openxmlformats.org/markup-compatibi'
+            'lity/2006"><w:p xmlns:w15="urn:w15" xmlns:x="urn:x" mc:Ignorable="w15">'
+            '<mc:AlternateContent xmlns:wps="urn:wps"><mc:Choice Requires="wps">'
+            '<w:r/></mc:Choice></mc:AlternateContent></w:p></w:body>' % nsdecls('w')
+        )
+
+        cleanup_namespaces(root)
+
+        xml = etree.tostring(root, encoding='unicode')
+        assert 'xmlns:w15="urn:w15"' in xml
+        assert 'xmlns:wps="urn:wps"' in xml
+        assert 'urn:x' not in xml
+
+
 class DescribeOxmlParser(object):
 
     def it_strips_whitespace_between_elements(self, whitespace_fixture):
@@ -63,6 +98,25 @@ class DescribeOxmlParser(object):
         return pretty_xml_text, stripped_xml_text
 
 
+class Describe_new_from_prototype(object):
+
+    def it_parses_the_prototype_once_and_returns_copies_of_it(self):
+        calls = []
+
+        def xml():
+            calls.append(None)
+            return '<w:p %s><w:r/></w:p>' % nsdecls('w')
+
+        p = new_from_prototype('test:w:p', xml)
+        p.append(OxmlElement('w:r'))
+        p2 = new_from_prototype('test:w:p', xml)
+
+        assert len(calls) == 1
+        assert p2 is not p
+        assert etree.tostring(p2) == etree.tostring(parse_xml(xml()))
+        assert type(p2) is type(parse_xml(xml()))
+
+
 class DescribeParseXml(object):
 
     def it_accepts_bytes_and_assumes_utf8_encoding(self, xml_bytes):
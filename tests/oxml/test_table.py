@@ -8,7 +8,7 @@ import pytest
 
 from docx.exceptions import InvalidSpanError
 from docx.oxml import parse_xml
-from docx.oxml.table import CT_Row, CT_Tc
+from docx.oxml.table import CT_Row, CT_Tbl, CT_Tc
 
 from ..unitutil.cxml import element, xml
 from ..unitutil.file import snippet_seq
@@ -49,6 +49,32 @@ class DescribeCT_Row(object):
         return tr, col_idx
 
 
+class DescribeCT_Tbl(object):
+
+    def it_updates_each_distinct_tcPr_once(self):
+        tbl = element(
+            'w:tbl/w:tr/(w:tc,w:tc/w:tcPr/w:vAlign{w:val=top},'
+            'w:tc/w:tcPr/w:vAlign{w:val=top},w:tc)'
+        )
+        updated = []
+
+        def update(tcPr):
+            updated.append(tcPr)
+            tcPr.grid_span = 2
+
+        tcs = list(tbl.iter_tcs())
+
+        CT_Tbl.update_tcPrs(tcs, update)
+
+        assert updated == [tcs[0].tcPr, tcs[1].tcPr]
+        assert tbl.xml == xml(
+            'w:tbl/w:tr/(w:tc/w:tcPr/w:gridSpan{w:val=2},'
+            'w:tc/w:tcPr/(w:gridSpan{w:val=2},w:vAlign{w:val=top}),'
+            'w:tc/w:tcPr/(w:gridSpan{w:val=2},w:vAlign{w:val=top}),'
+            'w:tc/w:tcPr/w:gridSpan{w:val=2})'
+        )
+
+
 class DescribeCT_Tc(object):
 
     def it_can_merge_to_another_tc(
@@ -332,3 +358,19 @@ class DescribeCT_Tc(object):
     @pytest.fixture
     def tr_(self, request):
         return instance_mock(request, CT_Row)
+
+
+class DescribeCT_TcPr(object):
+
+    def it_sets_borders_without_touching_the_cell_margins(self):
+        tcPr = element('w:tcPr/w:tcMar/w:top{w:w=108,w:type=dxa}')
+
+        tcPr.set_borders({'top': 'single', 'bottom': 'nil'})
+
+        assert tcPr.xml == xml(
+            'w:tcPr/(w:tcBorders/(w:top{w:val=single,w:sz=4,w:space=0},'
+            'w:bottom{w:val=nil,w:sz=4,w:space=0}),'
+            'w:tcMar/w:top{w:w=108,w:type=dxa})'
+        )
+        margin = tcPr[1][0]
+        assert getattr(margin, 'val', None) is None
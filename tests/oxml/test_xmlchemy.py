@@ -20,6 +20,7 @@ from docx.oxml.xmlchemy import (
 )
 
 from ..unitdata import BaseBuilder
+from ..unitutil.cxml import element, xml
 from .unitdata.text import a_b, a_u, an_i, an_rPr
 
 
@@ -36,6 +37,11 @@ class DescribeBaseOxmlElement(object):
         element.insert_element_before(child, *tagnames)
         assert element.xml == expected_xml
 
+    def it_can_merge_children_into_schema_sequence(self, merge_fixture):
+        element, children, expected_xml = merge_fixture
+        element.merge_children(children)
+        assert element.xml == expected_xml
+
     def it_can_remove_all_children_with_name_in_sequence(
             self, remove_fixture):
         element, tagnames, expected_xml = remove_fixture
@@ -76,6 +82,18 @@ class DescribeBaseOxmlElement(object):
         expected_xml = self.rPr_bldr(after).xml()
         return element, child, tagnames, expected_xml
 
+    @pytest.fixture(params=[
+        ('w:rPr', ('w:u', 'w:b'), 'w:rPr/(w:b,w:u)'),
+        ('w:rPr/(w:rFonts,w:sz)', ('w:u', 'w:b'), 'w:rPr/(w:rFonts,w:b,w:sz,w:u)'),
+        ('w:rPr/(w:i,w:foo,w:sz)', ('w:b',), 'w:rPr/(w:b,w:i,w:foo,w:sz)'),
+        ('w:rPr/(w:lang,w:foo)', ('w:oMath', 'w:i'),
+         'w:rPr/(w:i,w:lang,w:foo,w:oMath)'),
+    ])
+    def merge_fixture(self, request):
+        element_cxml, child_cxmls, expected_cxml = request.param
+        children = [element(child_cxml) for child_cxml in child_cxmls]
+        return element(element_cxml), children, xml(expected_cxml)
+
     @pytest.fixture(params=[
         ('biu', 'b', 'iu'), ('biu', 'bi', 'u'), ('bbiiuu',  'i',   'bbuu'),
         ('biu', 'i', 'bu'), ('biu', 'bu', 'i'), ('bbiiuu',   '', 'bbiiuu'),
@@ -9,6 +9,7 @@ import pytest
 from docx.enum.style import WD_STYLE_TYPE
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.coreprops import CoreProperties
+from docx.opc.packuri import PackURI
 from docx.package import Package
 from docx.parts.document import DocumentPart
 from docx.parts.hdrftr import FooterPart, HeaderPart
@@ -20,6 +21,7 @@ from docx.styles.style import BaseStyle
 from docx.styles.styles import Styles
 
 from ..oxml.parts.unitdata.document import a_body, a_document
+from ..unitutil.cxml import element
 from ..unitutil.mock import class_mock, instance_mock, method_mock, property_mock
 
 
@@ -49,6 +51,25 @@ class DescribeDocumentPart(object):
         assert header_part is header_part_
         assert rId == "rId7"
 
+    def it_can_build_a_text_index_over_its_stories(self, header_part_, footer_part_):
+        document_part = DocumentPart(
+            PackURI('/word/document.xml'), None, element('w:document/w:body'), None
+        )
+        footer_part_.partname = PackURI('/word/footer1.xml')
+        footer_part_.element = element('w:ftr/w:p/w:r/w:t"foo"')
+        header_part_.partname = PackURI('/word/header1.xml')
+        header_part_.element = element('w:hdr/w:p/w:r/w:t"foo"')
+        document_part.relate_to(footer_part_, RT.FOOTER)
+        document_part.relate_to(header_part_, RT.HEADER)
+        document_part.relate_to('http://foo', RT.HYPERLINK, is_external=True)
+
+        index = document_part.build_text_index()
+
+        assert document_part.text_index is index
+        assert [hit.partname for hit in index.search('foo')] == [
+            '/word/footer1.xml', '/word/header1.xml'
+        ]
+
     def it_can_drop_a_specified_header_part(self, drop_rel_):
         document_part = DocumentPart(None, None, None, None)
 
@@ -83,7 +104,12 @@ class DescribeDocumentPart(object):
     def it_can_save_the_package_to_a_file(self, save_fixture):
         document, file_ = save_fixture
         document.save(file_)
-        document._package.save.assert_called_once_with(file_)
+        document._package.save.assert_called_once_with(file_, False, 'zip')
+
+    def it_can_save_the_package_incrementally(self, save_fixture):
+        document, file_ = save_fixture
+        document.save_incremental(file_)
+        document._package.save_incremental.assert_called_once_with(file_)
 
     def it_provides_access_to_the_document_settings(self, settings_fixture):
         document_part, settings_ = settings_fixture
@@ -104,8 +130,11 @@ class DescribeDocumentPart(object):
             self, inline_shapes_fixture):
         document, InlineShapes_, body_elm = inline_shapes_fixture
         inline_shapes = document.inline_shapes
-        InlineShapes_.assert_called_once_with(body_elm, document)
+        InlineShapes_.assert_called_once_with(
+            body_elm, document, document.shape_index
+        )
         assert inline_shapes is InlineShapes_.return_value
+        assert document.shape_index._story_elm is body_elm
 
     def it_provides_access_to_the_numbering_part(
         self, part_related_by_, numbering_part_
@@ -175,6 +204,13 @@ class DescribeDocumentPart(object):
         relate_to_.assert_called_once_with(document_part, settings_part_, RT.SETTINGS)
         assert settings_part is settings_part_
 
+    def it_provides_access_to_its_style_resolver(
+        self, _styles_part_prop_, styles_part_
+    ):
+        _styles_part_prop_.return_value = styles_part_
+        document_part = DocumentPart(None, None, None, None)
+        assert document_part.style_resolver is styles_part_.style_resolver
+
     def it_provides_access_to_its_styles_part_to_help(
         self, part_related_by_, styles_part_
     ):
@@ -266,7 +302,7 @@ class DescribeDocumentPart(object):
 
     @pytest.fixture
     def InlineShapes_(self, request):
-        return class_mock(request, 'docx.parts.document.InlineShapes')
+        return class_mock(request, 'docx.parts.story.InlineShapes')
 
     @pytest.fixture
     def NumberingPart_(self, request):
@@ -32,18 +32,16 @@ class DescribeFooterPart(object):
         assert part is footer_part_
 
     def it_can_create_a_new_footer_part(
-        self, package_, _default_footer_xml_, parse_xml_, _init_
+        self, package_, _default_footer_xml_, new_from_prototype_, _init_
     ):
         ftr = element("w:ftr")
         package_.next_partname.return_value = "/word/footer24.xml"
-        _default_footer_xml_.return_value = "<w:ftr>"
-        parse_xml_.return_value = ftr
+        new_from_prototype_.return_value = ftr
 
         footer_part = FooterPart.new(package_)
 
         package_.next_partname.assert_called_once_with("/word/footer%d.xml")
-        _default_footer_xml_.assert_called_once_with()
-        parse_xml_.assert_called_once_with("<w:ftr>")
+        new_from_prototype_.assert_called_once_with("w:ftr", _default_footer_xml_)
         _init_.assert_called_once_with(
             footer_part, "/word/footer24.xml", CT.WML_FOOTER, ftr, package_
         )
@@ -80,8 +78,8 @@ class DescribeFooterPart(object):
         return instance_mock(request, Package)
 
     @pytest.fixture
-    def parse_xml_(self, request):
-        return function_mock(request, "docx.parts.hdrftr.parse_xml")
+    def new_from_prototype_(self, request):
+        return function_mock(request, "docx.parts.hdrftr.new_from_prototype")
 
 
 class DescribeHeaderPart(object):
@@ -101,18 +99,16 @@ class DescribeHeaderPart(object):
         assert part is header_part_
 
     def it_can_create_a_new_header_part(
-        self, package_, _default_header_xml_, parse_xml_, _init_
+        self, package_, _default_header_xml_, new_from_prototype_, _init_
     ):
         hdr = element("w:hdr")
         package_.next_partname.return_value = "/word/header42.xml"
-        _default_header_xml_.return_value = "<w:hdr>"
-        parse_xml_.return_value = hdr
+        new_from_prototype_.return_value = hdr
 
         header_part = HeaderPart.new(package_)
 
         package_.next_partname.assert_called_once_with("/word/header%d.xml")
-        _default_header_xml_.assert_called_once_with()
-        parse_xml_.assert_called_once_with("<w:hdr>")
+        new_from_prototype_.assert_called_once_with("w:hdr", _default_header_xml_)
         _init_.assert_called_once_with(
             header_part, "/word/header42.xml", CT.WML_HEADER, hdr, package_
         )
@@ -149,5 +145,5 @@ class DescribeHeaderPart(object):
         return instance_mock(request, Package)
 
     @pytest.fixture
-    def parse_xml_(self, request):
-        return function_mock(request, "docx.parts.hdrftr.parse_xml")
+    def new_from_prototype_(self, request):
+        return function_mock(request, "docx.parts.hdrftr.new_from_prototype")
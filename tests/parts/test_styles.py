@@ -12,6 +12,7 @@ from docx.opc.constants import CONTENT_TYPE as CT
 from docx.opc.package import OpcPackage
 from docx.oxml.styles import CT_Styles
 from docx.parts.styles import StylesPart
+from docx.styles.resolver import StyleResolver
 from docx.styles.styles import Styles
 
 from ..unitutil.mock import class_mock, instance_mock
@@ -25,6 +26,19 @@ class DescribeStylesPart(object):
         Styles_.assert_called_once_with(styles_part.element)
         assert styles is styles_
 
+    def it_provides_access_to_its_style_resolver(self, request, styles_elm_):
+        style_resolver_ = instance_mock(request, StyleResolver)
+        StyleResolver_ = class_mock(
+            request, 'docx.parts.styles.StyleResolver', return_value=style_resolver_
+        )
+        styles_part = StylesPart(None, None, styles_elm_, None)
+
+        style_resolver = styles_part.style_resolver
+
+        StyleResolver_.assert_called_once_with(styles_elm_)
+        assert style_resolver is style_resolver_
+        assert styles_part.style_resolver is style_resolver
+
     def it_can_construct_a_default_styles_part_to_help(self):
         package = OpcPackage()
         styles_part = StylesPart.default(package)
@@ -0,0 +1,143 @@
+# encoding: utf-8
+
+"""Unit test suite for the docx.styles.resolver module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import pytest
+
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.shared import Pt
+from docx.styles.resolver import (
+    FONT_PROPERTIES,
+    font_properties,
+    PARAGRAPH_FORMAT_PROPERTIES,
+    paragraph_format_properties,
+    StyleResolver,
+)
+
+from ..unitutil.cxml import element
+
+
+class DescribeStyleResolver(object):
+
+    def it_resolves_the_effective_font_of_a_run(self, font_fixture):
+        resolver, r, expected_values = font_fixture
+        properties = resolver.effective_font(r)
+        assert set(properties) == set(FONT_PROPERTIES)
+        for name, value in expected_values.items():
+            assert properties[name] == value
+
+    def it_resolves_the_effective_format_of_a_paragraph(self, styles_elm):
+        resolver = StyleResolver(styles_elm)
+        p = element('w:p/w:pPr/(w:pStyle{w:val=Heading1},w:jc{w:val=center})')
+
+        properties = resolver.effective_paragraph_format(p)
+
+        assert set(properties) == set(PARAGRAPH_FORMAT_PROPERTIES)
+        assert properties['alignment'] == WD_ALIGN_PARAGRAPH.CENTER
+        assert properties['space_after'] == Pt(8)
+        assert properties['keep_with_next'] is True
+        assert properties['widow_control'] is None
+
+    def it_caches_the_cascade_until_reset(self, styles_elm):
+        resolver = StyleResolver(styles_elm)
+        r = element('w:r/w:rPr/w:rStyle{w:val=Strong}')
+        assert resolver.effective_font(r)['bold'] is True
+
+        styles_elm.xpath('w:style[@w:styleId="Strong"]/w:rPr/w:b')[0].val = False
+        assert resolver.effective_font(r)['bold'] is True
+        resolver.reset()
+        assert resolver.effective_font(r)['bold'] is False
+
+    def it_flattens_the_properties_defined_by_a_style(self, styles_elm):
+        resolver = StyleResolver(styles_elm)
+        assert resolver.style_font('Heading1') == {
+            'bold': True, 'name': 'Cambria', 'size': Pt(14)
+        }
+        assert resolver.style_paragraph_format('Heading1') == {
+            'keep_with_next': True, 'space_after': Pt(8)
+        }
+        assert resolver.style_font('Foo') == {}
+
+    def it_tolerates_a_cycle_in_the_basedOn_chain(self):
+        styles_elm = element(
+            'w:styles/('
+            'w:style{w:type=paragraph,w:styleId=A}/(w:basedOn{w:val=B},w:rPr/w:i),'
+            'w:style{w:type=paragraph,w:styleId=B}/(w:basedOn{w:val=A},w:rPr/w:b))'
+        )
+        resolver = StyleResolver(styles_elm)
+        p = element('w:p/(w:pPr/w:pStyle{w:val=A},w:r)')
+
+        properties = resolver.effective_font(p[1])
+
+        assert properties['italic'] is True
+        assert properties['bold'] is True
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        # ---document defaults and default paragraph style---
+        ('w:p/w:r', {'size': Pt(11), 'name': 'Calibri', 'bold': None}),
+        # ---paragraph style chain overrides defaults---
+        ('w:p/(w:pPr/w:pStyle{w:val=Heading1},w:r)',
+         {'size': Pt(14), 'name': 'Cambria', 'bold': True}),
+        # ---unknown paragraph style falls back to default paragraph style---
+        ('w:p/(w:pPr/w:pStyle{w:val=Foo},w:r)', {'size': Pt(11), 'italic': None}),
+        # ---toggle property in both paragraph and character style cancels---
+        ('w:p/(w:pPr/w:pStyle{w:val=Heading1},w:r/w:rPr/w:rStyle{w:val=Strong})',
+         {'bold': False, 'size': Pt(14)}),
+        # ---direct formatting is absolute---
+        ('w:p/(w:pPr/w:pStyle{w:val=Heading1},w:r/w:rPr/(w:rStyle{w:val=Strong},'
+         'w:b,w:sz{w:val=40}))', {'bold': True, 'size': Pt(20)}),
+        # ---run in a hyperlink still finds its paragraph---
+        ('w:p/(w:pPr/w:pStyle{w:val=Heading1},w:hyperlink/w:r)', {'bold': True}),
+    ])
+    def font_fixture(self, request, styles_elm):
+        p_cxml, expected_values = request.param
+        p = element(p_cxml)
+        r = p.xpath('.//w:r')[0]
+        return StyleResolver(styles_elm), r, expected_values
+
+    # fixture components ---------------------------------------------
+
+    @pytest.fixture
+    def styles_elm(self):
+        return element(
+            'w:styles/('
+            'w:docDefaults/('
+            '  w:rPrDefault/w:rPr/(w:rFonts{w:ascii=Calibri},w:sz{w:val=22}),'
+            '  w:pPrDefault/w:pPr/w:spacing{w:after=160}),'
+            'w:style{w:type=paragraph,w:default=1,w:styleId=Normal}/'
+            '  w:pPr/w:spacing{w:after=160},'
+            'w:style{w:type=paragraph,w:styleId=Heading1}/('
+            '  w:basedOn{w:val=Normal},'
+            '  w:pPr/(w:keepNext,w:spacing{w:after=160}),'
+            '  w:rPr/(w:rFonts{w:ascii=Cambria},w:b,w:sz{w:val=28})),'
+            'w:style{w:type=character,w:default=1,w:styleId=DefaultParagraphFont},'
+            'w:style{w:type=character,w:styleId=Strong}/('
+            '  w:basedOn{w:val=DefaultParagraphFont},w:rPr/w:b))'
+        )
+
+
+class Describe_font_properties(object):
+
+    def it_reads_only_the_properties_that_are_specified(self):
+        r = element('w:r/w:rPr/(w:b,w:i{w:val=0},w:color{w:val=FF0000})')
+        properties = font_properties(r)
+        assert sorted(properties) == ['bold', 'color', 'italic']
+        assert properties['italic'] is False
+        assert str(properties['color']) == 'FF0000'
+
+    def it_returns_an_empty_dict_when_no_rPr(self):
+        assert font_properties(element('w:r')) == {}
+
+
+class Describe_paragraph_format_properties(object):
+
+    def it_reads_only_the_properties_that_are_specified(self):
+        p = element('w:p/w:pPr/w:ind{w:left=1440}')
+        assert paragraph_format_properties(p) == {'left_indent': 914400}
+
+    def it_returns_an_empty_dict_when_no_pPr(self):
+        assert paragraph_format_properties(element('w:p')) == {}
@@ -7,13 +7,15 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 import pytest
 
 from docx.blkcntnr import BlockItemContainer
+from docx.enum.style import WD_STYLE_TYPE
+from docx.parts.document import DocumentPart
 from docx.shared import Inches
 from docx.table import Table
 from docx.text.paragraph import Paragraph
 
 from .unitutil.cxml import element, xml
 from .unitutil.file import snippet_seq
-from .unitutil.mock import call, instance_mock, method_mock
+from .unitutil.mock import call, instance_mock, method_mock, property_mock
 
 
 class DescribeBlockItemContainer(object):
@@ -30,6 +32,33 @@ class DescribeBlockItemContainer(object):
         assert paragraph.style == style
         assert paragraph is paragraph_
 
+    def it_can_add_a_block_of_text_as_paragraphs(self, append_many_):
+        blkcntnr = BlockItemContainer(None, None)
+        append_many_.return_value = paragraphs_ = [object(), object()]
+
+        paragraphs = blkcntnr.add_text_block('\nFoo\nBar\n\n \r\nBaz\n', 'Qux')
+
+        specs = list(append_many_.call_args[0][1])
+        assert specs == [('Foo\nBar', 'Qux'), ('Baz', 'Qux')]
+        assert paragraphs is paragraphs_
+
+    def it_can_append_many_paragraphs(self, part_prop_, document_part_):
+        part_prop_.return_value = document_part_
+        document_part_.get_style_id.return_value = 'BarStyle'
+        blkcntnr = BlockItemContainer(element('w:body/w:sectPr'), None)
+        specs = (spec for spec in ('Foo', ('', 'Bar'), ('Baz', 'Bar')))
+
+        paragraphs = blkcntnr.append_many(specs)
+
+        assert [p.text for p in paragraphs] == ['Foo', '', 'Baz']
+        assert blkcntnr._element.xml == xml(
+            'w:body/(w:p/w:r/w:t"Foo",w:p/w:pPr/w:pStyle{w:val=BarStyle},'
+            'w:p/(w:pPr/w:pStyle{w:val=BarStyle},w:r/w:t"Baz"),w:sectPr)'
+        )
+        document_part_.get_style_id.assert_called_once_with(
+            'Bar', WD_STYLE_TYPE.PARAGRAPH
+        )
+
     def it_can_add_a_table(self, add_table_fixture):
         blkcntnr, rows, cols, width, expected_xml = add_table_fixture
         table = blkcntnr.add_table(rows, cols, width)
@@ -127,6 +156,18 @@ class DescribeBlockItemContainer(object):
     def _add_paragraph_(self, request):
         return method_mock(request, BlockItemContainer, '_add_paragraph')
 
+    @pytest.fixture
+    def append_many_(self, request):
+        return method_mock(request, BlockItemContainer, 'append_many')
+
+    @pytest.fixture
+    def document_part_(self, request):
+        return instance_mock(request, DocumentPart)
+
     @pytest.fixture
     def paragraph_(self, request):
         return instance_mock(request, Paragraph)
+
+    @pytest.fixture
+    def part_prop_(self, request):
+        return property_mock(request, BlockItemContainer, 'part')
@@ -0,0 +1,171 @@
+# encoding: utf-8
+
+"""Unit test suite for the docx.compose module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import gc
+import weakref
+
+from docx.api import Document
+from docx.compose import Composer
+from docx.enum.style import WD_STYLE_TYPE
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.package import OpcPackage
+from docx.opc.packuri import PackURI
+from docx.opc.part import Part
+from docx.oxml.ns import qn
+
+from .unitutil.file import test_file
+from .unitutil.mock import patch
+
+
+class DescribeComposer(object):
+
+    def it_appends_body_content_before_the_final_section(self):
+        master, doc = Document(), Document()
+        master.add_paragraph('cover')
+        doc.add_paragraph('chapter')
+        composer = Composer(master)
+
+        composer.append(doc)
+        composer.append(doc)
+
+        assert [p.text for p in master.paragraphs] == ['cover', 'chapter', 'chapter']
+        assert master.element.body[-1].tag == qn('w:sectPr')
+        assert [p.text for p in doc.paragraphs] == ['chapter']
+        assert composer.document is master
+
+    def it_brings_over_the_section_breaks_of_an_appended_body(self):
+        master, doc = Document(), Document()
+        doc.add_paragraph('chapter')
+        doc.add_section()
+        composer = Composer(master)
+        assert len(master.sections) == 1
+
+        composer.append(doc)
+
+        assert len(master.sections) == 2
+        assert master.sections[0]._sectPr is master.paragraphs[1]._p.pPr.sectPr
+
+    def it_names_copied_parts_without_walking_the_master_package_again(
+        self, request
+    ):
+        master = Document()
+        docs = [self.doc_with_data_part(), self.doc_with_data_part()]
+        composer = Composer(master)
+        iter_parts = patch.object(
+            OpcPackage, 'iter_parts', autospec=True, side_effect=OpcPackage.iter_parts
+        )
+        iter_parts_ = iter_parts.start()
+        request.addfinalizer(iter_parts.stop)
+
+        for doc in docs:
+            composer.append(doc)
+
+        assert iter_parts_.call_count == 1
+        assert sorted(
+            rel.target_part.partname for rel in master.part.rels.values()
+            if rel.reltype == RT.PACKAGE
+        ) == ['/word/embeddings/data1.bin', '/word/embeddings/data2.bin']
+
+    def it_lets_go_of_a_document_once_it_is_appended(self):
+        master, doc = Document(), self.doc_with_data_part()
+        composer = Composer(master)
+        composer.append(doc)
+        doc_part = weakref.ref(doc.part)
+
+        del doc
+        gc.collect()
+
+        assert doc_part() is None
+
+    def it_shares_images_and_rewrites_relationship_references(self):
+        master, doc = Document(), Document()
+        master.add_picture(test_file('monty-truth.png'))
+        doc.add_picture(test_file('monty-truth.png'))
+        url_rId = doc.part.relate_to('http://x.org/', RT.HYPERLINK, is_external=True)
+        doc.paragraphs[0]._p.set(qn('r:id'), url_rId)
+        composer = Composer(master)
+
+        composer.append(doc)
+        composer.append(doc)
+
+        image_parts = master.part.package.image_parts
+        assert len(image_parts) == 1
+        blips = master.element.body.xpath('.//a:blip')
+        assert len(blips) == 3
+        related_parts = master.part.related_parts
+        embedded = set(related_parts[blip.get(qn('r:embed'))] for blip in blips)
+        assert embedded == set(image_parts)
+        p1, p2 = master.paragraphs[1]._p, master.paragraphs[2]._p
+        assert p1.get(qn('r:id')) == p2.get(qn('r:id'))
+        assert master.part.target_ref(p1.get(qn('r:id'))) == 'http://x.org/'
+
+    def it_copies_headers_referenced_by_appended_sections(self):
+        master, doc = Document(), Document()
+        doc.add_paragraph('one')
+        doc.add_section()
+        doc.sections[0].header.is_linked_to_previous = False
+        doc.sections[0].header.paragraphs[0].text = 'header'
+        composer = Composer(master)
+
+        composer.append(doc)
+
+        headerReference = master.element.body.xpath('.//w:headerReference')[0]
+        header_part = master.part.related_parts[headerReference.get(qn('r:id'))]
+        assert header_part.package is master.part.package
+        assert header_part.element.xpath('string(.//w:t)') == 'header'
+        assert len(master.sections) == 2
+
+    def it_merges_styles_by_content(self):
+        master, doc = Document(), Document()
+        master.styles.add_style('Fancy', WD_STYLE_TYPE.PARAGRAPH).font.italic = True
+        doc.styles.add_style('Fancy', WD_STYLE_TYPE.PARAGRAPH).font.bold = True
+        doc.add_paragraph('a', style='Fancy')
+        doc.add_paragraph('b', style='Heading 1')
+        style_count = len(master.styles)
+        composer = Composer(master)
+
+        composer.append(doc)
+
+        assert [p.style.style_id for p in master.paragraphs] == [
+            'Fancy1', 'Heading1'
+        ]
+        assert master.styles['Fancy 1'].font.bold is True
+        assert len(master.styles) == style_count + 1
+
+    def it_remaps_list_numbering(self):
+        master, doc = Document(), Document()
+        numbering = doc.part.numbering_part.element
+        abstractNum = numbering.find(qn('w:abstractNum'))
+        abstractNumId = abstractNum.get(qn('w:abstractNumId'))
+        numId = numbering.add_num(abstractNumId).numId
+        doc.add_paragraph('item')._p.get_or_add_pPr().get_or_add_numPr(
+        ).get_or_add_numId().val = numId
+        master_numbering = master.part.numbering_part.element
+        abstractNum_count = len(master_numbering.findall(qn('w:abstractNum')))
+        composer = Composer(master)
+
+        composer.append(doc)
+        composer.append(doc)
+
+        numIds = [p._p.pPr.numPr.numId.val for p in master.paragraphs]
+        assert len(set(numIds)) == 2
+        for new_numId in numIds:
+            num = master_numbering.num_having_numId(new_numId)
+            assert num.abstractNumId.val == int(abstractNumId)
+        assert len(master_numbering.findall(qn('w:abstractNum'))) == abstractNum_count
+
+    # fixture components ---------------------------------------------
+
+    def doc_with_data_part(self):
+        """Return a document whose body refers to a binary part of its package."""
+        doc = Document()
+        data_part = Part(
+            PackURI('/word/embeddings/data1.bin'), 'application/octet-stream', b'1',
+            doc.part.package
+        )
+        rId = doc.part.relate_to(data_part, RT.PACKAGE)
+        doc.add_paragraph()._p.set(qn('r:id'), rId)
+        return doc
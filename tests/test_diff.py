@@ -0,0 +1,102 @@
+# encoding: utf-8
+
+"""Unit test suite for the docx.diff module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import pytest
+
+from docx.diff import _align, compare
+from docx.document import Document
+
+from .unitutil.cxml import element
+
+
+class Describe_compare(object):
+
+    def it_reports_nothing_for_equivalent_documents(self):
+        doc_a = _document(
+            'w:p{w:rsidR=00A1}/(w:r/w:t"foo ",w:proofErr,w:r/w:t"bar"),'
+            'w:p/w:r/(w:rPr/w:b,w:t"baz")'
+        )
+        doc_b = _document(
+            'w:p{w:rsidR=00B2}/w:r/w:t"foo bar",'
+            'w:p/(w:r/(w:rPr/w:b,w:t"b"),w:r/(w:rPr/w:b,w:t"az"))'
+        )
+        assert compare(doc_a, doc_b) == []
+
+    def it_reports_changed_inserted_and_deleted_blocks(self):
+        doc_a = _document(
+            'w:p/w:r/w:t"a",w:p/w:r/w:t"b",w:p/w:r/w:t"c",w:p/w:r/w:t"d"'
+        )
+        doc_b = _document(
+            'w:p/w:r/w:t"a",w:p/w:r/(w:rPr/w:i,w:t"b"),w:p/w:r/w:t"d",'
+            'w:p/w:r/w:t"e"'
+        )
+        body_a, body_b = doc_a.element.body, doc_b.element.body
+
+        changes = compare(doc_a, doc_b)
+
+        assert [(c.kind, c.a_index, c.b_index) for c in changes] == [
+            ('modify', 1, 1), ('delete', 2, None), ('insert', None, 3)
+        ]
+        assert changes[0].a is body_a[1]
+        assert changes[0].b is body_b[1]
+        assert changes[1].b is None
+        assert changes[2].a is None
+
+    def it_descends_into_a_changed_table(self):
+        doc_a = _document(
+            'w:tbl/(w:tr/(w:tc/w:p/w:r/w:t"a",w:tc/w:p/w:r/w:t"b"),'
+            'w:tr/(w:tc/w:p/w:r/w:t"c",w:tc/w:p/w:r/w:t"d"))'
+        )
+        doc_b = _document(
+            'w:tbl/(w:tr/(w:tc/w:p/w:r/w:t"a",w:tc/w:p/w:r/w:t"b"),'
+            'w:tr/(w:tc/w:p/w:r/w:t"c",w:tc/w:p/w:r/w:t"x"))'
+        )
+
+        changes = compare(doc_a, doc_b)
+
+        assert len(changes) == 1
+        tbl_change = changes[0]
+        assert (tbl_change.kind, tbl_change.a_index) == ('modify', 0)
+        tr_change, = tbl_change.changes
+        assert (tr_change.kind, tr_change.a_index) == ('modify', 1)
+        tc_change, = tr_change.changes
+        assert (tc_change.kind, tc_change.a_index) == ('modify', 1)
+        p_change, = tc_change.changes
+        assert (p_change.kind, p_change.a_index, p_change.changes) == (
+            'modify', 0, []
+        )
+
+
+class Describe_align(object):
+
+    def it_aligns_two_sequences(self, fixture):
+        a, b, expected_opcodes = fixture
+        assert _align(a, b) == expected_opcodes
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ('abc', 'abc', [('equal', 0, 3, 0, 3)]),
+        ('', 'ab', [('change', 0, 0, 0, 2)]),
+        ('abcd', 'axcd', [
+            ('equal', 0, 1, 0, 1), ('change', 1, 2, 1, 2), ('equal', 2, 4, 2, 4)
+        ]),
+        ('xabcy', 'ycabx', [
+            ('change', 0, 1, 0, 2), ('equal', 1, 3, 2, 4), ('change', 3, 5, 4, 5)
+        ]),
+        ('aab', 'abb', [
+            ('equal', 0, 1, 0, 1), ('change', 1, 2, 1, 2), ('equal', 2, 3, 2, 3)
+        ]),
+        ('abab', 'baba', [
+            ('change', 0, 0, 0, 1), ('equal', 0, 3, 1, 4), ('change', 3, 4, 4, 4)
+        ]),
+    ])
+    def fixture(self, request):
+        return request.param
+
+
+def _document(body_cxml):
+    return Document(element('w:document/w:body/(%s)' % body_cxml), None)
@@ -11,12 +11,13 @@ from docx.enum.section import WD_SECTION
 from docx.enum.text import WD_BREAK
 from docx.opc.coreprops import CoreProperties
 from docx.parts.document import DocumentPart
+from docx.search import TextIndex
 from docx.section import Section, Sections
 from docx.settings import Settings
 from docx.shape import InlineShape, InlineShapes
 from docx.shared import Length
 from docx.styles.styles import Styles
-from docx.table import Table
+from docx.table import _Cell, Table
 from docx.text.paragraph import Paragraph
 from docx.text.run import Run
 
@@ -61,6 +62,27 @@ class DescribeDocument(object):
         document._body.add_paragraph.assert_called_once_with(text, style)
         assert paragraph is paragraph_
 
+    def it_can_add_a_block_of_text(self, body_prop_, body_):
+        paragraphs_ = [object(), object()]
+        body_.add_text_block.return_value = paragraphs_
+        document = Document(None, None)
+
+        paragraphs = document.add_text_block('Foo\n\nBar', 'Baz')
+
+        body_.add_text_block.assert_called_once_with('Foo\n\nBar', 'Baz')
+        assert paragraphs is paragraphs_
+
+    def it_can_append_many_paragraphs(self, body_prop_, body_):
+        paragraphs_ = [object(), object()]
+        body_.append_many.return_value = paragraphs_
+        specs = ('Foo', ('Bar', 'Heading 1'))
+        document = Document(None, None)
+
+        paragraphs = document.append_many(specs)
+
+        body_.append_many.assert_called_once_with(specs)
+        assert paragraphs is paragraphs_
+
     def it_can_add_a_picture(self, add_picture_fixture):
         document, path, width, height, run_, picture_ = add_picture_fixture
         picture = document.add_picture(path, width, height)
@@ -88,16 +110,129 @@ class DescribeDocument(object):
         assert table == table_
         assert table.style == style
 
+    def it_can_resolve_the_effective_font_of_a_run(self, document_part_):
+        run = Run(element('w:r'), None)
+        document = Document(None, document_part_)
+        resolver = document_part_.style_resolver
+
+        properties = document.effective_font(run)
+
+        resolver.effective_font.assert_called_once_with(run._r)
+        assert properties is resolver.effective_font.return_value
+
+    def it_can_resolve_the_effective_format_of_a_paragraph(self, document_part_):
+        paragraph = Paragraph(element('w:p'), None)
+        document = Document(None, document_part_)
+        resolver = document_part_.style_resolver
+
+        properties = document.effective_paragraph_format(paragraph)
+
+        resolver.effective_paragraph_format.assert_called_once_with(paragraph._p)
+        assert properties is resolver.effective_paragraph_format.return_value
+
+    def it_can_find_text_in_its_paragraphs(self):
+        document = Document(
+            element(
+                'w:document/w:body/(w:p/w:r/w:t"foo",w:p/(w:r/w:t"f",w:r/w:t"oo"))'
+            ),
+            None,
+        )
+
+        matches = document.find('fo+')
+
+        assert [(paragraph.text, match.span()) for paragraph, match in matches] == [
+            ('foo', (0, 3)), ('foo', (0, 3))
+        ]
+        assert all(isinstance(paragraph, Paragraph) for paragraph, _ in matches)
+
+    def it_gives_each_match_the_paragraph_in_its_container(self):
+        document = Document(
+            element(
+                'w:document/w:body/(w:p/(w:r/w:t"a ",w:hyperlink/w:r/w:t"foo"),'
+                'w:tbl/w:tr/(w:tc/w:p/w:r/w:t"foo",'
+                'w:tc/w:tbl/w:tr/w:tc/(w:p/w:r/w:t"foo",w:p/w:r/w:t"foo")))'
+            ),
+            None,
+        )
+
+        matches = document.find('foo')
+
+        assert [(match.string, match.span()) for _, match in matches] == [
+            ('a foo', (2, 5)), ('foo', (0, 3)), ('foo', (0, 3)), ('foo', (0, 3))
+        ]
+        paragraphs = [paragraph for paragraph, _ in matches]
+        assert paragraphs[0].text == 'a '
+        assert paragraphs[0]._parent is document._body
+        outer_cell, inner_cell, same_cell = [p._parent for p in paragraphs[1:]]
+        outer_tcs = document.element.body.tbl_lst[0].tr_lst[0].tc_lst
+        assert isinstance(outer_cell, _Cell)
+        assert outer_cell._tc is outer_tcs[0]
+        assert inner_cell is same_cell
+        inner_table = inner_cell._parent
+        assert isinstance(inner_table, Table)
+        assert inner_table._parent._tc is outer_tcs[1]
+        assert inner_table._parent._parent is outer_cell._parent
+        assert outer_cell._parent._parent is document._body
+
+    def it_can_build_a_text_index(self, document_part_):
+        document = Document(None, document_part_)
+        index = document.build_index()
+        document_part_.build_text_index.assert_called_once_with()
+        assert index is document_part_.build_text_index.return_value
+
+    def it_can_replace_text_in_its_paragraphs(self, document_part_):
+        document_part_.text_index = None
+        document = Document(
+            element(
+                'w:document/w:body/(w:p/w:r/w:t"foo",w:p/(w:r/w:t"f",w:r/w:t"oo"))'
+            ),
+            document_part_,
+        )
+
+        count = document.replace('o+', 'u')
+        count += document.replace_many({'fu': 'bar'})
+
+        assert count == 4
+        assert [paragraph.text for paragraph in document.paragraphs] == ['bar', 'bar']
+
+    def it_keeps_its_text_index_up_to_date_on_replace(self, document_part_):
+        document_elm = element('w:document/w:body/w:p/w:r/w:t"foo bar"')
+        index = TextIndex([('/word/document.xml', document_elm.body)])
+        document_part_.text_index = index
+        document = Document(document_elm, document_part_)
+
+        document.replace('foo', 'baz')
+
+        assert index.search('foo') == []
+        assert len(index.search('baz bar')) == 1
+
     def it_can_save_the_document_to_a_file(self, save_fixture):
         document, file_ = save_fixture
         document.save(file_)
-        document._part.save.assert_called_once_with(file_)
+        document._part.save.assert_called_once_with(file_, False, 'zip')
+
+    def it_can_clean_up_namespaces_on_save(self, save_fixture):
+        document, file_ = save_fixture
+        document.save(file_, cleanup_namespaces=True)
+        document._part.save.assert_called_once_with(file_, True, 'zip')
+
+    def it_can_save_the_document_incrementally(self, save_fixture):
+        document, file_ = save_fixture
+        document.save_incremental(file_)
+        document._part.save_incremental.assert_called_once_with(file_)
 
     def it_provides_access_to_its_core_properties(self, core_props_fixture):
         document, core_properties_ = core_props_fixture
         core_properties = document.core_properties
         assert core_properties is core_properties_
 
+    def it_provides_access_to_its_drawing_shapes(
+        self, document_part_, inline_shapes_
+    ):
+        document_part_.drawing_shapes = inline_shapes_
+        document = Document(None, document_part_)
+        assert document.drawing_shapes is inline_shapes_
+
     def it_provides_access_to_its_inline_shapes(self, inline_shapes_fixture):
         document, inline_shapes_ = inline_shapes_fixture
         assert document.inline_shapes is inline_shapes_
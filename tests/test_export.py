@@ -0,0 +1,240 @@
+# encoding: utf-8
+
+"""Unit test suite for the docx.export module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from io import BytesIO, StringIO
+
+import pytest
+
+from docx.api import Document
+from docx.export import (
+    _font_css,
+    _merged_rows,
+    _paragraph_css,
+    _safe_href,
+    _table_rows,
+    to_html,
+    to_markdown,
+    to_text,
+)
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.shared import Pt, RGBColor
+
+from .unitutil.file import test_file
+
+from .unitutil.cxml import element
+
+
+class Describe_to_html(object):
+
+    def it_writes_a_document_as_an_html_page(self, document):
+        run = document.paragraphs[1].add_run(' more')
+        run.bold = True
+        run.font.color.rgb = RGBColor(0x12, 0x34, 0x56)
+        out = StringIO()
+
+        to_html(document, out)
+
+        html = out.getvalue()
+        assert html.startswith('<!DOCTYPE html>')
+        assert '.p-Heading1 { ' in html
+        assert '<h1 class="p-Heading1">Fruit</h1>' in html
+        assert (
+            '<p>Some kinds:<span style="font-weight: bold; color: #123456"> more'
+            '</span></p>' in html
+        )
+        assert '<span class="list-label">1.</span> wash' in html
+        assert '<td><p>a|b</p>\n</td>' in html
+        assert html.endswith('</body>\n</html>\n')
+
+    def it_drops_an_unsafe_link_target(self):
+        document = Document()
+        for url in ('javascript:alert(1)', 'https://example.com'):
+            rId = document.part.relate_to(url, RT.HYPERLINK, is_external=True)
+            document.add_paragraph()._p.append(element(
+                'w:hyperlink{r:id=%s}/w:r/w:t"link"' % rId
+            ))
+        out = StringIO()
+
+        to_html(document, out)
+
+        html = out.getvalue()
+        assert 'javascript' not in html
+        assert '<a>' in html
+        assert '<a href="https://example.com">' in html
+
+    def it_keeps_a_style_font_name_inside_the_style_sheet(self):
+        document = Document()
+        document.styles['Normal'].font.name = 'x</style><script>alert(1)</script>'
+        out = StringIO()
+
+        to_html(document, out)
+
+        html = out.getvalue()
+        assert '<script>' not in html
+        assert html.count('</style>') == 1
+
+    def it_can_write_images_to_files(self, tmpdir):
+        document = Document()
+        document.add_picture(test_file('monty-truth.png'))
+        image_dir = str(tmpdir.join('images'))
+        out = StringIO()
+
+        to_html(document, out, image_dir=image_dir)
+
+        names = tmpdir.join('images').listdir()
+        assert len(names) == 1
+        assert '<img src="%s/%s" width="' % (image_dir, names[0].basename) in (
+            out.getvalue()
+        )
+
+
+class Describe_to_markdown(object):
+
+    def it_writes_a_document_as_markdown(self, document):
+        out = StringIO()
+        to_markdown(document, out)
+        assert out.getvalue() == (
+            '# Fruit\n'
+            '\n'
+            'Some kinds:\n'
+            '\n'
+            '- apple\n'
+            '- pear\n'
+            '1. wash\n'
+            '2. eat\n'
+            '\n'
+            '| a\\|b | c |\n'
+            '| --- | --- |\n'
+            '| d |  |\n'
+        )
+
+    def it_streams_from_a_package_like_from_a_document(self, document):
+        stream = BytesIO()
+        document.save(stream)
+        from_document, from_package = StringIO(), StringIO()
+
+        to_markdown(document, from_document)
+        to_markdown(stream, from_package)
+
+        assert from_package.getvalue() == from_document.getvalue()
+
+
+class Describe_to_text(object):
+
+    def it_writes_the_text_of_a_document(self, document):
+        out = StringIO()
+        to_text(document, out)
+        assert out.getvalue() == (
+            'Fruit\n'
+            'Some kinds:\n'
+            '• apple\n'
+            '• pear\n'
+            '1. wash\n'
+            '2. eat\n'
+            'a|b\tc\n'
+            'd\t\n'
+            '\n'
+        )
+
+
+class Describe_font_css(object):
+
+    def it_maps_font_properties_to_css(self):
+        assert _font_css({
+            'bold': False, 'underline': True, 'strike': True, 'size': Pt(10.5),
+            'name': 'Arial', 'superscript': True, 'italic': None,
+        }) == (
+            'font-weight: normal; text-decoration: underline line-through; '
+            'font-size: 10.5pt; font-family: "Arial"; vertical-align: super; '
+            'font-size: smaller'
+        )
+        assert _font_css({}) == ''
+
+    def it_escapes_a_font_name_that_could_end_the_style_sheet(self):
+        assert _font_css({'name': 'x"\\</style>\n'}) == (
+            'font-family: "x\\22 \\5c \\3c /style\\3e \\a "'
+        )
+
+
+class Describe_merged_rows(object):
+
+    def it_spans_merged_cells(self):
+        tbl = element(
+            'w:tbl/('
+            'w:tr/(w:tc/w:tcPr/w:vMerge{w:val=restart},'
+            '  w:tc/w:tcPr/w:gridSpan{w:val=2}),'
+            'w:tr/(w:tc/w:tcPr/w:vMerge,w:tc,w:tc),'
+            'w:tr/(w:tc/w:tcPr/w:vMerge,w:tc,w:tc))'
+        )
+        rows = list(_merged_rows(tbl))
+        assert [[cell[1:] for cell in row] for row in rows] == [
+            [(1, 3), (2, 1)], [(1, 1), (1, 1)], [(1, 1), (1, 1)]
+        ]
+        assert rows[0][0][0] is tbl[0][0]
+
+
+class Describe_paragraph_css(object):
+
+    def it_maps_paragraph_format_properties_to_css(self):
+        assert _paragraph_css({
+            'alignment': WD_ALIGN_PARAGRAPH.JUSTIFY, 'first_line_indent': Pt(-9),
+            'line_spacing': 1.5, 'space_after': Pt(6), 'keep_together': True,
+        }) == (
+            'text-align: justify; text-indent: -9pt; margin-bottom: 6pt; '
+            'line-height: 1.5'
+        )
+
+
+class Describe_safe_href(object):
+
+    @pytest.mark.parametrize(('url', 'expected_value'), [
+        ('https://example.com/a?b=c', 'https://example.com/a?b=c'),
+        ('HTTP://example.com', 'HTTP://example.com'),
+        ('mailto:a@example.com', 'mailto:a@example.com'),
+        ('docs/readme.html', 'docs/readme.html'),
+        ('#section-2', '#section-2'),
+        ('javascript:alert(1)', None),
+        (' JavaScript:alert(1)', None),
+        ('java\tscript:alert(1)', None),
+        ('data:text/html;base64,PHNjcmlwdD4=', None),
+        ('vbscript:msgbox', None),
+        (None, None),
+    ])
+    def it_allows_only_safe_link_targets(self, url, expected_value):
+        assert _safe_href(url) == expected_value
+
+
+class Describe_table_rows(object):
+
+    def it_gives_each_grid_column_an_entry(self):
+        tbl = element(
+            'w:tbl/('
+            'w:tr/(w:tc/(w:tcPr/(w:gridSpan{w:val=2},w:vMerge{w:val=restart}),'
+            '  w:p/w:r/w:t"a",w:p/w:r/w:t"b"),w:tc/w:p),'
+            'w:tr/(w:tc/(w:tcPr/(w:gridSpan{w:val=2},w:vMerge),w:p/w:r/w:t"x"),'
+            '  w:tc/w:p/w:r/w:t"c"))'
+        )
+        assert list(_table_rows(tbl)) == [['a b', '', ''], ['', '', 'c']]
+
+
+# fixture components ---------------------------------------------
+
+@pytest.fixture
+def document():
+    document = Document()
+    document.add_heading('Fruit', 1)
+    document.add_paragraph('Some kinds:')
+    document.add_paragraph('apple', style='List Bullet')
+    document.add_paragraph('pear', style='List Bullet')
+    document.add_paragraph('wash', style='List Number')
+    document.add_paragraph('eat', style='List Number')
+    table = document.add_table(2, 2)
+    table.cell(0, 0).text = 'a|b'
+    table.cell(0, 1).text = 'c'
+    table.cell(1, 0).text = 'd'
+    document.add_paragraph()
+    return document
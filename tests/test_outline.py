@@ -0,0 +1,94 @@
+# encoding: utf-8
+
+"""Unit test suite for the docx.outline module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import pytest
+
+from docx.outline import format_number, ListNumbering, Outline
+
+from .unitutil.cxml import element
+
+
+class DescribeOutline(object):
+
+    def it_finds_the_heading_level_of_a_paragraph(self, outline):
+        assert outline.heading_level(element('w:p/w:pPr/w:pStyle{w:val=H1}')) == 1
+        assert outline.heading_level(element('w:p/w:pPr/w:pStyle{w:val=H2}')) == 2
+        assert outline.heading_level(
+            element('w:p/w:pPr/(w:pStyle{w:val=H2},w:outlineLvl{w:val=9})')
+        ) is None
+        assert outline.heading_level(element('w:p')) is None
+
+    def it_labels_list_paragraphs(self, outline):
+        ps = [
+            element('w:p/w:pPr/w:pStyle{w:val=Step}'),
+            element('w:p/w:pPr/(w:pStyle{w:val=Step},w:numPr/w:ilvl{w:val=1})'),
+            element('w:p/w:pPr/(w:pStyle{w:val=Step},w:numPr/w:ilvl{w:val=1})'),
+            element('w:p/w:pPr/w:pStyle{w:val=Step}'),
+            element('w:p/w:pPr/w:numPr/(w:ilvl{w:val=1},w:numId{w:val=7})'),
+            element('w:p'),
+        ]
+        assert [outline.list_item(p) for p in ps] == [
+            (0, 1, '1.'), (1, 1, '1.i'), (1, 2, '1.ii'), (0, 2, '2.'), None, None
+        ]
+
+    # fixture components ---------------------------------------------
+
+    @pytest.fixture
+    def outline(self):
+        styles = element(
+            'w:styles/('
+            'w:style{w:type=paragraph,w:styleId=H1}/w:pPr/w:outlineLvl{w:val=0},'
+            'w:style{w:type=paragraph,w:styleId=H2}/(w:basedOn{w:val=H1},'
+            '  w:pPr/w:outlineLvl{w:val=1}),'
+            'w:style{w:type=paragraph,w:styleId=Step}/w:pPr/w:numPr/w:numId{w:val=3})'
+        )
+        numbering = element(
+            'w:numbering/('
+            'w:abstractNum{w:abstractNumId=0}/('
+            '  w:lvl{w:ilvl=0}/(w:start{w:val=1},w:numFmt{w:val=decimal},'
+            '    w:lvlText{w:val=%1.}),'
+            '  w:lvl{w:ilvl=1}/(w:start{w:val=1},w:numFmt{w:val=lowerRoman},'
+            '    w:lvlText{w:val=%1.%2})),'
+            'w:num{w:numId=3}/w:abstractNumId{w:val=0})'
+        )
+        return Outline(styles, numbering)
+
+
+class DescribeListNumbering(object):
+
+    def it_applies_a_start_override(self):
+        numbering = ListNumbering(element(
+            'w:numbering/('
+            'w:abstractNum{w:abstractNumId=4}/w:lvl{w:ilvl=0}/('
+            '  w:numFmt{w:val=upperLetter},w:lvlText{w:val=%1-}),'
+            'w:num{w:numId=1}/(w:abstractNumId{w:val=4},'
+            '  w:lvlOverride{w:ilvl=0}/w:startOverride{w:val=3}))'
+        ))
+        assert numbering.next_label(1, 0) == (3, 'C-')
+        assert numbering.next_label(1, 0) == (4, 'D-')
+        assert numbering.next_label(2, 0) == (None, None)
+
+
+class Describeformat_number(object):
+
+    def it_formats_a_list_number(self, fixture):
+        number, numFmt, expected_value = fixture
+        assert format_number(number, numFmt) == expected_value
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        (3, 'decimal', '3'),
+        (3, 'decimalZero', '03'),
+        (28, 'lowerLetter', 'ab'),
+        (2, 'upperLetter', 'B'),
+        (1994, 'lowerRoman', 'mcmxciv'),
+        (4, 'upperRoman', 'IV'),
+        (4, 'none', ''),
+        (4, 'ordinal', '4'),
+    ])
+    def fixture(self, request):
+        return request.param
@@ -4,6 +4,8 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from io import BytesIO
+
 import pytest
 
 from docx.image.image import Image
@@ -36,6 +38,25 @@ class DescribePackage(object):
         for image_part in image_parts:
             assert isinstance(image_part, ImagePart)
 
+    def it_can_round_trip_through_a_flat_opc_package(self):
+        package = Package.open(docx_path('having-images'))
+        pkg_file = BytesIO()
+
+        package.save(pkg_file, format='flat')
+        pkg_file.seek(0)
+        flat_package = Package.open(pkg_file)
+
+        assert pkg_file.getvalue().startswith(b'<?xml')
+        assert sorted(p.partname for p in flat_package.iter_parts()) == sorted(
+            p.partname for p in package.iter_parts()
+        )
+        assert sorted(p.sha1 for p in flat_package.image_parts) == sorted(
+            p.sha1 for p in package.image_parts
+        )
+        assert flat_package.main_document_part.element.xml == (
+            package.main_document_part.element.xml
+        )
+
     # fixture components ---------------------------------------------
 
     @pytest.fixture
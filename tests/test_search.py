@@ -0,0 +1,201 @@
+# encoding: utf-8
+
+"""Unit test suite for the docx.search module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import re
+
+import pytest
+
+from docx.search import (
+    find, IndexHit, ParagraphText, replace, replace_many, TextIndex
+)
+
+from .unitutil.cxml import element, xml
+
+
+class DescribeParagraphText(object):
+
+    def it_joins_the_text_of_the_paragraph_runs(self):
+        p = element(
+            'w:p/(w:r/(w:t"foo",w:tab),w:hyperlink/w:r/w:t"bar",'
+            'w:r/(w:br,w:rPr/w:b,w:t"baz"))'
+        )
+        assert ParagraphText(p).text == 'foo\tbar\nbaz'
+
+    def it_can_locate_the_element_holding_a_character(self):
+        p = element('w:p/(w:r/(w:t"foo",w:tab),w:r/w:t"bar")')
+        paragraph_text = ParagraphText(p)
+        t, tab, t_2 = p.xpath('.//w:t | .//w:tab')
+
+        assert paragraph_text.locate(0) == (t, 0)
+        assert paragraph_text.locate(3) == (tab, 0)
+        assert paragraph_text.locate(6) == (t_2, 2)
+
+    def it_can_replace_spans_of_its_text(self, replace_fixture):
+        p, spans, expected_xml = replace_fixture
+        ParagraphText(p).replace(spans)
+        assert p.xml == expected_xml
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ('w:p/w:r/w:t"foobar"', [(3, 6, 'baz')],
+         'w:p/w:r/(w:t"foo",w:t"baz")'),
+        ('w:p/w:r/w:t"foobar"', [(0, 3, 'baz'), (4, 5, '')],
+         'w:p/w:r/(w:t"baz",w:t"b",w:t"r")'),
+        ('w:p/(w:r/w:t"foo b",w:r/(w:rPr/w:b,w:t"ar baz"))', [(4, 7, 'X')],
+         'w:p/(w:r/(w:t{xml:space=preserve}"foo ",w:t"X"),'
+         'w:r/(w:rPr/w:b,w:t{xml:space=preserve}" baz"))'),
+        ('w:p/(w:r/w:t"a",w:r/w:t"b",w:r/w:t"c",w:r/w:t"d")', [(1, 3, 'X')],
+         'w:p/(w:r/w:t"a",w:r/w:t"X",w:r,w:r/w:t"d")'),
+        ('w:p/w:r/(w:t"a",w:tab,w:t"b")', [(1, 2, ' and\tthen ')],
+         'w:p/w:r/(w:t"a",w:t{xml:space=preserve}" and",w:tab,'
+         'w:t{xml:space=preserve}"then ",w:t"b")'),
+    ])
+    def replace_fixture(self, request):
+        p_cxml, spans, expected_cxml = request.param
+        return element(p_cxml), spans, xml(expected_cxml)
+
+
+class DescribeTextIndex(object):
+
+    def it_finds_the_occurrences_of_a_word(self, index, body, hdr):
+        hits = index.search('FOO')
+        assert hits == [
+            IndexHit('/word/document.xml', body[0], 0, 3),
+            IndexHit('/word/document.xml', body[0], 8, 11),
+            IndexHit('/word/document.xml', body[1][0][0][0], 0, 3),
+            IndexHit('/word/header1.xml', hdr[0], 4, 7),
+        ]
+
+    def it_finds_the_occurrences_of_a_phrase(self, index, body):
+        assert index.search('foo, bar') == [
+            IndexHit('/word/document.xml', body[0], 0, 7),
+            IndexHit('/word/document.xml', body[1][0][0][0], 0, 8),
+        ]
+        assert index.search('bar foo') == [
+            IndexHit('/word/document.xml', body[0], 4, 11),
+        ]
+        assert index.search('baz foo') == []
+        assert index.search('...') == []
+
+    def it_can_update_a_changed_paragraph(self, index, body):
+        p = body[0]
+        p[0][0].text = 'qux bar'
+        index.update(p)
+        assert index.search('foo bar') == [
+            IndexHit('/word/document.xml', body[1][0][0][0], 0, 8)
+        ]
+        assert index.search('qux')[0].p is p
+
+    def it_drops_a_paragraph_no_longer_in_the_document(self, index, body):
+        p = body[0]
+        body.remove(p)
+        index.update(p)
+        assert [hit.p for hit in index.search('bar')] == [body[0][0][0][0]]
+
+    def it_sorts_a_paragraph_added_after_a_drop_last(self):
+        body = element(
+            'w:body/(w:p/w:r/w:t"x",w:p/w:r/w:t"x",w:p/w:r/w:t"so foo")'
+        )
+        index = TextIndex([('/word/document.xml', body)])
+        p, old_p = body[0], body[2]
+        body.remove(p)
+        index.update(p)
+        new_p = element('w:p/w:r/w:t"foo"')
+        body.append(new_p)
+        index.update(new_p)
+
+        assert [hit.p for hit in index.search('foo')] == [old_p, new_p]
+
+    def it_reindexes_a_stale_paragraph_before_returning_it(self, index, body, hdr):
+        p = body[0]
+        p[0][0].text = 'qux bar'
+        del body[1]
+
+        assert index.search('foo') == [
+            IndexHit('/word/header1.xml', hdr[0], 4, 7)
+        ]
+        assert index.search('bar') == [IndexHit('/word/document.xml', p, 4, 7)]
+
+    def it_can_refresh_itself_from_the_whole_document(self, index, body):
+        body.insert(0, element('w:p/w:r/w:t"foo bar"'))
+        del body[1]
+        index.refresh()
+        assert [hit.p for hit in index.search('foo bar')] == [
+            body[0], body[1][0][0][0]
+        ]
+
+    # fixture components ---------------------------------------------
+
+    @pytest.fixture
+    def body(self):
+        return element(
+            'w:body/(w:p/w:r/w:t"Foo bar foo",'
+            'w:tbl/w:tr/w:tc/w:p/(w:r/w:t"foo, ",w:r/w:t"bar"))'
+        )
+
+    @pytest.fixture
+    def hdr(self):
+        return element('w:hdr/w:p/w:r/w:t"Not foo"')
+
+    @pytest.fixture
+    def index(self, body, hdr):
+        return TextIndex(
+            [('/word/document.xml', body), ('/word/header1.xml', hdr)]
+        )
+
+
+class Describe_find(object):
+
+    def it_finds_matches_in_each_paragraph(self):
+        body = element(
+            'w:body/(w:p/(w:r/w:t"fo",w:r/w:t"o bar"),'
+            'w:tbl/w:tr/w:tc/w:p/w:r/w:t"Foo")'
+        )
+        matches = list(find(body, re.compile('foo', re.I)))
+        assert [(p, match.span()) for p, match in matches] == [
+            (body[0], (0, 3)), (body[1][0][0][0], (0, 3))
+        ]
+
+
+class Describe_replace(object):
+
+    def it_replaces_matches_in_each_paragraph(self):
+        body = element('w:body/(w:p/w:r/w:t"foo-1",w:p,w:p/w:r/w:t"foo-22")')
+
+        count = replace(body, r'foo-(\d+)', r'bar\1')
+
+        assert count == 2
+        assert [ParagraphText(p).text for p in body] == ['bar1', '', 'bar22']
+
+    def it_can_replace_using_a_function(self):
+        body = element('w:body/w:p/w:r/w:t"a b"')
+        replace(body, r'\w', lambda match: match.group(0).upper())
+        assert ParagraphText(body[0]).text == 'A B'
+
+    def it_updates_the_changed_paragraphs_in_an_index(self):
+        body = element('w:body/(w:p/w:r/w:t"foo",w:p/w:r/w:t"bar")')
+        index = TextIndex([('/word/document.xml', body)])
+
+        replace(body, 'o+', 'ax', index=index)
+
+        assert [hit.p for hit in index.search('fax')] == [body[0]]
+        assert index.search('foo') == []
+
+
+class Describe_replace_many(object):
+
+    def it_replaces_many_literal_strings_in_one_pass(self):
+        body = element('w:body/w:p/(w:r/w:t"a.b ab",w:r/w:t"c")')
+
+        count = replace_many(body, {'a.b': 'X', 'a': 'Y', 'abc': 'Z'})
+
+        assert count == 2
+        assert ParagraphText(body[0]).text == 'X Z'
+
+    def it_does_nothing_when_there_are_no_replacements(self):
+        body = element('w:body/w:p/w:r/w:t"foo"')
+        assert replace_many(body, {}) == 0
@@ -6,10 +6,13 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import pytest
 
+from docx.api import Document
 from docx.enum.section import WD_HEADER_FOOTER, WD_ORIENT, WD_SECTION
 from docx.parts.document import DocumentPart
 from docx.parts.hdrftr import FooterPart, HeaderPart
-from docx.section import _BaseHeaderFooter, _Footer, _Header, Section, Sections
+from docx.section import (
+    _BaseHeaderFooter, _Footer, _Header, Section, SectionMap, Sections
+)
 from docx.shared import Inches
 
 from .unitutil.cxml import element, xml
@@ -18,10 +21,10 @@ from .unitutil.mock import call, class_mock, instance_mock, method_mock, propert
 
 class DescribeSections(object):
 
-    def it_knows_how_many_sections_it_contains(self):
-        sections = Sections(
-            element("w:document/w:body/(w:p/w:pPr/w:sectPr, w:sectPr)"), None
-        )
+    def it_knows_how_many_sections_it_contains(self, document_part_):
+        document_elm = element("w:document/w:body/(w:p/w:pPr/w:sectPr, w:sectPr)")
+        document_part_.section_map = SectionMap(document_elm)
+        sections = Sections(document_elm, document_part_)
         assert len(sections) == 2
 
     def it_can_iterate_over_its_Section_instances(
@@ -30,6 +33,7 @@ class DescribeSections(object):
         document_elm = element("w:document/w:body/(w:p/w:pPr/w:sectPr, w:sectPr)")
         sectPrs = document_elm.xpath("//w:sectPr")
         Section_.return_value = section_
+        document_part_.section_map = SectionMap(document_elm)
         sections = Sections(document_elm, document_part_)
 
         section_lst = [s for s in sections]
@@ -47,6 +51,7 @@ class DescribeSections(object):
         )
         sectPrs = document_elm.xpath("//w:sectPr")
         Section_.return_value = section_
+        document_part_.section_map = SectionMap(document_elm)
         sections = Sections(document_elm, document_part_)
 
         section_lst = [sections[idx] for idx in range(3)]
@@ -66,6 +71,7 @@ class DescribeSections(object):
         )
         sectPrs = document_elm.xpath("//w:sectPr")
         Section_.return_value = section_
+        document_part_.section_map = SectionMap(document_elm)
         sections = Sections(document_elm, document_part_)
 
         section_lst = sections[1:9]
@@ -90,6 +96,55 @@ class DescribeSections(object):
         return instance_mock(request, Section)
 
 
+class DescribeSectionMap(object):
+
+    def it_indexes_the_sections_of_a_document(self):
+        document_elm = element(
+            "w:document/w:body/(w:p/w:pPr/w:sectPr,w:p,w:p/w:pPr/w:sectPr,w:sectPr)"
+        )
+        sectPrs = document_elm.xpath("//w:sectPr")
+        section_map = SectionMap(document_elm)
+
+        assert section_map.sectPrs == sectPrs
+        assert section_map.index(sectPrs[1]) == 1
+        assert section_map.preceding(sectPrs[0]) is None
+        assert section_map.preceding(sectPrs[2]) is sectPrs[1]
+        assert section_map.last is sectPrs[2]
+
+    def it_is_rebuilt_when_an_indexed_section_leaves_the_document(self):
+        document_elm = element(
+            "w:document/w:body/(w:p/w:pPr/w:sectPr,w:p,w:p/w:pPr/w:sectPr,w:sectPr)"
+        )
+        body = document_elm[0]
+        section_map = SectionMap(document_elm)
+        assert len(section_map.sectPrs) == 3
+
+        body.remove(body[2])
+        assert section_map.sectPrs == [body[0][0][0], body[-1]]
+        assert section_map.preceding(body[-1]) is body[0][0][0]
+        body.insert(1, element("w:p/w:pPr/w:sectPr"))
+        assert len(section_map.sectPrs) == 2
+        section_map.invalidate()
+        assert len(section_map.sectPrs) == 3
+
+    def it_reflects_a_body_cleared_of_its_content(self):
+        document = Document()
+        document.add_section()
+        assert len(document.sections) == 2
+
+        document.element.body.clear_content()
+
+        assert len(document.sections) == 1
+        assert document.sections[0]._sectPr is document.element.body[-1]
+
+    def it_finds_the_last_section_without_building_the_index(self):
+        document_elm = element("w:document/w:body/(w:p/w:pPr/w:sectPr,w:sectPr)")
+        section_map = SectionMap(document_elm)
+
+        assert section_map.last is document_elm[0][-1]
+        assert section_map._sectPrs is None
+
+
 class DescribeSection(object):
 
     def it_knows_when_it_displays_a_distinct_first_page_header(
@@ -668,6 +723,7 @@ class Describe_Footer(object):
     ):
         doc_elm = element("w:document/(w:sectPr,w:sectPr)")
         prior_sectPr, sectPr = doc_elm[0], doc_elm[1]
+        document_part_.section_map = SectionMap(doc_elm)
         footer = _Footer(sectPr, document_part_, WD_HEADER_FOOTER.EVEN_PAGE)
         # ---mock must occur after construction of "real" footer---
         _Footer_ = class_mock(request, "docx.section._Footer", return_value=footer_)
@@ -679,10 +735,11 @@ class Describe_Footer(object):
         )
         assert prior_footer is footer_
 
-    def but_it_returns_None_when_its_the_first_footer(self):
+    def but_it_returns_None_when_its_the_first_footer(self, document_part_):
         doc_elm = element("w:document/w:sectPr")
         sectPr = doc_elm[0]
-        footer = _Footer(sectPr, None, None)
+        document_part_.section_map = SectionMap(doc_elm)
+        footer = _Footer(sectPr, document_part_, None)
 
         prior_footer = footer._prior_headerfooter
 
@@ -764,6 +821,7 @@ class Describe_Header(object):
     ):
         doc_elm = element("w:document/(w:sectPr,w:sectPr)")
         prior_sectPr, sectPr = doc_elm[0], doc_elm[1]
+        document_part_.section_map = SectionMap(doc_elm)
         header = _Header(sectPr, document_part_, WD_HEADER_FOOTER.PRIMARY)
         # ---mock must occur after construction of "real" header---
         _Header_ = class_mock(request, "docx.section._Header", return_value=header_)
@@ -775,10 +833,11 @@ class Describe_Header(object):
         )
         assert prior_header is header_
 
-    def but_it_returns_None_when_its_the_first_header(self):
+    def but_it_returns_None_when_its_the_first_header(self, document_part_):
         doc_elm = element("w:document/w:sectPr")
         sectPr = doc_elm[0]
-        header = _Header(sectPr, None, None)
+        document_part_.section_map = SectionMap(doc_elm)
+        header = _Header(sectPr, document_part_, None)
 
         prior_header = header._prior_headerfooter
 
@@ -8,15 +8,17 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import pytest
 
+from docx.api import Document
 from docx.enum.shape import WD_INLINE_SHAPE
-from docx.oxml.ns import nsmap
-from docx.shape import InlineShape, InlineShapes
+from docx.oxml.ns import nsmap, qn
+from docx.shape import InlineShape, InlineShapes, ShapeIndex
 from docx.shared import Length
 
 from .oxml.unitdata.dml import (
     a_blip, a_blipFill, a_graphic, a_graphicData, a_pic, an_inline,
 )
 from .unitutil.cxml import element, xml
+from .unitutil.file import test_file
 from .unitutil.mock import loose_mock
 
 
@@ -53,6 +55,84 @@ class DescribeInlineShapes(object):
             too_high = inline_shape_count
             inline_shapes[too_high]
 
+    def it_finds_shapes_anywhere_in_the_story(self):
+        body = element(
+            'w:body/(w:tbl/w:tr/w:tc/w:p/w:hyperlink/w:r/w:drawing/wp:inline,'
+            'w:p/w:r/w:drawing/wp:anchor,w:p/w:r/w:drawing/wp:inline)'
+        )
+        inline_shapes = InlineShapes(body, None)
+        drawing_shapes = InlineShapes(body, None, anchored=True)
+
+        assert len(inline_shapes) == 2
+        assert [shape._inline.tag for shape in drawing_shapes] == [
+            qn('wp:inline'), qn('wp:anchor'), qn('wp:inline')
+        ]
+
+    def it_reuses_its_index_while_its_drawings_remain(self):
+        body = element(
+            'w:body/(w:p/w:r/w:drawing/wp:inline,w:p/w:r/w:drawing/wp:inline,'
+            'w:p/w:r/w:drawing/wp:inline,w:sectPr)'
+        )
+        shape_index = ShapeIndex(body)
+        inline_shapes = InlineShapes(body, None, shape_index)
+        last = inline_shapes[2]._inline
+
+        assert shape_index.drawings() is shape_index.drawings()
+        body.remove(body[1])
+        assert len(inline_shapes) == 2
+        assert inline_shapes[1]._inline is last
+        body.insert(1, element('w:p/w:r/w:drawing/wp:inline'))
+        assert len(inline_shapes) == 2
+        shape_index.invalidate()
+        assert len(inline_shapes) == 3
+
+    def it_drops_the_picture_of_a_paragraph_that_is_cleared(self):
+        document = Document()
+        document.add_picture(test_file('monty-truth.png'))
+        paragraph = document.add_paragraph()
+        paragraph.add_run().add_picture(test_file('monty-truth.png'))
+        inline_shapes = document.inline_shapes
+        first = inline_shapes[0]._inline
+        assert len(inline_shapes) == 2
+
+        paragraph.clear()
+
+        assert len(inline_shapes) == 1
+        assert [shape._inline for shape in inline_shapes] == [first]
+
+    def it_sees_pictures_added_through_the_api(self):
+        document = Document()
+        paragraph = document.add_paragraph()
+        document.add_paragraph('after')
+        inline_shapes = document.inline_shapes
+        assert len(inline_shapes) == 0
+
+        paragraph.add_run().add_picture(test_file('monty-truth.png'))
+
+        assert len(inline_shapes) == 1
+        assert len(document.drawing_shapes) == 1
+
+    def it_can_scale_shapes_to_fit_a_size(self):
+        body = element(
+            'w:body/('
+            'w:p/w:r/w:drawing/wp:inline/(wp:extent{cx=400,cy=200},a:graphic/'
+            '  a:graphicData/pic:pic/pic:spPr/a:xfrm/a:ext{cx=400,cy=200}),'
+            'w:p/w:r/w:drawing/wp:inline/(wp:extent{cx=100,cy=300},a:graphic/'
+            '  a:graphicData),'
+            'w:p/w:r/w:drawing/wp:inline/(wp:extent{cx=50,cy=50},a:graphic/'
+            '  a:graphicData))'
+        )
+        inline_shapes = InlineShapes(body, None)
+
+        count = inline_shapes.scale_to_fit(max_width=200, max_height=150)
+
+        assert count == 2
+        assert [(s.width, s.height) for s in inline_shapes] == [
+            (200, 100), (50, 150), (50, 50)
+        ]
+        spPr = body.xpath('.//pic:spPr')[0]
+        assert (spPr.cx, spPr.cy) == (200, 100)
+
     def it_knows_the_part_it_belongs_to(self, inline_shapes_with_parent_):
         inline_shapes, parent_ = inline_shapes_with_parent_
         part = inline_shapes.part
@@ -12,10 +12,11 @@ import pytest
 
 from docx.opc.part import XmlPart
 from docx.shared import (
-    ElementProxy, Length, Cm, Emu, Inches, Mm, Pt, RGBColor, Twips
+    ElementProxy, FormatSpec, Length, Cm, Emu, Inches, Mm, Pt, RGBColor, Twips
 )
+from docx.text.font import Font
 
-from .unitutil.cxml import element
+from .unitutil.cxml import element, xml
 from .unitutil.mock import instance_mock
 
 
@@ -74,6 +75,33 @@ class DescribeElementProxy(object):
         return instance_mock(request, XmlPart)
 
 
+class DescribeFormatSpec(object):
+
+    def it_applies_its_properties_to_each_format(self):
+        fonts = [
+            Font(element(cxml))
+            for cxml in ('w:r', 'w:r/w:rPr/(w:b,w:sz{w:val=24})')
+        ]
+        spec = FormatSpec(Font, {'bold': None, 'size': Pt(9), 'name': 'Foo'})
+
+        spec.apply(*fonts)
+
+        assert [font._element.xml for font in fonts] == [
+            xml('w:r/w:rPr/(w:rFonts{w:ascii=Foo,w:hAnsi=Foo},w:sz{w:val=18})'),
+            xml('w:r/w:rPr/(w:rFonts{w:ascii=Foo,w:hAnsi=Foo},w:sz{w:val=18})'),
+        ]
+
+    def it_does_not_share_elements_between_targets(self):
+        fonts = [Font(element('w:r')), Font(element('w:r'))]
+        FormatSpec(Font, {'bold': True}).apply(*fonts)
+        b, b_2 = [font._element.rPr.b for font in fonts]
+        assert b is not b_2
+
+    def it_raises_on_an_unknown_property_name(self):
+        with pytest.raises(TypeError):
+            FormatSpec(Font, {'boldness': True})
+
+
 class DescribeLength(object):
 
     def it_can_construct_from_convenient_units(self, construct_fixture):
@@ -0,0 +1,86 @@
+# encoding: utf-8
+
+"""Unit test suite for the docx.split module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from io import BytesIO
+
+import pytest
+
+from docx.api import Document
+from docx.oxml.ns import qn
+from docx.parts.hdrftr import HeaderPart
+from docx.split import by_heading, by_section
+
+from .unitutil.file import test_file
+
+
+class Describe_by_heading(object):
+
+    def it_splits_a_document_at_each_heading(self, document):
+        pieces = list(by_heading(document))
+
+        assert [[p.text for p in piece.paragraphs] for piece in pieces] == [
+            ['front'], ['One', 'Sub', 'a', ''], ['Two', 'b', '', 'c']
+        ]
+        assert [p.text for p in document.paragraphs][0] == 'front'
+
+    def it_splits_at_lower_level_headings_too(self, document):
+        pieces = list(by_heading(document, level=2))
+        assert [piece.paragraphs[0].text for piece in pieces] == [
+            'front', 'One', 'Sub', 'Two'
+        ]
+
+    def it_relates_each_piece_to_the_parts_it_uses(self, document):
+        front, one, two = by_heading(document)
+
+        assert len(one.part.package.image_parts) == 1
+        assert len(two.part.package.image_parts) == 0
+        assert one.styles.element is document.styles.element
+        assert two.part.package.core_properties.title == 'Filing'
+        header_parts = [
+            part for part in two.part.package.parts if isinstance(part, HeaderPart)
+        ]
+        assert len(header_parts) == 1
+        assert header_parts[0].package is two.part.package
+
+        stream = BytesIO()
+        one.save(stream)
+        assert [p.text for p in Document(stream).paragraphs] == [
+            'One', 'Sub', 'a', ''
+        ]
+
+
+class Describe_by_section(object):
+
+    def it_splits_a_document_at_each_section_break(self, document):
+        first, second = by_section(document)
+
+        assert [p.text for p in first.paragraphs][-2:] == ['b', '']
+        assert [p.text for p in second.paragraphs] == ['c']
+        body = first.element.body
+        assert body[-1].tag == qn('w:sectPr')
+        assert body.xpath('./w:p/w:pPr/w:sectPr') == []
+        assert len(first.sections) == len(second.sections) == 1
+        assert second.sections[0].header.paragraphs[0].text == 'header'
+
+
+# fixture components ---------------------------------------------
+
+@pytest.fixture
+def document():
+    document = Document()
+    document.core_properties.title = 'Filing'
+    document.add_paragraph('front')
+    document.add_heading('One', 1)
+    document.add_heading('Sub', 2)
+    document.add_paragraph('a')
+    document.add_picture(test_file('monty-truth.png'))
+    document.add_heading('Two', 1)
+    document.add_paragraph('b')
+    section = document.add_section()
+    section.header.is_linked_to_previous = False
+    section.header.paragraphs[0].text = 'header'
+    document.add_paragraph('c')
+    return document
@@ -0,0 +1,183 @@
+# encoding: utf-8
+
+"""Unit test suite for the docx.stream module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from io import BytesIO
+from zipfile import is_zipfile
+
+import pytest
+
+from docx.api import Document
+from docx.oxml.ns import qn
+from docx.shared import Inches
+from docx.stream import (
+    _final_sectPr_start, append, DocumentAppender, DocumentWriter
+)
+
+from .unitutil.file import test_file
+from .unitutil.mock import function_mock
+
+
+class Describe_append(object):
+
+    def it_adds_paragraphs_to_the_end_of_a_document(self, docx_path):
+        append(docx_path, ['two', ('Three', 'Heading 1')])
+
+        document = Document(docx_path)
+        assert [(p.text, p.style.name) for p in document.paragraphs] == [
+            ('one', 'Normal'), ('', 'Normal'), ('two', 'Normal'),
+            ('Three', 'Heading 1'),
+        ]
+        assert document.sections[0].left_margin == Inches(2)
+        assert document.element.body[-1].tag == qn('w:sectPr')
+
+    def it_leaves_the_document_unchanged_when_it_fails(self, docx_path, request):
+        with open(docx_path, 'rb') as f:
+            original = f.read()
+        function_mock(
+            request, 'docx.stream._final_sectPr_start', side_effect=ValueError
+        )
+
+        with pytest.raises(ValueError):
+            append(docx_path, ['two'])
+
+        with open(docx_path, 'rb') as f:
+            assert f.read() == original
+        assert [p.text for p in Document(docx_path).paragraphs] == ['one', '']
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def docx_path(self, tmpdir):
+        document = Document()
+        document.add_paragraph('one')
+        document.add_picture(test_file('python-icon.png'))
+        document.sections[0].left_margin = Inches(2)
+        path = str(tmpdir.join('log.docx'))
+        document.save(path)
+        return path
+
+
+class DescribeDocumentAppender(object):
+
+    def it_adds_tables_and_pictures_to_the_end_of_a_document(self, tmpdir):
+        path = str(tmpdir.join('log.docx'))
+        document = Document()
+        document.add_picture(test_file('python-icon.png'))
+        document.save(path)
+
+        with DocumentAppender(path) as appender:
+            appender.write_table_row(['x', 'y'], style='Table Grid')
+            appender.write_picture(test_file('monty-truth.png'))
+            appender.write_picture(test_file('python-icon.png'))
+
+        document = Document(path)
+        assert list(document.tables[0].iter_rows_text()) == [['x', 'y']]
+        assert document.tables[0].style.name == 'Table Grid'
+        assert [s._inline.docPr.id for s in document.inline_shapes] == [1, 2, 3]
+        assert len(document.part.package.image_parts) == 2
+
+    def it_leaves_the_document_untouched_when_the_with_block_raises(self, tmpdir):
+        path = str(tmpdir.join('log.docx'))
+        document = Document()
+        document.add_paragraph('one')
+        document.save(path)
+        with open(path, 'rb') as f:
+            original = f.read()
+
+        with pytest.raises(RuntimeError):
+            with DocumentAppender(path) as appender:
+                appender.write_paragraph('partial')
+                appender.write_picture(test_file('python-icon.png'))
+                raise RuntimeError
+
+        with open(path, 'rb') as f:
+            assert f.read() == original
+        assert tmpdir.listdir() == [tmpdir.join('log.docx')]
+
+
+class Describe_final_sectPr_start(object):
+
+    @pytest.mark.parametrize(('content', 'expected_value'), [
+        (b'<w:p/>', 6),
+        (b'<w:p/><w:sectPr/>', 6),
+        (b'<w:p/><w:sectPr w:rsidR="00"/>\n', 6),
+        (b'<w:p><w:pPr><w:sectPr/></w:pPr></w:p>', 37),
+        (b'<w:p/><w:sectPr><w:pgSz/></w:sectPr>', 6),
+        (b'<w:p/><w:sectPr><w:sectPrChange><w:sectPr><w:pgSz/></w:sectPr>'
+         b'</w:sectPrChange></w:sectPr>', 6),
+        (b'<w:p/><w:sectPr><w:sectPrChange><w:sectPr/></w:sectPrChange>'
+         b'</w:sectPr>', 6),
+    ])
+    def it_finds_the_section_properties_ending_the_body(
+        self, content, expected_value
+    ):
+        assert _final_sectPr_start(content, b'w:') == expected_value
+
+
+class DescribeDocumentWriter(object):
+
+    def it_writes_a_document_based_on_a_template(self):
+        template = Document()
+        template.add_paragraph('not copied')
+        stream = BytesIO()
+
+        with DocumentWriter(template, stream) as writer:
+            writer.write_paragraph('Title', style='Heading 1')
+            paragraph = writer.write_paragraph('a\tb')
+            paragraph.add_run(' bold').bold = True
+            writer.write_table_row(['x', 1], style='Table Grid')
+            writer.write_table_row(['y', 2])
+            writer.write_picture(test_file('monty-truth.png'), width=Inches(1))
+            writer.write_picture(test_file('monty-truth.png'))
+            writer.write_paragraph('end')
+
+        document = Document(stream)
+        assert [p.text for p in document.paragraphs] == [
+            'Title', 'a\tb bold', '', '', 'end'
+        ]
+        assert document.paragraphs[0].style.name == 'Heading 1'
+        table = document.tables[0]
+        assert table.style.name == 'Table Grid'
+        assert list(table.iter_rows_text()) == [['x', '1'], ['y', '2']]
+        shapes = document.inline_shapes
+        assert len(shapes) == 2
+        assert shapes[0].width == Inches(1)
+        assert [s._inline.docPr.id for s in shapes] == [1, 2]
+        assert len(document.part.package.image_parts) == 1
+        assert document.element.body[-1].tag == qn('w:sectPr')
+
+    def it_starts_a_new_table_after_end_table(self):
+        stream = BytesIO()
+        with DocumentWriter(None, stream) as writer:
+            writer.write_table_row(['a'])
+            writer.end_table()
+            writer.write_table_row(['b', 'c'])
+
+        tables = Document(stream).tables
+        assert [list(t.iter_rows_text()) for t in tables] == [[['a']], [['b', 'c']]]
+
+    @pytest.mark.parametrize('values', [['c'], ['c', 'd', 'e']])
+    def it_raises_on_a_row_not_matching_the_table(self, values):
+        stream = BytesIO()
+        with DocumentWriter(None, stream) as writer:
+            writer.write_table_row(['a', 'b'])
+            with pytest.raises(ValueError):
+                writer.write_table_row(values)
+            writer.write_table_row(['x', 'y'])
+
+        table = Document(stream).tables[0]
+        assert list(table.iter_rows_text()) == [['a', 'b'], ['x', 'y']]
+
+    def it_leaves_no_document_behind_when_the_with_block_raises(self, tmpdir):
+        path, stream = str(tmpdir.join('out.docx')), BytesIO()
+        for target in (path, stream):
+            with pytest.raises(RuntimeError):
+                with DocumentWriter(None, target) as writer:
+                    writer.write_paragraph('partial')
+                    raise RuntimeError
+
+        assert tmpdir.listdir() == []
+        assert not is_zipfile(stream)
@@ -7,13 +7,14 @@ from __future__ import absolute_import, print_function, unicode_literals
 import pytest
 
 from docx.enum.style import WD_STYLE_TYPE
+from docx.exceptions import InvalidSpanError
 from docx.enum.table import (
     WD_ALIGN_VERTICAL, WD_ROW_HEIGHT, WD_TABLE_ALIGNMENT, WD_TABLE_DIRECTION
 )
 from docx.oxml import parse_xml
-from docx.oxml.table import CT_Tc
+from docx.oxml.table import CT_Tbl, CT_Tc
 from docx.parts.document import DocumentPart
-from docx.shared import Inches
+from docx.shared import Inches, RGBColor
 from docx.table import _Cell, _Column, _Columns, _Row, _Rows, Table
 from docx.text.paragraph import Paragraph
 
@@ -51,6 +52,112 @@ class DescribeTable(object):
                 tc = tr.tc_lst[col_idx]
                 assert tc is cell._tc
 
+    def it_can_merge_many_ranges_at_once(self):
+        ranges = [(0, 0, 1, 1), (0, 3, 2, 3), (2, 0, 2, 1), (2, 0, 3, 1)]
+        table = Table(CT_Tbl.new_tbl(4, 4, Inches(4)), None)
+        one_at_a_time = Table(CT_Tbl.new_tbl(4, 4, Inches(4)), None)
+        for tbl in (table._tbl, one_at_a_time._tbl):
+            for idx, tc in enumerate(tbl.iter_tcs()):
+                tc.p_lst[0].add_r().text = str(idx)
+
+        cells = table.merge_ranges(ranges)
+        for row_0, col_0, row_1, col_1 in ranges:
+            one_at_a_time.cell(row_0, col_0).merge(one_at_a_time.cell(row_1, col_1))
+
+        assert table._tbl.xml == one_at_a_time._tbl.xml
+        assert [cell._tc for cell in cells] == [
+            table.cell(0, 0)._tc, table.cell(0, 3)._tc,
+            table.cell(2, 0)._tc, table.cell(2, 0)._tc,
+        ]
+
+    def it_merges_no_range_when_one_is_not_rectangular(self):
+        table = Table(CT_Tbl.new_tbl(3, 3, Inches(3)), None)
+        table.cell(0, 0).merge(table.cell(1, 1))
+        table.cell(2, 1).merge(table.cell(2, 2))
+        expected_xml = table._tbl.xml
+
+        with pytest.raises(InvalidSpanError):
+            table.merge_ranges([(1, 2, 2, 2), (0, 2, 2, 2)])
+
+        assert table._tbl.xml == expected_xml
+
+    def it_can_format_a_range_of_cells(self):
+        table = Table(element(
+            'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol,w:gridCol),'
+            'w:tr/(w:tc/w:tcPr/w:gridSpan{w:val=2},w:tc),'
+            'w:tr/(w:tc,w:tc/w:tcPr/w:vAlign{w:val=top},w:tc))'
+        ), None)
+
+        table.format_range(
+            cols=[1, 2], vertical_alignment=WD_ALIGN_VERTICAL.BOTTOM,
+            shading=RGBColor(0xEE, 0xEE, 0xEE), borders={'bottom': 'double'},
+        )
+
+        expected_tcPr = (
+            'w:tcPr/(w:tcBorders/w:bottom{w:val=double,w:sz=4,w:space=0},'
+            'w:shd{w:val=clear,w:fill=EEEEEE},w:vAlign{w:val=bottom})'
+        )
+        assert table._tbl.xml == xml(
+            'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol,w:gridCol),'
+            'w:tr/(w:tc/w:tcPr/w:gridSpan{w:val=2},w:tc/%s),'
+            'w:tr/(w:tc,w:tc/%s,w:tc/%s))' % ((expected_tcPr,) * 3)
+        )
+
+    def it_can_set_its_column_widths(self):
+        table = Table(element(
+            'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),'
+            'w:tr/w:tc/w:tcPr/w:gridSpan{w:val=2},w:tr/(w:tc,w:tc))'
+        ), None)
+
+        table.set_column_widths([Inches(1), Inches(2)])
+
+        assert table._tbl.xml == xml(
+            'w:tbl/(w:tblGrid/(w:gridCol{w:w=1440},w:gridCol{w:w=2880}),'
+            'w:tr/w:tc/w:tcPr/(w:tcW{w:type=dxa,w:w=4320},w:gridSpan{w:val=2}),'
+            'w:tr/(w:tc/w:tcPr/w:tcW{w:type=dxa,w:w=1440},'
+            'w:tc/w:tcPr/w:tcW{w:type=dxa,w:w=2880}))'
+        )
+        with pytest.raises(ValueError):
+            table.set_column_widths([Inches(1)])
+
+    def it_can_read_the_text_of_its_rows(self, text_table):
+        rows = list(text_table.iter_rows_text())
+
+        assert rows == [
+            ['a', 'b', 'b'],
+            ['c\nd', 'e', 'f'],
+            ['c\nd', '', ''],
+        ]
+
+    def it_gives_each_row_text_one_item_for_each_grid_column(self):
+        table = Table(element(
+            'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),'
+            'w:tr/(w:tc/w:p/w:r/w:t"a",w:tc/w:p/w:r/w:t"b",w:tc/w:p/w:r/w:t"c"),'
+            'w:tr/w:tc/w:p/(w:r/w:t"d",w:hyperlink/w:r/w:t"e"))'
+        ), None)
+
+        rows = list(table.iter_rows_text())
+
+        assert rows == [['a', 'b'], ['de', '']]
+        assert table.to_records() == [{'a': 'de', 'b': ''}]
+
+    def it_can_read_its_rows_as_records(self, text_table):
+        assert text_table.to_records() == [
+            {'a': 'c\nd', 'b': 'f'}, {'a': 'c\nd', 'b': ''}
+        ]
+
+    def it_can_read_its_text_into_a_numpy_array(self, text_table):
+        pytest.importorskip('numpy')
+        array = text_table.to_numpy()
+        assert array.shape == (3, 3)
+        assert array[2, 0] == 'c\nd'
+
+    def it_can_read_its_text_into_an_arrow_table(self, text_table):
+        pytest.importorskip('pyarrow')
+        arrow_table = text_table.to_arrow()
+        assert arrow_table.column_names == ['a', 'b', 'b']
+        assert arrow_table.column(1).to_pylist() == ['e', '']
+
     def it_provides_access_to_the_table_rows(self, table):
         rows = table.rows
         assert isinstance(rows, _Rows)
@@ -317,6 +424,17 @@ class DescribeTable(object):
             request, Table, 'part', return_value=document_part_
         )
 
+    @pytest.fixture
+    def text_table(self):
+        return Table(element(
+            'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol,w:gridCol),'
+            'w:tr/(w:tc/w:p/w:r/w:t"a",w:tc/(w:tcPr/w:gridSpan{w:val=2},'
+            '  w:p/w:r/w:t"b")),'
+            'w:tr/(w:tc/(w:tcPr/w:vMerge{w:val=restart},w:p/w:r/w:t"c",'
+            '  w:p/w:r/w:t"d"),w:tc/w:p/w:r/w:t"e",w:tc/w:p/w:r/w:t"f"),'
+            'w:tr/w:tc/(w:tcPr/w:vMerge,w:p))'
+        ), None)
+
     @pytest.fixture
     def table(self):
         tbl = _tbl_bldr(rows=2, cols=2).element
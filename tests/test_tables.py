@@ -0,0 +1,152 @@
+# encoding: utf-8
+
+"""Unit test suite for the docx.tables module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from datetime import date
+
+import pytest
+
+from docx.api import Document
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.shared import Inches, RGBColor
+from docx.tables import _cell_template, _new_tr, from_dataframe
+
+
+class Describe_from_dataframe(object):
+
+    def it_writes_a_dataframe_as_a_table(self):
+        pandas = pytest.importorskip('pandas')
+        document = Document()
+        df = pandas.DataFrame({
+            'item': ['apple', None, 'a\tb'],
+            'price': [1234.5, float('nan'), 2.0],
+            'date': pandas.to_datetime(['2020-01-31', '2021-02-01', None]),
+        })
+
+        table = from_dataframe(
+            document, df,
+            number_formats={'price': '{:,.2f}', 'date': '%d/%m/%Y'},
+            column_styles={'price': {'alignment': WD_ALIGN_PARAGRAPH.RIGHT}},
+        )
+
+        assert list(table.iter_rows_text()) == [
+            ['item', 'price', 'date'],
+            ['apple', '1,234.50', '31/01/2020'],
+            ['', '', '01/02/2021'],
+            ['a\tb', '2.00', ''],
+        ]
+        assert table.cell(1, 1).paragraphs[0].alignment == WD_ALIGN_PARAGRAPH.RIGHT
+        assert document.tables[0]._tbl is table._tbl
+
+    def it_writes_any_dataframe_like_object(self):
+        document = Document()
+        df = _DataFrame([
+            ('item', _Series(['apple', None, 'a\tb'])),
+            ('price', _Series([1234.5, float('nan'), 2.0], 'f')),
+            ('date', _Series([date(2020, 1, 31), date(2021, 2, 1), None], 'M')),
+            ('qty', _Series([1, 2, 3], 'i')),
+        ])
+
+        table = from_dataframe(
+            document, df,
+            number_formats={
+                'price': '{:,.2f}', 'date': '%d/%m/%Y', 'qty': lambda n: '#%d' % n
+            },
+            header=False,
+        )
+
+        assert list(table.iter_rows_text()) == [
+            ['apple', '1,234.50', '31/01/2020', '#1'],
+            ['', '', '01/02/2021', '#2'],
+            ['a\tb', '2.00', '', '#3'],
+        ]
+
+
+class Describe_new_tr(object):
+
+    def it_copies_a_row_of_cell_templates(self):
+        table = Document().add_table(0, 2)
+        row_template = OxmlElement('w:tr')
+        row_template.append(_cell_template(table, Inches(1), None))
+        row_template.append(_cell_template(table, Inches(1), {
+            'bold': True, 'shading': RGBColor(0xEE, 0xEE, 0xEE),
+            'alignment': WD_ALIGN_PARAGRAPH.RIGHT,
+        }))
+
+        tr = _new_tr(row_template, ['a\tb', ' 12 '])
+
+        tc_1, tc_2 = tr.tc_lst
+        assert tc_1.p_lst[0].r_lst[0].text == 'a\tb'
+        t = tc_2.p_lst[0].r_lst[0].t_lst[0]
+        assert t.text == ' 12 '
+        assert t.get(qn('xml:space')) == 'preserve'
+        assert tc_2.tcPr.shd_fill == RGBColor(0xEE, 0xEE, 0xEE)
+        assert tc_2.tcPr.width == Inches(1)
+        assert tc_2.p_lst[0].r_lst[0].rPr.b is not None
+        assert row_template.xpath('string(.)') == ''
+
+
+# fixture components ---------------------------------------------
+
+
+class _Series(object):
+    """The part of a pandas Series used by `from_dataframe()`, over a list."""
+
+    def __init__(self, values, kind='O'):
+        self._values = list(values)
+        self.dtype = _DType(kind)
+
+    def __getitem__(self, mask):
+        return _Series(
+            [value for value, keep in zip(self._values, mask._values) if keep],
+            self.dtype.kind,
+        )
+
+    def all(self):
+        return all(self._values)
+
+    def astype(self, type_):
+        return self.map(type_)
+
+    @property
+    def dt(self):
+        return self
+
+    def map(self, func):
+        return _Series([func(value) for value in self._values])
+
+    def notna(self):
+        return _Series(
+            [value is not None and value == value for value in self._values], 'b'
+        )
+
+    def strftime(self, format):
+        return self.map(lambda value: value.strftime(format))
+
+    def tolist(self):
+        return list(self._values)
+
+
+class _DType(object):
+    def __init__(self, kind):
+        self.kind = kind
+
+
+class _DataFrame(object):
+    """The part of a pandas DataFrame used by `from_dataframe()`.
+
+    *columns* is a sequence of (name, series) pairs.
+    """
+
+    def __init__(self, columns):
+        self.columns = [name for name, _ in columns]
+        self._series = [series for _, series in columns]
+        self.iloc = self
+
+    def __getitem__(self, key):
+        rows, idx = key
+        return self._series[idx]
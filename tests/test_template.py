@@ -0,0 +1,131 @@
+# encoding: utf-8
+
+"""Unit test suite for the docx.template module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import pytest
+
+import docx
+
+from docx.document import Document
+from docx.template import _normalize_placeholders, Template
+
+from .unitutil.cxml import element, xml
+from .unitutil.file import test_file
+from .unitutil.mock import instance_mock
+
+
+class DescribeTemplate(object):
+
+    def it_knows_the_fields_it_uses(self, document_):
+        document_.element = element(
+            'w:document/w:body/(w:p/w:r/w:t"{{foo}} {{bar.baz}}",w:p/w:r/w:t"x",'
+            'w:tbl/w:tr/w:tc/w:p/w:r/w:t"{{#rows}}{{qux}}")'
+        )
+        template = Template(document_)
+        assert template.fields == ['#rows', 'bar.baz', 'foo', 'qux']
+
+    def it_fills_the_placeholders_from_a_record(self, document_):
+        body = element(
+            'w:body/(w:p/w:r/w:t"Dear {{name}},",w:p/w:r/w:t"static",w:sectPr)'
+        )
+        document_.element.body = body
+        template = Template(document_)
+        static_p = body[1]
+
+        template.render({'name': 'Foo'})
+        template.render({'name': 'Bar'})
+
+        assert body.xml == xml(
+            'w:body/(w:p/w:r/(w:t{xml:space=preserve}"Dear ",'
+            'w:t{xml:space=preserve}"Bar",w:t{xml:space=preserve}","),'
+            'w:p/w:r/w:t"static",w:sectPr)'
+        )
+        assert body[1] is static_p
+        document_.part.section_map.invalidate.assert_called_with()
+
+    def it_repeats_a_marked_table_row_for_each_item(self, document_):
+        body = element(
+            'w:body/w:tbl/(w:tr/w:tc/w:p/w:r/w:t"Head",'
+            'w:tr/w:tc/w:p/w:r/w:t"{{#items}}{{sku}} {{order.id}}")'
+        )
+        document_.element.body = body
+        template = Template(document_)
+
+        template.render({'order': {'id': 7}, 'items': [{'sku': 'A'}, {'sku': 'B'}]})
+
+        assert [t.text for t in body.iter('{*}t')] == [
+            'Head', 'A', ' ', '7', 'B', ' ', '7'
+        ]
+
+    def it_keeps_the_shape_index_of_the_document_current(self):
+        document = docx.Document()
+        document.add_picture(test_file('monty-truth.png'))
+        table = document.add_table(rows=1, cols=1)
+        run = table.cell(0, 0).paragraphs[0].add_run('{{#items}}{{sku}}')
+        run.add_picture(test_file('python-icon.png'))
+        document.add_picture(test_file('monty-truth.png'))
+        template = Template(document)
+        assert len(document.inline_shapes) == 3
+
+        template.render({'items': []})
+
+        assert len(document.inline_shapes) == 2
+        assert len(document.sections) == 1
+
+    def it_raises_on_a_missing_field(self, document_):
+        document_.element.body = element('w:body/w:p/w:r/w:t"{{foo}}"')
+        template = Template(document_)
+        with pytest.raises(KeyError):
+            template.render({'bar': 42})
+
+    @pytest.mark.parametrize('field', ['items', 'keys', '#values', 'foo.count'])
+    def it_raises_on_a_missing_field_named_like_a_method(self, field, document_):
+        document_.element.body = element(
+            'w:body/w:tbl/w:tr/w:tc/w:p/w:r/w:t"{{%s}}"' % field
+        )
+        template = Template(document_)
+        with pytest.raises(KeyError):
+            template.render({'foo': ['a', 'b']})
+
+    def it_raises_on_a_repeat_marker_outside_a_table_row(self, document_):
+        document_.element.body = element('w:body/w:p/w:r/w:t"{{#foo}}"')
+        with pytest.raises(ValueError):
+            Template(document_)
+
+    # fixture components ---------------------------------------------
+
+    @pytest.fixture
+    def document_(self, request):
+        return instance_mock(request, Document)
+
+
+class Describe_normalize_placeholders(object):
+
+    def it_gives_each_placeholder_a_text_element_of_its_own(self, fixture):
+        p_cxml, expected_names, expected_cxml = fixture
+        p = element(p_cxml)
+
+        slots = _normalize_placeholders(p)
+
+        assert [name for name, _ in slots] == expected_names
+        assert [t.text for _, t in slots] == [
+            '{{%s}}' % name for name in expected_names
+        ]
+        assert p.xml == xml(expected_cxml)
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ('w:p/w:r/w:t"no fields"', [], 'w:p/w:r/w:t"no fields"'),
+        ('w:p/w:r/w:t"{{foo}}"', ['foo'], 'w:p/w:r/w:t{xml:space=preserve}"{{foo}}"'),
+        ('w:p/(w:r/w:t"a {{fo",w:r/(w:rPr/w:b,w:t"o}} b"))', ['foo'],
+         'w:p/(w:r/(w:t{xml:space=preserve}"a ",w:t{xml:space=preserve}"{{foo}}"),'
+         'w:r/(w:rPr/w:b,w:t{xml:space=preserve}" b"))'),
+        ('w:p/(w:r/w:t"{",w:r/w:t"{x",w:r/w:t"}",w:r/w:t"}{{y}}")', ['x', 'y'],
+         'w:p/(w:r/w:t{xml:space=preserve}"{{x}}",w:r,w:r,'
+         'w:r/w:t{xml:space=preserve}"{{y}}")'),
+    ])
+    def fixture(self, request):
+        return request.param
@@ -10,7 +10,7 @@ from __future__ import (
 
 from docx.dml.color import ColorFormat
 from docx.enum.text import WD_COLOR, WD_UNDERLINE
-from docx.shared import Pt
+from docx.shared import Pt, RGBColor
 from docx.text.font import Font
 
 import pytest
@@ -90,8 +90,62 @@ class DescribeFont(object):
         font.highlight_color = highlight_color
         assert font._element.xml == expected_xml
 
+    def it_can_read_its_properties_as_a_dict(self, to_dict_fixture):
+        font, expected_value = to_dict_fixture
+        assert font.to_dict() == expected_value
+
+    def it_can_update_several_properties_at_once(self, update_fixture):
+        font, properties, expected_xml = update_fixture
+        font.update(**properties)
+        assert font._element.xml == expected_xml
+
+    def it_can_build_a_spec_to_apply_to_many_fonts(self):
+        fonts = [Font(element(cxml)) for cxml in ('w:r', 'w:r/w:rPr/w:i')]
+        spec = Font.spec(bold=True, size=Pt(9))
+
+        spec.apply(*fonts)
+
+        assert [font._element.xml for font in fonts] == [
+            xml('w:r/w:rPr/(w:b,w:sz{w:val=18})'),
+            xml('w:r/w:rPr/(w:b,w:i,w:sz{w:val=18})'),
+        ]
+
     # fixtures -------------------------------------------------------
 
+    @pytest.fixture(params=[
+        ('w:r', {}),
+        ('w:r/w:rPr', {}),
+        ('w:r/w:rPr/(w:b,w:i{w:val=0},w:sz{w:val=24})',
+         {'bold': True, 'italic': False, 'size': Pt(12)}),
+        ('w:r/w:rPr/(w:rFonts{w:hAnsi=Foo},w:color{w:val=auto})', {}),
+        ('w:r/w:rPr/(w:rFonts{w:ascii=Foo},w:color{w:val=3C2F80})',
+         {'name': 'Foo', 'color': RGBColor(0x3C, 0x2F, 0x80)}),
+        ('w:r/w:rPr/(w:highlight{w:val=yellow},w:u{w:val=double})',
+         {'highlight_color': WD_COLOR.YELLOW, 'underline': WD_UNDERLINE.DOUBLE}),
+        ('w:r/w:rPr/w:vertAlign{w:val=superscript}',
+         {'subscript': False, 'superscript': True}),
+    ])
+    def to_dict_fixture(self, request):
+        r_cxml, expected_value = request.param
+        return Font(element(r_cxml)), expected_value
+
+    @pytest.fixture(params=[
+        ('w:r', {'size': Pt(9), 'bold': True},
+         'w:r/w:rPr/(w:b,w:sz{w:val=18})'),
+        ('w:r/w:rPr/(w:i,w:sz{w:val=18},w:lang)', {'italic': None, 'strike': True},
+         'w:r/w:rPr/(w:strike,w:sz{w:val=18},w:lang)'),
+        ('w:r/w:rPr/w:rFonts{w:ascii=Foo,w:eastAsia=Baz}', {'name': 'Bar'},
+         'w:r/w:rPr/w:rFonts{w:ascii=Bar,w:eastAsia=Baz,w:hAnsi=Bar}'),
+        ('w:r/w:rPr/w:vertAlign{w:val=subscript}', {'superscript': False},
+         'w:r/w:rPr/w:vertAlign{w:val=subscript}'),
+        ('w:r/w:rPr/w:color{w:val=000000}',
+         {'color': RGBColor(0x3C, 0x2F, 0x80), 'underline': True},
+         'w:r/w:rPr/(w:color{w:val=3C2F80},w:u{w:val=single})'),
+    ])
+    def update_fixture(self, request):
+        r_cxml, properties, expected_cxml = request.param
+        return Font(element(r_cxml)), properties, xml(expected_cxml)
+
     @pytest.fixture(params=[
         ('w:r/w:rPr',                          'all_caps',       None),
         ('w:r/w:rPr/w:caps',                   'all_caps',       True),
@@ -110,8 +110,48 @@ class DescribeParagraphFormat(object):
         TabStops_.assert_called_once_with(pPr)
         assert tab_stops is tab_stops_
 
+    def it_can_read_its_properties_as_a_dict(self, to_dict_fixture):
+        paragraph_format, expected_value = to_dict_fixture
+        assert paragraph_format.to_dict() == expected_value
+
+    def it_can_update_several_properties_at_once(self, update_fixture):
+        paragraph_format, properties, expected_xml = update_fixture
+        paragraph_format.update(**properties)
+        assert paragraph_format._element.xml == expected_xml
+
     # fixtures -------------------------------------------------------
 
+    @pytest.fixture(params=[
+        ('w:p', {}),
+        ('w:p/w:pPr/(w:keepNext,w:jc{w:val=right})',
+         {'keep_with_next': True, 'alignment': WD_ALIGN_PARAGRAPH.RIGHT}),
+        ('w:p/w:pPr/w:ind{w:left=1440,w:hanging=720}',
+         {'left_indent': Pt(72), 'first_line_indent': Pt(-36)}),
+        ('w:p/w:pPr/w:spacing{w:after=240,w:line=360}',
+         {'space_after': Pt(12), 'line_spacing': 1.5,
+          'line_spacing_rule': WD_LINE_SPACING.ONE_POINT_FIVE}),
+        ('w:p/w:pPr/w:spacing{w:line=280,w:lineRule=exact}',
+         {'line_spacing': Pt(14), 'line_spacing_rule': WD_LINE_SPACING.EXACTLY}),
+    ])
+    def to_dict_fixture(self, request):
+        p_cxml, expected_value = request.param
+        return ParagraphFormat(element(p_cxml)), expected_value
+
+    @pytest.fixture(params=[
+        ('w:p', {'alignment': WD_ALIGN_PARAGRAPH.CENTER, 'keep_together': True},
+         'w:p/w:pPr/(w:keepLines,w:jc{w:val=center})'),
+        ('w:p/w:pPr/(w:pStyle{w:val=Foo},w:ind{w:left=1440},w:rPr)',
+         {'first_line_indent': Pt(-36), 'space_before': Pt(6)},
+         'w:p/w:pPr/(w:pStyle{w:val=Foo},w:spacing{w:before=120},'
+         'w:ind{w:left=1440,w:hanging=720},w:rPr)'),
+        ('w:p/w:pPr/(w:spacing{w:after=240},w:jc{w:val=left})',
+         {'line_spacing': Pt(14), 'alignment': None},
+         'w:p/w:pPr/w:spacing{w:after=240,w:line=280,w:lineRule=exact}'),
+    ])
+    def update_fixture(self, request):
+        p_cxml, properties, expected_cxml = request.param
+        return ParagraphFormat(element(p_cxml)), properties, xml(expected_cxml)
+
     @pytest.fixture(params=[
         ('w:p',                          None),
         ('w:p/w:pPr',                    None),
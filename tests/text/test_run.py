@@ -265,6 +265,8 @@ class DescribeRun(object):
         ('abc\tdef', 'w:r/(w:t"abc", w:tab, w:t"def")'),
         ('abc\ndef', 'w:r/(w:t"abc", w:br,  w:t"def")'),
         ('abc\rdef', 'w:r/(w:t"abc", w:br,  w:t"def")'),
+        ('\tabc \r\n', 'w:r/(w:tab, w:t{xml:space=preserve}"abc ", w:br, w:br)'),
+        ('\t\t', 'w:r/(w:tab, w:tab)'),
     ])
     def text_set_fixture(self, request):
         new_text, expected_cxml = request.param